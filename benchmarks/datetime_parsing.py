@@ -0,0 +1,71 @@
+"""
+Measures the cost of converting OData datetime literals (see ODataType.try_parse_datetime)
+compared to trying strptime formats one by one, which is how values used to be parsed.
+
+Usage (the package has to be installed or be on PYTHONPATH):
+    python benchmarks/datetime_parsing.py [--number 100000] [--repeat 5]
+"""
+
+import argparse
+import datetime
+import timeit
+
+from office365.runtime.odata.type import ODataType
+
+LITERALS = [
+    "2023-01-02T03:04:05Z",
+    "2023-01-02T03:04:05.123Z",
+    "2023-01-02T03:04:05.1234567Z",
+    "2023-01-02T03:04:05",
+    "2023-01-02T03:04:05+02:00",
+    "/Date(1672628645000)/",
+]
+
+_KNOWN_FORMATS = [
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%dT%H:%M:%S.%fZ",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%f",
+]
+
+
+def parse_via_strptime(value):
+    """Reference implementation, values which match none of the formats are not parsed"""
+    for cur_format in _KNOWN_FORMATS:
+        try:
+            return datetime.datetime.strptime(value, cur_format)
+        except ValueError:
+            pass
+    return None
+
+
+def measure(func, value, number, repeat):
+    """Returns the best per-value cost of repeated runs, in microseconds"""
+    timings = timeit.repeat(lambda: func(value), number=number, repeat=repeat)
+    return min(timings) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print("{0:<30} {1:>10} {2:>10}".format("literal", "strptime", "parser"))
+    for value in LITERALS:
+        reference = "{0:8.2f}us".format(
+            measure(parse_via_strptime, value, args.number, args.repeat)
+        )
+        if parse_via_strptime(value) is None:
+            reference = "unparsed"
+        print(
+            "{0:<30} {1:>10} {2:8.2f}us".format(
+                value,
+                reference,
+                measure(ODataType.try_parse_datetime, value, args.number, args.repeat),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
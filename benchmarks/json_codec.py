@@ -0,0 +1,125 @@
+"""
+Measures decoding throughput of the JSON codecs available in the environment (see JsonCodec),
+along with the peak memory used to process a collection response incrementally (see JsonStreamReader)
+compared to loading the whole document at once.
+
+The payload is generated (with a fixed seed) in the verbose OData format returned by SharePoint,
+optional codecs (orjson, ujson) are skipped if not installed.
+
+Usage (the package has to be installed or be on PYTHONPATH):
+    python benchmarks/json_codec.py [--items 50000] [--repeat 5] [--chunk-size 65536]
+"""
+
+import argparse
+import gc
+import json
+import random
+import time
+import tracemalloc
+
+from office365.runtime.http.json_codec import JsonCodec, OrjsonCodec, UjsonCodec
+from office365.runtime.odata.json_stream import JsonStreamReader
+
+
+def build_payload(items):
+    # type: (int) -> bytes
+    """Builds a SharePoint (verbose) list items response"""
+    rnd = random.Random(0)
+    results = [
+        {
+            "__metadata": {
+                "id": "Web/Lists(guid'a')/Items({0})".format(i),
+                "type": "SP.Data.DocumentsItem",
+            },
+            "Id": i,
+            "Title": "Document {0} été".format(i),
+            "Modified": "2024-01-{0:02d}T10:{1:02d}:00Z".format(i % 28 + 1, i % 60),
+            "FileSizeDisplay": rnd.randint(1, 10**9),
+            "Score": rnd.random(),
+            "IsCheckedOut": bool(i % 2),
+            "Tags": {
+                "results": ["tag{0}".format(rnd.randint(0, 99)) for _ in range(3)]
+            },
+        }
+        for i in range(items)
+    ]
+    return json.dumps({"d": {"results": results}}).encode("utf-8")
+
+
+def create_codecs():
+    codecs = [JsonCodec()]
+    for codec_type in (OrjsonCodec, UjsonCodec):
+        try:
+            codecs.append(codec_type())
+        except ImportError:
+            print("{0}: not installed, skipped".format(codec_type.name))
+    return codecs
+
+
+def measure_time(func, repeat):
+    """Returns the best of repeated runs, in seconds"""
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def measure_peak_memory(func):
+    """Returns the peak size of memory blocks allocated while running func, in bytes"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def load_all(codec, payload):
+    return sum(1 for _ in codec.loads(payload)["d"]["results"])
+
+
+def load_streamed(payload, chunk_size):
+    chunks = (
+        payload[pos : pos + chunk_size] for pos in range(0, len(payload), chunk_size)
+    )
+    return sum(1 for _ in JsonStreamReader(chunks).iter_items("results", ["d"]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--chunk-size", type=int, default=64 * 1024)
+    args = parser.parse_args()
+
+    payload = build_payload(args.items)
+    size_mb = len(payload) / 1024.0 / 1024.0
+    print("payload: {0} items, {1:.1f} MiB".format(args.items, size_mb))
+
+    print("\ndecode throughput (best of {0}):".format(args.repeat))
+    for codec in create_codecs():
+        elapsed = measure_time(lambda c=codec: c.loads(payload), args.repeat)
+        print(
+            "  {0:<8} {1:8.1f} ms {2:8.1f} MiB/s".format(
+                codec.name, elapsed * 1000, size_mb / elapsed
+            )
+        )
+
+    print("\npeak memory, excluding the payload itself:")
+    for name, func in (
+        ("full load (json)", lambda: load_all(JsonCodec(), payload)),
+        ("streamed", lambda: load_streamed(payload, args.chunk_size)),
+    ):
+        print(
+            "  {0:<17} {1:8.1f} MiB".format(
+                name, measure_peak_memory(func) / 1024.0 / 1024.0
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
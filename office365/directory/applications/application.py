@@ -85,7 +85,9 @@ class Application(DirectoryObject):
         :param str display_name: App display name
         """
         params = PasswordCredential(display_name=display_name)
-        result = ClientResult(self.context, params)
+        result = ClientResult(
+            self.context, PasswordCredential(display_name=display_name)
+        )
         qry = ServiceOperationQuery(self, "addPassword", None, params, None, result)
         self.context.add_query(qry)
         return result
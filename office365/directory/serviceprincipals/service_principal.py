@@ -63,7 +63,9 @@ class ServicePrincipal(DirectoryObject):
         :param str display_name: App display name
         """
         params = PasswordCredential(display_name=display_name)
-        return_type = ClientResult(self.context, params)
+        return_type = ClientResult(
+            self.context, PasswordCredential(display_name=display_name)
+        )
         qry = ServiceOperationQuery(
             self, "addPassword", None, params, None, return_type
         )
@@ -1,5 +1,7 @@
 from typing import Any, Callable, List, Optional
 
+from typing_extensions import Self
+
 from office365.booking.solutions.root import SolutionsRoot
 from office365.communications.cloud_communications import CloudCommunications
 from office365.delta_collection import DeltaCollection
@@ -55,7 +57,9 @@ from office365.outlook.calendar.place import Place
 from office365.outlook.calendar.rooms.list import RoomList
 from office365.planner.planner import Planner
 from office365.reports.root import ReportRoot
+from office365.runtime.auth.token_cache import TokenCache
 from office365.runtime.auth.token_response import TokenResponse
+from office365.runtime.auth.token_store import TokenStore, build_cache_key
 from office365.runtime.client_runtime_context import ClientRuntimeContext
 from office365.runtime.http.http_method import HttpMethod
 from office365.runtime.http.request_options import RequestOptions
@@ -77,11 +81,22 @@ from office365.teams.viva.employee_experience import EmployeeExperience
 class GraphClient(ClientRuntimeContext):
     """Graph Service client"""
 
-    def __init__(self, acquire_token_callback):
-        # type: (Callable[[], dict]) -> None
+    def __init__(self, acquire_token_callback, cache_key=None):
+        # type: (Callable[[], dict], Optional[str]) -> None
+        """
+        :param () -> dict acquire_token_callback: Acquires a token
+        :param str or None cache_key: Identifies the token in a token store (see with_token_store)
+        """
         super(GraphClient, self).__init__()
         self._pending_request = None
+        self._batch_request = None
         self._acquire_token_callback = acquire_token_callback
+        self._token_cache = TokenCache(
+            lambda: TokenResponse.from_json(self._acquire_token_callback()),
+            key=cache_key,
+            to_json=TokenResponse.to_json,
+            from_json=TokenResponse.from_json,
+        )  # type: TokenCache[TokenResponse]
 
     @staticmethod
     def with_certificate(
@@ -118,7 +133,10 @@ class GraphClient(ClientRuntimeContext):
         def _acquire_token():
             return app.acquire_token_for_client(scopes=scopes)
 
-        return GraphClient(_acquire_token)
+        return GraphClient(
+            _acquire_token,
+            build_cache_key("certificate", tenant, " ".join(scopes), client_id),
+        )
 
     @staticmethod
     def with_client_secret(
@@ -150,7 +168,10 @@ class GraphClient(ClientRuntimeContext):
         def _acquire_token():
             return app.acquire_token_for_client(scopes=scopes)
 
-        return GraphClient(_acquire_token)
+        return GraphClient(
+            _acquire_token,
+            build_cache_key("client_secret", tenant, " ".join(scopes), client_id),
+        )
 
     @staticmethod
     def with_token_interactive(tenant, client_id, username=None, scopes=None):
@@ -189,7 +210,12 @@ class GraphClient(ClientRuntimeContext):
                 )
             return result
 
-        return GraphClient(_acquire_token)
+        return GraphClient(
+            _acquire_token,
+            build_cache_key(
+                "interactive", tenant, " ".join(scopes), client_id, username
+            ),
+        )
 
     @staticmethod
     def with_username_and_password(tenant, client_id, username, password, scopes=None):
@@ -227,7 +253,27 @@ class GraphClient(ClientRuntimeContext):
                 )
             return result
 
-        return GraphClient(_acquire_token)
+        return GraphClient(
+            _acquire_token,
+            build_cache_key(
+                "username_password", tenant, " ".join(scopes), client_id, username
+            ),
+        )
+
+    def with_token_store(self, store, cache_key=None):
+        # type: (TokenStore, Optional[str]) -> Self
+        """
+        Persists the access token in a store shared between processes,
+        a valid one is reused instead of being acquired by every process
+
+        :param TokenStore store: Token store, e.g. FileTokenStore
+        :param str or None cache_key: Identifies the token in the store, for clients initialized
+            with a custom callback it has to be specified, since the token is not persisted otherwise
+        """
+        if cache_key is not None:
+            self._token_cache.key = cache_key
+        self._token_cache.with_store(store)
+        return self
 
     def execute_batch(self, items_per_batch=20, success_callback=None):
         """Constructs and submit a batch request
@@ -237,8 +283,7 @@ class GraphClient(ClientRuntimeContext):
         :param int items_per_batch: Maximum to be selected for bulk operation
         :param (List[ClientObject|ClientResult])-> None success_callback: A success callback
         """
-        batch_request = ODataV4BatchRequest(V4JsonFormat())
-        batch_request.beforeExecute += self._authenticate_request
+        batch_request = self.batch_request()
         while self.has_pending_request:
             qry = self._get_next_query(items_per_batch)
             batch_request.execute_query(qry)
@@ -246,10 +291,29 @@ class GraphClient(ClientRuntimeContext):
                 success_callback(qry.return_type)
         return self
 
+    def with_auto_batch(self, items_per_batch=20):
+        # type: (int) -> Self
+        """
+        Enables transparent batching mode: execute_query coalesces independent pending queries into
+        JSON batch requests
+
+        Per Batch size limitations: JSON batch requests are currently limited to 20 individual requests.
+
+        :param int items_per_batch: Maximum number of queries per batch request, 0 disables batching
+        """
+        return super(GraphClient, self).with_auto_batch(min(items_per_batch, 20))
+
+    def batch_request(self):
+        # type: () -> ODataV4BatchRequest
+        if self._batch_request is None:
+            self._batch_request = ODataV4BatchRequest(V4JsonFormat(), self.transport)
+            self._batch_request.beforeExecute += self._authenticate_request
+        return self._batch_request
+
     def pending_request(self):
         # type: () -> GraphRequest
         if self._pending_request is None:
-            self._pending_request = GraphRequest()
+            self._pending_request = GraphRequest(transport=self.transport)
             self._pending_request.beforeExecute += self._authenticate_request
             self._pending_request.beforeExecute += self._build_specific_query
         return self._pending_request
@@ -269,8 +333,7 @@ class GraphClient(ClientRuntimeContext):
     def _authenticate_request(self, request):
         # type: (RequestOptions) -> None
         """Authenticate request."""
-        token_json = self._acquire_token_callback()
-        token = TokenResponse.from_json(token_json)
+        token = self._token_cache.get()
         request.ensure_header("Authorization", "Bearer {0}".format(token.accessToken))
 
     @property
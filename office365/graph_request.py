@@ -1,3 +1,6 @@
+from typing import Optional
+
+from office365.runtime.http.transport import HttpTransport
 from office365.runtime.odata.request import ODataRequest
 from office365.runtime.odata.v4.json_format import V4JsonFormat
 
@@ -18,9 +21,9 @@ environments_endpoints = {
 
 
 class GraphRequest(ODataRequest):
-    def __init__(self, version="v1.0", environment="GCCH"):
-        # type: (str, str) -> None
-        super(GraphRequest, self).__init__(V4JsonFormat())
+    def __init__(self, version="v1.0", environment="GCCH", transport=None):
+        # type: (str, str, Optional[HttpTransport]) -> None
+        super(GraphRequest, self).__init__(V4JsonFormat(), transport)
         self._version = version
         self._environment_endpoints = environments_endpoints.get(environment, None)
 
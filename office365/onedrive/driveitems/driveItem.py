@@ -250,7 +250,7 @@ class DriveItem(BaseItem):
             # type: (ClientResult[UploadSession]) -> None
             with open(source_path, "rb") as local_file:
                 session_request = UploadSessionRequest(
-                    local_file, chunk_size, chunk_uploaded
+                    local_file, chunk_size, chunk_uploaded, self.context.transport
                 )
                 session_request.execute_query(qry)
 
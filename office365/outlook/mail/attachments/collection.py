@@ -67,7 +67,7 @@ class AttachmentCollection(EntityCollection[Attachment]):
             # type: (ClientResult[UploadSession]) -> None
             with open(source_path, "rb") as local_file:
                 session_request = UploadSessionRequest(
-                    local_file, chunk_size, chunk_uploaded
+                    local_file, chunk_size, chunk_uploaded, self.context.transport
                 )
 
                 def _construct_request(request):
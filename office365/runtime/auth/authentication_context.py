@@ -1,13 +1,15 @@
 import json
 import sys
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
 from typing_extensions import Required, TypedDict
 
 from office365.runtime.auth.client_credential import ClientCredential
 from office365.runtime.auth.providers.acs_token_provider import ACSTokenProvider
 from office365.runtime.auth.providers.saml_token_provider import SamlTokenProvider
+from office365.runtime.auth.token_cache import TokenCache
 from office365.runtime.auth.token_response import TokenResponse
+from office365.runtime.auth.token_store import TokenStore, build_cache_key
 from office365.runtime.auth.user_credential import UserCredential
 from office365.runtime.compat import get_absolute_url
 from office365.runtime.http.request_options import RequestOptions
@@ -37,7 +39,35 @@ class AuthenticationContext(object):
         """
         self.url = url.rstrip("/")
         self._authenticate = None
-        self._cached_token = None
+        self._token_cache = None  # type: Optional[TokenCache]
+        self._token_store = None  # type: Optional[TokenStore]
+
+    def with_token_store(self, store):
+        # type: (TokenStore) -> "AuthenticationContext"
+        """
+        Persists tokens (or authentication cookies) in a store shared between processes, so that valid ones
+        are reused instead of being acquired by every process
+
+        :param TokenStore store: Token store, e.g. FileTokenStore
+        """
+        self._token_store = store
+        if self._token_cache is not None:
+            self._token_cache.with_store(store)
+        return self
+
+    @property
+    def identity(self):
+        # type: () -> Any
+        """Identifies the credentials requests are authenticated with, e.g. to share state bound to them"""
+        if self._token_cache is not None:
+            return self._token_cache.key or self._token_cache
+        return self._authenticate
+
+    def _set_token_cache(self, cache):
+        # type: (Optional[TokenCache]) -> None
+        self._token_cache = cache
+        if cache is not None:
+            cache.with_store(self._token_store)
 
     def with_client_certificate(
         self,
@@ -87,7 +117,10 @@ class AuthenticationContext(object):
             result = app.acquire_token_for_client(scopes)
             return TokenResponse.from_json(result)
 
-        self.with_access_token(_acquire_token)
+        self.with_access_token(
+            _acquire_token,
+            build_cache_key("certificate", tenant, " ".join(scopes), client_id),
+        )
         return self
 
     def with_interactive(self, tenant, client_id, scopes=None):
@@ -116,7 +149,10 @@ class AuthenticationContext(object):
             result = app.acquire_token_interactive(scopes=scopes)
             return TokenResponse.from_json(result)
 
-        self.with_access_token(_acquire_token)
+        self.with_access_token(
+            _acquire_token,
+            build_cache_key("interactive", tenant, " ".join(scopes), client_id),
+        )
         return self
 
     def with_device_flow(self, tenant, client_id, scopes=None):
@@ -152,22 +188,33 @@ class AuthenticationContext(object):
             result = app.acquire_token_by_device_flow(flow)
             return TokenResponse.from_json(result)
 
-        self.with_access_token(_acquire_token)
+        self.with_access_token(
+            _acquire_token,
+            build_cache_key("device_flow", tenant, " ".join(scopes), client_id),
+        )
         return self
 
-    def with_access_token(self, token_func):
-        # type: (Callable[[], JSONToken]) -> None
+    def with_access_token(self, token_func, cache_key=None):
+        # type: (Callable[[], JSONToken], Optional[str]) -> None
         """
         Initializes a client to acquire a token from a callback
 
         :param () -> dict token_func: A token callback
+        :param str or None cache_key: Identifies the token in the token store,
+            the token is not persisted if omitted
         """
+        self._set_token_cache(
+            TokenCache(
+                token_func,
+                key=cache_key,
+                to_json=TokenResponse.to_json,
+                from_json=TokenResponse.from_json,
+            )
+        )
 
         def _authenticate(request):
-            if self._cached_token is None:
-                self._cached_token = token_func()
             request.set_header(
-                "Authorization", _get_authorization_header(self._cached_token)
+                "Authorization", _get_authorization_header(self._token_cache.get())
             )
 
         self._authenticate = _authenticate
@@ -201,6 +248,7 @@ class AuthenticationContext(object):
                 )
         else:
             raise ValueError("Unknown credential type")
+        self._set_token_cache(getattr(provider, "token_cache", None))
 
         def _authenticate(request):
             provider.authenticate_request(request)
@@ -217,6 +265,7 @@ class AuthenticationContext(object):
         :param bool browser_mode:
         """
         provider = SamlTokenProvider(self.url, username, password, browser_mode)
+        self._set_token_cache(provider.token_cache)
 
         def _authenticate(request):
             provider.authenticate_request(request)
@@ -234,6 +283,7 @@ class AuthenticationContext(object):
         :param str client_secret: Secret string that the application uses to prove its identity when requesting a token
         """
         provider = ACSTokenProvider(self.url, client_id, client_secret)
+        self._set_token_cache(provider.token_cache)
 
         def _authenticate(request):
             provider.authenticate_request(request)
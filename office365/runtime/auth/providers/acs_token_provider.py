@@ -4,7 +4,9 @@ import requests
 
 import office365.logger
 from office365.runtime.auth.authentication_provider import AuthenticationProvider
+from office365.runtime.auth.token_cache import TokenCache
 from office365.runtime.auth.token_response import TokenResponse
+from office365.runtime.auth.token_store import build_cache_key
 from office365.runtime.compat import urlparse
 from office365.runtime.http.request_options import RequestOptions
 
@@ -26,8 +28,18 @@ class ACSTokenProvider(AuthenticationProvider, office365.logger.LoggerContext):
         self.SharePointPrincipal = "00000003-0000-0ff1-ce00-000000000000"
         self._client_id = client_id
         self._client_secret = client_secret
-        self._cached_token = None
         self._environment = environment
+        self._token_cache = TokenCache(
+            self.get_app_only_access_token,
+            key=build_cache_key("acs", urlparse(url).hostname, client_id),
+            to_json=TokenResponse.to_json,
+            from_json=TokenResponse.from_json,
+        )  # type: TokenCache[TokenResponse]
+
+    @property
+    def token_cache(self):
+        # type: () -> TokenCache[TokenResponse]
+        return self._token_cache
 
     def authenticate_request(self, request):
         # type: (RequestOptions) -> None
@@ -35,9 +47,8 @@ class ACSTokenProvider(AuthenticationProvider, office365.logger.LoggerContext):
         request.set_header("Authorization", self._get_authorization_header())
 
     def ensure_app_only_access_token(self):
-        if self._cached_token is None:
-            self._cached_token = self.get_app_only_access_token()
-        return self._cached_token and self._cached_token.is_valid
+        token = self._token_cache.get()
+        return token and token.is_valid
 
     def get_app_only_access_token(self):
         """Retrieves an app-only access token from ACS"""
@@ -118,7 +129,7 @@ class ACSTokenProvider(AuthenticationProvider, office365.logger.LoggerContext):
             )
 
     def _get_authorization_header(self):
-        return "Bearer {0}".format(self._cached_token.accessToken)
+        return "Bearer {0}".format(self._token_cache.get().accessToken)
 
     def get_last_error(self):
         return self.error
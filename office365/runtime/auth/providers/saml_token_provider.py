@@ -9,6 +9,8 @@ import requests.utils
 import office365.logger
 from office365.runtime.auth.authentication_provider import AuthenticationProvider
 from office365.runtime.auth.sts_profile import STSProfile
+from office365.runtime.auth.token_cache import TokenCache
+from office365.runtime.auth.token_store import build_cache_key
 from office365.runtime.auth.user_realm_info import UserRealmInfo
 
 office365.logger.ensure_debug_secrets()
@@ -60,7 +62,12 @@ class SamlTokenProvider(AuthenticationProvider, office365.logger.LoggerContext):
         self.error = ""
         self._username = username
         self._password = password
-        self._cached_auth_cookies = None
+        # SharePoint does not expose the lifetime of FedAuth/rtFa cookies, hence they are renewed periodically
+        self._auth_cookies_cache = TokenCache(
+            self.get_authentication_cookie,
+            expires_in_func=lambda cookies: None,
+            key=build_cache_key("saml", resolve_base_url(url), username),
+        )  # type: TokenCache[dict]
         self.__ns_prefixes = {
             "S": "{http://www.w3.org/2003/05/soap-envelope}",
             "s": "{http://www.w3.org/2003/05/soap-envelope}",
@@ -77,24 +84,25 @@ class SamlTokenProvider(AuthenticationProvider, office365.logger.LoggerContext):
         for key in self.__ns_prefixes.keys():
             ElementTree.register_namespace(key, self.__ns_prefixes[key][1:-1])
 
+    @property
+    def token_cache(self):
+        # type: () -> TokenCache[dict]
+        return self._auth_cookies_cache
+
     def authenticate_request(self, request):
         """
         Authenticate request handler
         """
         logger = self.logger(self.authenticate_request.__name__)
-        self.ensure_authentication_cookie()
-        logger.debug_secrets(self._cached_auth_cookies)
+        auth_cookies = self._auth_cookies_cache.get()
+        logger.debug_secrets(auth_cookies)
         cookie_header_value = "; ".join(
-            [
-                "=".join([key, str(val)])
-                for key, val in self._cached_auth_cookies.items()
-            ]
+            ["=".join([key, str(val)]) for key, val in auth_cookies.items()]
         )
         request.set_header("Cookie", cookie_header_value)
 
     def ensure_authentication_cookie(self):
-        if self._cached_auth_cookies is None:
-            self._cached_auth_cookies = self.get_authentication_cookie()
+        self._auth_cookies_cache.get()
         return True
 
     def get_authentication_cookie(self):
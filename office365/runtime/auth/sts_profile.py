@@ -16,13 +16,20 @@ class STSProfile(object):
         self.securityTokenServicePath = "extSTS.srf"
         self.userRealmServicePath = "GetUserRealm.srf"
         self.tokenIssuer = "urn:federation:MicrosoftOnline"
-        now = datetime.now(tz=timezone.utc)
-        self.created = now.astimezone(timezone.utc).isoformat("T")[:-9] + "Z"
-        self.expires = (now + timedelta(minutes=10)).astimezone(timezone.utc).isoformat(
-            "T"
-        )[:-9] + "Z"
         self.signInPage = "_forms/default.aspx?wa=wsignin1.0"
 
+    @property
+    def created(self):
+        """Creation time of the security token request, evaluated per request since tokens get renewed"""
+        return datetime.now(tz=timezone.utc).isoformat("T")[:-9] + "Z"
+
+    @property
+    def expires(self):
+        """Expiration time of the security token request"""
+        return (datetime.now(tz=timezone.utc) + timedelta(minutes=10)).isoformat("T")[
+            :-9
+        ] + "Z"
+
     @property
     def tenant(self):
         return urlparse(self.authorityUrl).netloc
@@ -0,0 +1,163 @@
+import threading
+import time
+from typing import Any, Callable, Generic, Optional, Tuple, TypeVar
+
+from typing_extensions import Self
+
+from office365.runtime.auth.token_store import TokenStore
+
+T = TypeVar("T")
+
+
+def resolve_expires_in(value):
+    # type: (Any) -> Optional[float]
+    """
+    Returns the number of seconds the token is valid for, as specified by the token response either via
+    expires_in (MSAL, OAuth) or expires_on (ACS) values
+    """
+    if isinstance(value, dict):
+        expires_in = value.get("expires_in", value.get("expiresIn", None))
+        expires_on = value.get("expires_on", value.get("expiresOn", None))
+    else:
+        expires_in = getattr(value, "expiresIn", None)
+        expires_on = getattr(value, "expiresOn", None)
+    try:
+        if expires_in is not None:
+            return float(expires_in)
+        if expires_on is not None:
+            return float(expires_on) - time.time()
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+class TokenCache(Generic[T]):
+    """
+    Thread-safe cache for an access token or authentication cookies.
+
+    The value is refreshed ahead of its expiry by a single caller while the others keep using the current
+    (still valid) value, once expired, callers wait for the one which acquires a new value.
+    """
+
+    def __init__(
+        self,
+        acquire_func,
+        refresh_margin=300,
+        default_lifetime=3600,
+        expires_in_func=resolve_expires_in,
+        key=None,
+        to_json=None,
+        from_json=None,
+    ):
+        # type: (Optional[Callable[[], T]], float, float, Callable[[T], Optional[float]], Optional[str], Optional[Callable[[T], Any]], Optional[Callable[[Any], T]]) -> None
+        """
+        :param () -> T acquire_func: Acquires a new value
+        :param float refresh_margin: Seconds before expiry when the value gets refreshed
+        :param float default_lifetime: Seconds the value is valid for, if its lifetime is not known
+        :param (T) -> float or None expires_in_func: Resolves the number of seconds the value is valid for
+        :param str or None key: Identifies the value in a persistent store (e.g. by tenant, resource and client id),
+            the value is never persisted if omitted
+        :param (T) -> Any to_json: Serializes the value before it gets persisted
+        :param (Any) -> T from_json: Restores the persisted value
+        """
+        self.refresh_margin = refresh_margin
+        self.default_lifetime = default_lifetime
+        self.key = key
+        self._acquire_func = acquire_func
+        self._expires_in_func = expires_in_func
+        self._to_json = to_json or (lambda v: v)
+        self._from_json = from_json or (lambda v: v)
+        self._store = None  # type: Optional[TokenStore]
+        self._entry = (None, 0.0)  # type: Tuple[Optional[T], float]
+        self._lock = threading.Lock()
+
+    def __deepcopy__(self, memo):
+        """Cache is shared, not copied, between cloned contexts"""
+        return self
+
+    @property
+    def value(self):
+        # type: () -> Optional[T]
+        """Returns the cached value (if any) without refreshing it"""
+        return self._entry[0]
+
+    @property
+    def expires_at(self):
+        # type: () -> float
+        """Expiry time of the cached value, in seconds since the epoch"""
+        return self._entry[1]
+
+    def get(self, acquire_func=None):
+        # type: (Optional[Callable[[], T]]) -> T
+        """
+        Returns a valid value, acquires a new one if needed
+
+        :param () -> T acquire_func: Overrides the function a new value is acquired with
+        """
+        value, expires_at = self._entry
+        now = time.time()
+        if value is not None and now < expires_at - self.refresh_margin:
+            return value
+        if value is not None and now < expires_at:
+            if not self._lock.acquire(False):
+                return value
+        else:
+            self._lock.acquire()
+        try:
+            value, expires_at = self._entry
+            if value is not None and time.time() < expires_at - self.refresh_margin:
+                return value
+            return self._refresh(acquire_func or self._acquire_func)
+        finally:
+            self._lock.release()
+
+    def set(self, value, expires_in=None):
+        # type: (T, Optional[float]) -> None
+        """Stores a value which was acquired elsewhere"""
+        if expires_in is None:
+            expires_in = self._expires_in_func(value)
+        if expires_in is None:
+            expires_in = self.default_lifetime
+        self._entry = (value, time.time() + expires_in)
+
+    def with_store(self, store):
+        # type: (Optional[TokenStore]) -> Self
+        """
+        Shares the value via a persistent store, so that other processes reuse it (as long as it is valid)
+        instead of acquiring their own one
+
+        :param TokenStore or None store: Token store
+        """
+        self._store = store if self.key is not None else None
+        return self
+
+    def invalidate(self):
+        """Discards the cached value, e.g. once it has been rejected by the service"""
+        with self._lock:
+            self._entry = (None, 0.0)
+            if self._store is not None:
+                with self._store.lock():
+                    self._store.remove(self.key)
+
+    def _refresh(self, acquire_func):
+        # type: (Callable[[], T]) -> T
+        if self._store is None:
+            value = acquire_func()
+            self.set(value)
+            return value
+
+        with self._store.lock():
+            entry = self._store.load(self.key)
+            if entry is not None and (
+                time.time() < entry["expiresAt"] - self.refresh_margin
+            ):
+                value = self._from_json(entry["value"])
+                self._entry = (value, entry["expiresAt"])
+                return value
+            value = acquire_func()
+            self.set(value)
+            self._store.save(
+                self.key,
+                {"value": self._to_json(value), "expiresAt": self.expires_at},
+            )
+            return value
@@ -9,6 +9,9 @@ class TokenResponse(object):
     def is_valid(self):
         return self.accessToken is not None and self.tokenType == "Bearer"
 
+    def to_json(self):
+        return dict(vars(self))
+
     @staticmethod
     def from_json(value):
         error = value.get("error", None)
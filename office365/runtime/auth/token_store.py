@@ -0,0 +1,166 @@
+import contextlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional, Tuple, Type, Union
+
+try:
+    import fcntl
+
+    msvcrt = None
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def build_cache_key(*parts):
+    # type: (Any) -> str
+    """Builds a key which identifies a token in a store, e.g. from kind, tenant, resource and client id"""
+    return "|".join("" if p is None else str(p) for p in parts)
+
+
+class TokenStore(object):
+    """
+    Persistent storage of tokens and authentication cookies, shared between processes.
+
+    Entries are JSON-serializable dicts, loading and saving is only performed while the lock is held
+    """
+
+    @contextlib.contextmanager
+    def lock(self):
+        # type: () -> Iterator[None]
+        """Acquires exclusive access to the store"""
+        yield
+
+    def load(self, key):
+        # type: (str) -> Optional[Dict[str, Any]]
+        raise NotImplementedError
+
+    def save(self, key, entry):
+        # type: (str, Dict[str, Any]) -> None
+        raise NotImplementedError
+
+    def remove(self, key):
+        # type: (str) -> None
+        raise NotImplementedError
+
+
+class FileTokenStore(TokenStore):
+    """
+    Stores entries in a single file, access from multiple processes is coordinated via an adjacent lock file.
+
+    Entries are encrypted (Fernet, via the cryptography package) once encryption key is specified,
+    otherwise the file is only protected by its permissions
+    """
+
+    def __init__(self, path, encryption_key=None):
+        # type: (str, Optional[Union[bytes, str]]) -> None
+        """
+        :param str path: Path to the cache file
+        :param bytes or str or None encryption_key: Fernet key, see FileTokenStore.generate_key
+        """
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self._fernet = None
+        if encryption_key is not None:
+            from cryptography.fernet import Fernet
+
+            self._fernet = Fernet(encryption_key)
+        self._invalid_content_errors = (
+            ValueError,
+        )  # type: Tuple[Type[Exception], ...]
+        """Errors raised while reading a corrupted file (or the one encrypted with another key)"""
+        if self._fernet is not None:
+            from cryptography.fernet import InvalidToken
+
+            self._invalid_content_errors = (ValueError, InvalidToken)
+        self._thread_lock = threading.RLock()
+
+    def __deepcopy__(self, memo):
+        """Store is shared, not copied, between cloned contexts"""
+        return self
+
+    @staticmethod
+    def generate_key():
+        # type: () -> bytes
+        """Generates a key suitable for encryption of the store"""
+        from cryptography.fernet import Fernet
+
+        return Fernet.generate_key()
+
+    @contextlib.contextmanager
+    def lock(self):
+        # type: () -> Iterator[None]
+        with self._thread_lock:
+            self._ensure_dir()
+            fd = os.open(self.path + ".lock", os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                else:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                try:
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(fd, fcntl.LOCK_UN)
+                    else:
+                        os.lseek(fd, 0, os.SEEK_SET)
+                        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            finally:
+                os.close(fd)
+
+    def load(self, key):
+        # type: (str) -> Optional[Dict[str, Any]]
+        return self._read().get(key, None)
+
+    def save(self, key, entry):
+        # type: (str, Dict[str, Any]) -> None
+        entries = self._read()
+        now = time.time()
+        entries = {k: v for k, v in entries.items() if v.get("expiresAt", 0) > now}
+        entries[key] = entry
+        self._write(entries)
+
+    def remove(self, key):
+        # type: (str) -> None
+        entries = self._read()
+        if entries.pop(key, None) is not None:
+            self._write(entries)
+
+    def _ensure_dir(self):
+        dir_name = os.path.dirname(self.path)
+        if not os.path.isdir(dir_name):
+            os.makedirs(dir_name, mode=0o700, exist_ok=True)
+
+    def _read(self):
+        # type: () -> Dict[str, Dict[str, Any]]
+        """Reads entries, an unreadable (e.g. corrupted or encrypted with another key) file is treated as empty"""
+        try:
+            with open(self.path, "rb") as f:
+                content = f.read()
+        except (IOError, OSError):
+            return {}
+        try:
+            if self._fernet is not None:
+                content = self._fernet.decrypt(content)
+            entries = json.loads(content.decode("utf-8"))
+        except self._invalid_content_errors:
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _write(self, entries):
+        # type: (Dict[str, Dict[str, Any]]) -> None
+        content = json.dumps(entries).encode("utf-8")
+        if self._fernet is not None:
+            content = self._fernet.encrypt(content)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
@@ -1,7 +1,17 @@
 from __future__ import annotations
 
 import datetime
-from typing import TYPE_CHECKING, Any, Callable, Generic, List, Optional, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 from requests import Response
 from typing_extensions import Self
@@ -24,8 +34,19 @@ T = TypeVar("T")
 P_T = TypeVar("P_T")
 """Property Type."""
 
+PLAIN_PROPERTY = 0
+DATETIME_PROPERTY = 1
+TYPED_PROPERTY = 2
+
+_property_schema = {}  # type: Dict[Tuple[type, str | int], int]
+"""Determines how values are mapped into properties, per client object type and property name"""
+
 
 class ClientObject(Generic[T]):
+    cache_property_kinds = True
+    """Determines whether property kinds are resolved once per type (see get_property_kind),
+    types which resolve properties depending on the state of object (in get_property) opt out"""
+
     def __init__(self, context, resource_path=None, parent_collection=None):
         # type: (ClientRuntimeContext, Optional[ResourcePath], Optional[ClientObjectCollection]) -> None
         """Base client object which define named properties and relationships of an entity."""
@@ -55,6 +76,12 @@ class ClientObject(Generic[T]):
         self.context.execute_query()
         return self
 
+    async def execute_query_async(self):
+        # type: () -> Self
+        """Submit request(s) to the server without blocking the event loop."""
+        await self.context.execute_query_async()
+        return self
+
     def execute_query_retry(
         self,
         max_retry=5,
@@ -157,7 +184,22 @@ class ClientObject(Generic[T]):
         if persist_changes:
             self._properties_to_persist.append(name)
 
-        typed_value = self.get_property(name)
+        typed_value = self._properties.get(name, None)
+        if typed_value is None and not self.cache_property_kinds:
+            typed_value = self.get_property(name)
+        elif typed_value is None:
+            # the type of property is resolved once per client object type, instead of a (typically) newly
+            # constructed default value being discarded for every property of every object
+            kind = self.get_property_kind(name)
+            if kind == TYPED_PROPERTY and isinstance(value, (list, dict)):
+                typed_value = self.get_property(name)
+            elif kind == DATETIME_PROPERTY:
+                self._properties[name] = ODataType.try_parse_datetime(value)
+                return self
+            else:
+                self._properties[name] = value
+                return self
+
         if isinstance(typed_value, (ClientObject, ClientValue)):
             if isinstance(value, list):
                 [
@@ -180,6 +222,26 @@ class ClientObject(Generic[T]):
                 self._properties[name] = value
         return self
 
+    def get_property_kind(self, name):
+        # type: (str | int) -> int
+        """
+        Resolves whether the property holds a typed, datetime or plain value,
+        the kind is cached per type unless cache_property_kinds is disabled
+        """
+        key = (type(self), name)
+        kind = _property_schema.get(key, None)
+        if kind is None:
+            default_value = self.get_property(name)
+            if isinstance(default_value, (ClientObject, ClientValue)):
+                kind = TYPED_PROPERTY
+            elif isinstance(default_value, datetime.datetime):
+                kind = DATETIME_PROPERTY
+            else:
+                kind = PLAIN_PROPERTY
+            if self.cache_property_kinds:
+                _property_schema[key] = kind
+        return kind
+
     def ensure_property(self, name, action, *args, **kwargs):
         # type: (str, Callable[..., None], Optional[Any], Optional[Any]) -> Self
         """Ensures if property is loaded"""
@@ -1,4 +1,16 @@
-from typing import Callable, Generic, Iterator, List, Optional, Type, TypeVar
+from collections import namedtuple
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+)
 
 from typing_extensions import Self
 
@@ -6,13 +18,42 @@ from office365.runtime.client_object import ClientObject
 from office365.runtime.client_runtime_context import ClientRuntimeContext
 from office365.runtime.http.request_options import RequestOptions
 from office365.runtime.odata.json_format import ODataJsonFormat
+from office365.runtime.odata.paging_checkpoint import (
+    PagingCheckpoint,
+    parse_skip_token,
+)
 from office365.runtime.paths.resource_path import ResourcePath
+from office365.runtime.types.columnar import ColumnarTable
 from office365.runtime.types.event_handler import EventHandler
 from office365.runtime.types.exceptions import NotFoundException
 
 T = TypeVar("T")
 
 
+class _PendingItem(object):
+    """Item (its properties) which has been received but not materialized into a client object yet"""
+
+    __slots__ = ("properties", "persist_changes", "item_type")
+
+    def __init__(self, properties, persist_changes, item_type):
+        # type: (dict, bool, Type[Any]) -> None
+        self.properties = properties
+        self.persist_changes = persist_changes
+        self.item_type = item_type
+        """Type of item resolved once the item was received, e.g. ChangeCollection resolves it per item"""
+
+
+def _resolve_field_value(properties, name):
+    # type: (dict, str) -> Any
+    """Resolves the value of a field, names of expanded (lookup) fields are separated by slash, e.g. Author/Title"""
+    value = properties
+    for part in name.split("/"):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part, None)
+    return value
+
+
 class ClientObjectCollection(ClientObject, Generic[T]):
     def __init__(self, context, item_type, resource_path=None, parent=None):
         # type: (ClientRuntimeContext, Type[T], Optional[ResourcePath], Optional[ClientObject]) -> None
@@ -22,14 +63,28 @@ class ClientObjectCollection(ClientObject, Generic[T]):
         self._item_type = item_type
         self._page_loaded = EventHandler(False)
         self._paged_mode = False
+        self._retain_pages = True
         self._current_pos = None
         self._next_request_url = None
         self._parent = parent
+        self._streamed = False
+        self._item_loaded = None  # type: Optional[Callable[[T], None]]
+        self._lazy = False
+        self._record_fields = None  # type: Optional[List[str]]
+        self._record_factory = None  # type: Optional[Callable[[List[Any]], Any]]
+        self._columns = None  # type: Optional[ColumnarTable]
+        self._prefetch_depth = 0
+        self._checkpoint = None  # type: Optional[PagingCheckpoint]
+        self._resume_url = None  # type: Optional[str]
 
     def clear_state(self):
         """Clears client object collection"""
         if not self._paged_mode:
             self._data = []
+            if self._columns is not None:
+                self._columns = ColumnarTable(self._record_fields)
+        elif not self._retain_pages:
+            self._data = []
         self._next_request_url = None
         self._current_pos = len(self._data)
         return self
@@ -58,15 +113,59 @@ class ClientObjectCollection(ClientObject, Generic[T]):
         # type: (str | int, dict, bool) -> Self
         if key == "__nextLinkUrl":
             self._next_request_url = value
+        elif self._columns is not None:
+            self._columns.append(
+                [_resolve_field_value(value, name) for name in self._record_fields]
+            )
+        elif self._record_factory is not None:
+            record = self._record_factory(
+                [_resolve_field_value(value, name) for name in self._record_fields]
+            )
+            if self._item_loaded is not None:
+                self._item_loaded(record)
+            else:
+                self._data.append(record)
+        elif self._item_loaded is not None:
+            self._item_loaded(self._materialize(value, persist_changes))
+        elif self._lazy:
+            self._data.append(_PendingItem(value, persist_changes, self._item_type))
         else:
-            client_object = self.create_typed_object()
-            self.add_child(client_object)
-            [
-                client_object.set_property(k, v, persist_changes)
-                for k, v in value.items()
-            ]
+            self.add_child(self._materialize(value, persist_changes))
         return self
 
+    def _materialize(self, properties, persist_changes, item_type=None):
+        # type: (dict, bool, Optional[Type[T]]) -> T
+        """
+        Creates a client object from the item properties
+
+        :param type or None item_type: Type of item to create, the current item type of collection by default
+        """
+        if item_type is None or item_type is self._item_type:
+            client_object = self.create_typed_object()
+        else:
+            current_type, self._item_type = self._item_type, item_type
+            try:
+                client_object = self.create_typed_object()
+            finally:
+                self._item_type = current_type
+        client_object._parent_collection = self
+        [
+            client_object.set_property(k, v, persist_changes)
+            for k, v in properties.items()
+        ]
+        return client_object
+
+    def _get_item(self, index):
+        # type: (int) -> T
+        """Returns the item at the position, materializes it (once) in lazy mode"""
+        item = self._data[index]
+        if isinstance(item, _PendingItem):
+            item = self._materialize(
+                item.properties, item.persist_changes, item.item_type
+            )
+            self._data[index] = item
+        return item
+
     def add_child(self, client_object):
         # type: (T) -> Self
         """Adds client object into collection"""
@@ -81,14 +180,44 @@ class ClientObjectCollection(ClientObject, Generic[T]):
 
     def __iter__(self):
         # type: () -> Iterator[T]
-        for item in self._data:
-            yield item
+        if self._paged_mode and self._prefetch_depth > 0 and self.has_next:
+            yield from self._iter_prefetched()
+            return
+        for index in range(len(self._data)):
+            yield self._get_item(index)
         if self._paged_mode:
             while self.has_next:
                 self._get_next().execute_query()
-                next_items = self._data[self._current_pos :]
-                for next_item in next_items:
-                    yield next_item
+                for index in range(self._current_pos, len(self._data)):
+                    yield self._get_item(index)
+            self._commit_checkpoint(None)
+
+    def _iter_prefetched(self):
+        # type: () -> Iterator[T]
+        """Iterates over pages, the next pages are retrieved while the current one is being processed"""
+        from office365.runtime.odata.page_prefetcher import PagePrefetcher
+
+        self._resume_url = None
+        prefetcher = PagePrefetcher(self, self._prefetch_depth).start()
+        try:
+            for index in range(len(self._data)):
+                yield self._get_item(index)
+            for _ in prefetcher.iter_pages():
+                for index in range(self._current_pos, len(self._data)):
+                    yield self._get_item(index)
+            self._commit_checkpoint(None)
+        finally:
+            prefetcher.stop()
+
+    async def __aiter__(self):
+        # type: () -> AsyncIterator[T]
+        for index in range(len(self._data)):
+            yield self._get_item(index)
+        if self._paged_mode:
+            while self.has_next:
+                await self._get_next().execute_query_async()
+                for index in range(self._current_pos, len(self._data)):
+                    yield self._get_item(index)
 
     def __len__(self):
         # type: () -> int
@@ -96,16 +225,27 @@ class ClientObjectCollection(ClientObject, Generic[T]):
 
     def __repr__(self):
         # type: () -> str
-        return repr(self._data)
+        return repr(self[:])
 
     def __getitem__(self, index):
         # type: (int) -> T
-        return self._data[index]
+        if isinstance(index, slice):
+            return [self._get_item(i) for i in range(*index.indices(len(self._data)))]
+        return self._get_item(index)
 
     def to_json(self, json_format=None):
         # type: (Optional[ODataJsonFormat]) -> List[dict]
         """Serializes the collection into JSON."""
-        return [item.to_json(json_format) for item in self._data]
+        if self._record_factory is not None:
+            return [
+                (
+                    record
+                    if isinstance(record, dict)
+                    else dict(zip(self._record_fields, record))
+                )
+                for record in self._data
+            ]
+        return [item.to_json(json_format) for item in self]
 
     def filter(self, expression):
         # type: (str) -> Self
@@ -138,16 +278,113 @@ class ClientObjectCollection(ClientObject, Generic[T]):
         self.query_options.top = value
         return self
 
-    def paged(self, page_size=None, page_loaded=None):
-        # type: (int, Callable[[Self], None] | None) -> Self
-        """Retrieves via server-driven paging mode"""
+    def paged(self, page_size=None, page_loaded=None, retain=True):
+        # type: (int, Callable[[Self], None] | None, bool) -> Self
+        """
+        Retrieves via server-driven paging mode
+
+        :param int page_size: Number of items per page
+        :param (Self) -> None page_loaded: Callback invoked once a page has been loaded
+        :param bool retain: Keep items of previous pages in the collection, otherwise the collection only holds
+            the current page, so that memory stays bounded by the page size while iterating over large collections
+        """
         self._paged_mode = True
+        self._retain_pages = retain
         if callable(page_loaded):
             self._page_loaded += page_loaded
         if page_size:
             self.top(page_size)
         return self
 
+    def prefetch(self, depth=1):
+        # type: (int) -> Self
+        """
+        Enables prefetch of pages: while iterating in paged mode, the next pages are retrieved on a background
+        thread while the items of the current page are being processed
+
+        :param int depth: Maximum number of pages retrieved ahead
+        """
+        self._paged_mode = True
+        self._prefetch_depth = depth
+        return self
+
+    def lazy(self):
+        # type: () -> Self
+        """
+        Enables lazy mode: received items are kept as decoded properties and materialized into client objects
+        only once they are accessed (indexed or iterated)
+        """
+        self._lazy = True
+        return self
+
+    def as_records(self, fields, as_dict=False):
+        # type: (Sequence[str], bool) -> Self
+        """
+        Enables records mode: only the specified fields are requested ($select) and every item is returned
+        as a lightweight record (a named tuple by default) of plain values instead of a client object.
+        Could be combined with paging and streaming, e.g. col.as_records(["Id", "Title"]).get_all()
+
+        :param list[str] fields: Names of fields to retrieve, lookup fields are specified along with
+            the field of the related item, e.g. Author/Title (the related item is expanded)
+        :param bool as_dict: Return records as dicts keyed by field names
+        """
+        self._select_fields(fields)
+        if as_dict:
+            self._record_factory = lambda values: dict(zip(self._record_fields, values))
+        else:
+            record_type = namedtuple(
+                "Record", [name.replace("/", "_") for name in fields], rename=True
+            )
+            self._record_factory = record_type._make
+        return self
+
+    def as_columns(self, fields):
+        # type: (Sequence[str]) -> Self
+        """
+        Enables columnar mode: only the specified fields are requested ($select) and values of every page
+        are accumulated into column-oriented buffers (see ColumnarTable) instead of client objects,
+        which are available via columns property, e.g. col.as_columns(["Id", "Title"]).get_all()
+
+        :param list[str] fields: Names of fields to retrieve, lookup fields are specified along with
+            the field of the related item, e.g. Author/Title (the related item is expanded)
+        """
+        self._select_fields(fields)
+        self._columns = ColumnarTable(self._record_fields)
+        return self
+
+    def _select_fields(self, fields):
+        # type: (Sequence[str]) -> None
+        self._record_fields = list(fields)
+        self.select(self._record_fields)
+        expand = sorted(set(name.split("/")[0] for name in fields if "/" in name))
+        if expand:
+            self.expand(expand)
+
+    def stream(self, item_loaded=None):
+        # type: (Optional[Callable[[T], None]]) -> Self
+        """
+        Enables streaming mode: the response is parsed incrementally and items are mapped as soon as they
+        are received.
+
+        :param (T) -> None item_loaded: Once specified, items are handed over to the callback instead of being kept
+            in the collection, so that memory stays bounded by a single item rather than a page
+        """
+        self._streamed = True
+        self._item_loaded = item_loaded
+        return self
+
+    @property
+    def columns(self):
+        # type: () -> Optional[ColumnarTable]
+        """Values accumulated in columnar mode"""
+        return self._columns
+
+    @property
+    def streamed(self):
+        # type: () -> bool
+        """Determines whether the response is parsed incrementally"""
+        return self._streamed
+
     def get(self):
         # type: () -> Self
 
@@ -156,6 +393,14 @@ class ClientObjectCollection(ClientObject, Generic[T]):
             self._page_loaded.notify(self)
 
         self.context.load(self).after_query_execute(_loaded)
+        if self._resume_url is not None:
+            resume_url, self._resume_url = self._resume_url, None
+
+            def _construct_request(request):
+                # type: (RequestOptions) -> None
+                request.url = resume_url
+
+            self.before_execute(_construct_request)
         return self
 
     def get_all(self, page_size=None, page_loaded=None):
@@ -166,6 +411,8 @@ class ClientObjectCollection(ClientObject, Generic[T]):
             # type: (Self) -> None
             if self.has_next:
                 self._get_next().after_execute(_page_loaded)
+            else:
+                self._commit_checkpoint(None)
 
         self.paged(page_size, page_loaded).get().after_execute(_page_loaded)
         return self
@@ -178,8 +425,45 @@ class ClientObjectCollection(ClientObject, Generic[T]):
             # type: (RequestOptions) -> None
             request.url = self._next_request_url
 
+        self._commit_checkpoint(self._next_request_url)
         return self.get().before_execute(_construct_request)
 
+    def resume(self, next_link_url):
+        # type: (str) -> Self
+        """
+        Resumes retrieval in paged mode from the specified page, e.g. the one saved in a checkpoint
+        by an interrupted enumeration, the first page is not retrieved then
+
+        :param str next_link_url: Url of the page to resume from (see next_link_url)
+        """
+        self._paged_mode = True
+        self._resume_url = next_link_url
+        self._next_request_url = next_link_url
+        return self
+
+    def with_checkpoint(self, checkpoint):
+        # type: (PagingCheckpoint) -> Self
+        """
+        Persists continuation state while retrieving in paged mode: the url of the next page is committed
+        once the current page has been processed (page_loaded callbacks invoked or its items iterated over),
+        the checkpoint is cleared once all the pages have been retrieved.
+
+        Retrieval is resumed from the committed page if the checkpoint is not empty
+
+        :param PagingCheckpoint checkpoint: Checkpoint storage, e.g. FilePagingCheckpoint
+        """
+        self._paged_mode = True
+        self._checkpoint = checkpoint
+        next_link_url = checkpoint.next_link_url
+        if next_link_url is not None:
+            self.resume(next_link_url)
+        return self
+
+    def _commit_checkpoint(self, next_link_url):
+        # type: (Optional[str]) -> None
+        if self._checkpoint is not None:
+            self._checkpoint.commit(next_link_url)
+
     def first(self, expression):
         # type: (str) -> T
         """Return the first Entity instance that matches current query
@@ -231,6 +515,18 @@ class ClientObjectCollection(ClientObject, Generic[T]):
         # type: () -> ClientObject
         return self._parent
 
+    @property
+    def next_link_url(self):
+        # type: () -> Optional[str]
+        """Url of the next page (nextLink, __next), could be used to resume retrieval later"""
+        return self._next_request_url
+
+    @property
+    def skip_token(self):
+        # type: () -> Optional[str]
+        """Skip token of the next page, e.g. Paged=TRUE&p_ID=100 (SharePoint paging info)"""
+        return parse_skip_token(self._next_request_url)
+
     @property
     def has_next(self):
         # type: () -> bool
@@ -240,7 +536,7 @@ class ClientObjectCollection(ClientObject, Generic[T]):
     @property
     def current_page(self):
         # type: () -> List[T]
-        return self._data[self._current_pos :]
+        return self[self._current_pos :]
 
     @property
     def entity_type_name(self):
@@ -1,22 +1,44 @@
+import asyncio
 from abc import abstractmethod
+from typing import Optional
 
 import requests
 from requests import HTTPError
 
 from office365.runtime.client_request_exception import ClientRequestException
-from office365.runtime.http.http_method import HttpMethod
 from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.http.transport import HttpTransport
 from office365.runtime.queries.client_query import ClientQuery
 from office365.runtime.types.event_handler import EventHandler
 
 
 class ClientRequest(object):
-    def __init__(self):
+    def __init__(self, transport=None):
+        # type: (Optional[HttpTransport]) -> None
         """
         Abstract request client
+
+        :param HttpTransport or None transport: HTTP transport used to submit requests
         """
         self.beforeExecute = EventHandler()
         self.afterExecute = EventHandler()
+        self.recoverFailure = EventHandler()
+        """Listeners (request, response) -> bool which try to recover from a failed response in place,
+        the request is resubmitted (once) if any of them succeeds"""
+        self._transport = transport
+
+    @property
+    def transport(self):
+        # type: () -> HttpTransport
+        """Returns HTTP transport"""
+        if self._transport is None:
+            self._transport = HttpTransport()
+        return self._transport
+
+    @transport.setter
+    def transport(self, value):
+        # type: (HttpTransport) -> None
+        self._transport = value
 
     @abstractmethod
     def build_request(self, query):
@@ -40,63 +62,76 @@ class ClientRequest(object):
         except HTTPError as e:
             raise ClientRequestException(*e.args, response=e.response)
 
+    async def execute_query_async(self, query):
+        # type: (ClientQuery) -> None
+        """Submits a pending request to the server without blocking the event loop"""
+        try:
+            request = self.build_request(query)
+            response = await self.execute_request_direct_async(request)
+            self.process_response(response, query)
+            self.afterExecute.notify(response)
+        except HTTPError as e:
+            raise ClientRequestException(*e.args, response=e.response)
+
+    async def execute_request_direct_async(self, request):
+        # type: (RequestOptions) -> requests.Response
+        """
+        Execute the client request without blocking the event loop, event handlers (which might acquire
+        credentials) are invoked on a worker thread of the transport
+        """
+        loop = asyncio.get_running_loop()
+        executor = self.transport.executor
+        await loop.run_in_executor(executor, self.beforeExecute.notify, request)
+        position = request.data.tell() if request.is_file else None
+        response = await self.transport.send_async(request)
+        if await loop.run_in_executor(
+            executor, self._recover, request, response, position
+        ):
+            response = await self.transport.send_async(request)
+        response.raise_for_status()
+        return response
+
     def execute_request_direct(self, request):
         # type: (RequestOptions) -> requests.Response
         """Execute the client request"""
         self.beforeExecute.notify(request)
-        if request.method == HttpMethod.Post:
-            if request.is_bytes or request.is_file:
-                response = requests.post(
-                    url=request.url,
-                    headers=request.headers,
-                    data=request.data,
-                    auth=request.auth,
-                    verify=request.verify,
-                    proxies=request.proxies,
-                )
-            else:
-                response = requests.post(
-                    url=request.url,
-                    headers=request.headers,
-                    json=request.data,
-                    auth=request.auth,
-                    verify=request.verify,
-                    proxies=request.proxies,
-                )
-        elif request.method == HttpMethod.Patch:
-            response = requests.patch(
-                url=request.url,
-                headers=request.headers,
-                json=request.data,
-                auth=request.auth,
-                verify=request.verify,
-                proxies=request.proxies,
-            )
-        elif request.method == HttpMethod.Delete:
-            response = requests.delete(
-                url=request.url,
-                headers=request.headers,
-                auth=request.auth,
-                verify=request.verify,
-                proxies=request.proxies,
-            )
-        elif request.method == HttpMethod.Put:
-            response = requests.put(
-                url=request.url,
-                data=request.data,
-                headers=request.headers,
-                auth=request.auth,
-                verify=request.verify,
-                proxies=request.proxies,
-            )
-        else:
-            response = requests.get(
-                url=request.url,
-                headers=request.headers,
-                auth=request.auth,
-                verify=request.verify,
-                stream=request.stream,
-                proxies=request.proxies,
-            )
+        position = request.data.tell() if request.is_file else None
+        response = self.transport.send(request)
+        if self._recover(request, response, position):
+            response = self.transport.send(request)
         response.raise_for_status()
         return response
+
+    def resubmit_recovered(self, request, response):
+        # type: (RequestOptions, requests.Response) -> requests.Response
+        """
+        Resubmits a request which has been submitted concurrently (bypassing execute_request_direct) once its failure
+        has been recovered, e.g. an expired form digest has been renewed, returns the response as is otherwise
+        """
+        if request.is_file or not self._recover(request, response, None):
+            return response
+        return self.transport.send(request)
+
+    async def resubmit_recovered_async(self, request, response):
+        # type: (RequestOptions, requests.Response) -> requests.Response
+        """The same as resubmit_recovered, the failure is recovered on a worker thread of the transport"""
+        if request.is_file:
+            return response
+        loop = asyncio.get_running_loop()
+        if not await loop.run_in_executor(
+            self.transport.executor, self._recover, request, response, None
+        ):
+            return response
+        return await self.transport.send_async(request)
+
+    def _recover(self, request, response, position):
+        # type: (RequestOptions, requests.Response, Optional[int]) -> bool
+        """Determines whether the failed request has been recovered and is expected to be resubmitted"""
+        if response.ok or not any(
+            handler(request, response) for handler in self.recoverFailure
+        ):
+            return False
+        response.close()
+        if position is not None:
+            request.data.seek(position)
+        return True
@@ -1,4 +1,3 @@
-import copy
 from typing import TYPE_CHECKING, Callable, Generic, Optional, TypeVar
 
 from typing_extensions import Self
@@ -20,7 +19,7 @@ class ClientResult(Generic[T]):
         # type: (ClientRuntimeContext, Optional[T]) -> None
         """Client result"""
         self._context = context
-        self._value = copy.deepcopy(default_value)  # type: T
+        self._value = default_value  # type: T
 
     def before_execute(self, action):
         # type: (Callable[[RequestOptions], None]) -> Self
@@ -56,6 +55,11 @@ class ClientResult(Generic[T]):
         self._context.execute_query()
         return self
 
+    async def execute_query_async(self):
+        """Submit request(s) to the server without blocking the event loop"""
+        await self._context.execute_query_async()
+        return self
+
     def execute_query_retry(
         self,
         max_retry=5,
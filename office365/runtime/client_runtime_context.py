@@ -1,9 +1,12 @@
 import abc
+import asyncio
+from collections import deque
+from functools import partial
 from time import sleep
-from typing import TYPE_CHECKING, AnyStr, Callable, List
+from typing import TYPE_CHECKING, Any, AnyStr, Callable, Deque, List, Optional, Tuple
 
 import requests
-from requests import Response
+from requests import HTTPError, Response
 from typing_extensions import Self
 
 from office365.runtime.client_request import ClientRequest
@@ -11,17 +14,60 @@ from office365.runtime.client_request_exception import ClientRequestException
 from office365.runtime.client_result import ClientResult
 from office365.runtime.http.http_method import HttpMethod
 from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.http.throttling import ThrottlingPolicy, parse_retry_after
+from office365.runtime.http.transport import HttpTransport
 from office365.runtime.queries.client_query import ClientQuery
 from office365.runtime.queries.read_entity import ReadEntityQuery
+from office365.runtime.queries.scheduler import QueryFootprint, QueryScheduler
 
 if TYPE_CHECKING:
     from office365.runtime.client_object import T
+    from office365.runtime.queries.batch import BatchQuery
+    from office365.runtime.types.event_handler import EventHandler
 
 
 class ClientRuntimeContext(object):
     def __init__(self):
-        self._queries = []
+        self._queries = deque()  # type: Deque[ClientQuery]
         self._current_query = None
+        self._transport = None
+        self._auto_batch_size = 0
+
+    @property
+    def transport(self):
+        # type: () -> HttpTransport
+        """Returns HTTP transport shared by all requests submitted via this context"""
+        if self._transport is None:
+            self._transport = HttpTransport()
+        return self._transport
+
+    def with_transport(self, transport):
+        # type: (HttpTransport) -> Self
+        """
+        Configures HTTP transport (connection pool size, keep-alive and timeouts) for this context
+
+        :param HttpTransport transport: HTTP transport
+        """
+        self._transport = transport
+        self.pending_request().transport = transport
+        try:
+            self.batch_request().transport = transport
+        except NotImplementedError:
+            pass
+        return self
+
+    def with_throttling(self, policy):
+        # type: (Optional[ThrottlingPolicy]) -> Self
+        """
+        Configures how throttled requests are handled, the policy applies to all contexts
+        which share the transport. By default throttled requests are not resubmitted,
+        their responses are returned (and raised) as is.
+
+        :param ThrottlingPolicy or None policy: Throttling policy, e.g. ThrottlingPolicy.default() to share
+            the state between all the transports in the process, None to disable
+        """
+        self.pending_request().transport.throttling = policy
+        return self
 
     @property
     def current_query(self):
@@ -51,12 +97,16 @@ class ClientRuntimeContext(object):
         """
         Executes the current set of data retrieval queries and method invocations and retries it if needed.
 
+        Only the failed query is resubmitted, once the delay specified via Retry-After header (if provided
+        by the service) or timeout_secs has elapsed.
+
         :param int max_retry: Number of times to retry the request
         :param int timeout_secs: Seconds to wait before retrying the request.
         :param (office365.runtime.client_object.ClientObject)-> None success_callback:
         :param (int, requests.exceptions.RequestException)-> None failure_callback:
         :param exceptions: tuple of exceptions that we retry
         """
+        from office365.runtime.queries.batch import BatchQuery
 
         for retry in range(1, max_retry + 1):
             try:
@@ -65,16 +115,52 @@ class ClientRuntimeContext(object):
                     success_callback(self.current_query.return_type)
                 break
             except exceptions as e:
-                self.add_query(self.current_query)
+                if isinstance(self.current_query, BatchQuery):
+                    failed = self.current_query.queries
+                else:
+                    failed = [self.current_query]
+                # queries of a failed batch might have already been returned into the queue
+                self._queries.extendleft(
+                    reversed([q for q in failed if q not in self._queries])
+                )
                 if callable(failure_callback):
                     failure_callback(retry, e)
-                sleep(timeout_secs)
+                response = getattr(e, "response", None)
+                retry_after = None
+                if response is not None:
+                    retry_after = parse_retry_after(response)
+                sleep(timeout_secs if retry_after is None else retry_after)
 
     @abc.abstractmethod
     def pending_request(self):
         # type: () -> ClientRequest
         pass
 
+    def batch_request(self):
+        # type: () -> ClientRequest
+        """
+        Provides access to underlying batch request instance
+
+        :raises NotImplementedError: if batch requests are not supported by the service
+        """
+        raise NotImplementedError(
+            "Batch requests are not supported by {0}".format(type(self).__name__)
+        )
+
+    def with_auto_batch(self, items_per_batch):
+        # type: (int) -> Self
+        """
+        Enables transparent batching mode: execute_query coalesces independent pending queries into
+        batch requests, queries which upload or download content are submitted individually
+
+        :param int items_per_batch: Maximum number of queries per batch request, 0 disables batching
+        :raises NotImplementedError: if batch requests are not supported by the service
+        """
+        if items_per_batch:
+            self.batch_request()
+        self._auto_batch_size = items_per_batch
+        return self
+
     @abc.abstractmethod
     def service_root_url(self):
         # type: () -> str
@@ -123,6 +209,7 @@ class ClientRuntimeContext(object):
                 self.pending_request().beforeExecute -= _process_request
             action(request)
 
+        _process_request.next_request_only = once
         self.pending_request().beforeExecute += _process_request
         return self
 
@@ -143,7 +230,7 @@ class ClientRuntimeContext(object):
         self.pending_request().afterExecute += _process_response
 
         if execute_first and len(self._queries) > 1:
-            self._queries.insert(0, self._queries.pop())
+            self._queries.appendleft(self._queries.pop())
 
         return self
 
@@ -157,6 +244,7 @@ class ClientRuntimeContext(object):
                 self.pending_request().afterExecute -= _process_response
             action(response)
 
+        _process_response.next_request_only = once
         self.pending_request().afterExecute += _process_response
         return self
 
@@ -169,10 +257,194 @@ class ClientRuntimeContext(object):
     def execute_query(self):
         """Submit request(s) to the server"""
         while self.has_pending_request:
+            if self._auto_batch_size > 1:
+                batch_qry = self._get_next_batch_query(self._auto_batch_size)
+                if len(batch_qry.queries) > 1:
+                    self._execute_batch_query(batch_qry)
+                    continue
+                self._queries.extendleft(batch_qry.queries)
             qry = self._get_next_query()
             self.pending_request().execute_query(qry)
         return self
 
+    def _execute_batch_query(self, query):
+        # type: (BatchQuery) -> None
+        """
+        Submits a batch request, sub-responses are processed (including event handlers)
+        as if queries were submitted one by one
+        """
+        client = self.batch_request()
+        self._current_query = query
+        try:
+            request = client.build_request(query)
+            response = client.execute_request_direct(request)
+        except HTTPError as e:
+            raise ClientRequestException(*e.args, response=e.response)
+        self._complete_batch_query(query, response)
+
+    def _dispatch_batch_query(self, query, detached=False):
+        # type: (BatchQuery, bool) -> RequestOptions
+        """
+        Builds a request of the batch query which is submitted concurrently
+
+        :param bool detached: Queries of the batch are not a part of the queue, see _build_detached_request
+        """
+        client = self.batch_request()
+        if detached:
+            for sub_qry in query.queries:
+                query._sub_requests[sub_qry.id] = self._build_detached_request(sub_qry)
+        self._current_query = query
+        request = client.build_request(query)
+        if detached:
+            self._notify_detached(client.beforeExecute, request)
+        else:
+            client.beforeExecute.notify(request)
+        return request
+
+    def _complete_batch_query(self, query, response, request=None, detached=False):
+        # type: (BatchQuery, Response, Optional[RequestOptions], bool) -> None
+        """
+        Processes a response of the batch query, sub-responses are processed as if submitted one by one
+
+        :param RequestOptions or None request: Request of the batch query if it was submitted concurrently,
+            it is resubmitted once the failure has been recovered (see ClientRequest.recoverFailure)
+        :param bool detached: Queries of the batch are not a part of the queue, see _build_detached_request
+        """
+        client = self.batch_request()
+        self._current_query = query
+        try:
+            if request is not None:
+                response = client.resubmit_recovered(request, response)
+            response.raise_for_status()
+            if detached:
+                self._notify_detached(client.afterExecute, response)
+                action = partial(self._complete_query, detached=True)
+            else:
+                client.afterExecute.notify(response)
+                action = self._complete_query
+            client.process_sub_responses(response, query, action)
+        except HTTPError as e:
+            raise ClientRequestException(*e.args, response=e.response)
+
+    def execute_query_parallel(self, max_workers=None):
+        """
+        Submit request(s) to the server, independent queries are submitted concurrently
+
+        Queries are dispatched in queue order onto the transport worker pool as long as they do not depend on
+        a query still in flight (see QueryScheduler), responses are processed and event handlers are invoked
+        on the calling thread in the same order as queries were dispatched.
+
+        :param int or None max_workers: Maximum number of requests in flight,
+            defaults to the connection pool size of the transport
+        """
+        transport = self.pending_request().transport
+        scheduler = QueryScheduler(max_workers or transport.pool_maxsize)
+        try:
+            while self.has_pending_request or len(scheduler) > 0:
+                while self.has_pending_request and scheduler.can_dispatch(
+                    self._queries[0]
+                ):
+                    qry, request = self._dispatch_next_query()
+                    scheduler.add(
+                        qry, transport.executor.submit(transport.send, request), request
+                    )
+                qry, future, request = scheduler.pop()
+                self._complete_query(qry, future.result(), request)
+        finally:
+            scheduler.cancel()
+        return self
+
+    async def execute_query_async(self, max_concurrency=None):
+        """
+        Submit request(s) to the server concurrently on the running event loop
+
+        Scheduling is the same as for execute_query_parallel. Requests are built one at a time on a worker thread
+        of the transport, since handlers invoked before a request is submitted might block (e.g. to acquire
+        credentials or a form digest). Responses are processed (including event handlers) on the event loop thread,
+        so queries which are added by handlers are picked up and submitted as well.
+
+        Auto batching (see with_auto_batch) is not supported, use execute_query or execute_batch instead.
+
+        :param int or None max_concurrency: Maximum number of requests in flight,
+            defaults to the connection pool size of the transport
+        """
+        if self._auto_batch_size > 1:
+            raise NotImplementedError(
+                "Auto batching is not supported by execute_query_async, use execute_query instead"
+            )
+        loop = asyncio.get_running_loop()
+        transport = self.pending_request().transport
+        scheduler = QueryScheduler(max_concurrency or transport.pool_maxsize)
+        try:
+            while self.has_pending_request or len(scheduler) > 0:
+                while self.has_pending_request and scheduler.can_dispatch(
+                    self._queries[0]
+                ):
+                    qry, request = await loop.run_in_executor(
+                        transport.executor, self._dispatch_next_query
+                    )
+                    scheduler.add(
+                        qry,
+                        asyncio.ensure_future(transport.send_async(request)),
+                        request,
+                    )
+                qry, future, request = scheduler.pop()
+                response = await self.pending_request().resubmit_recovered_async(
+                    request, await future
+                )
+                self._complete_query(qry, response)
+        finally:
+            scheduler.cancel()
+        return self
+
+    def _dispatch_next_query(self):
+        # type: () -> Tuple[ClientQuery, RequestOptions]
+        """Dequeues the next query and builds its request"""
+        qry = self._get_next_query()
+        return qry, self.build_request(qry)
+
+    def _complete_query(self, query, response, request=None, detached=False):
+        # type: (ClientQuery, Response, Optional[RequestOptions], bool) -> None
+        """
+        Processes a response of a query which was submitted concurrently (or within a batch)
+
+        :param RequestOptions or None request: Request of the query if it was submitted concurrently,
+            it is resubmitted once the failure has been recovered (see ClientRequest.recoverFailure)
+        :param bool detached: The query is not a part of the queue, see _build_detached_request
+        """
+        client = self.pending_request()
+        self._current_query = query
+        try:
+            if request is not None:
+                response = client.resubmit_recovered(request, response)
+            response.raise_for_status()
+            client.process_response(response, query)
+            if detached:
+                self._notify_detached(client.afterExecute, response)
+            else:
+                client.afterExecute.notify(response)
+        except HTTPError as e:
+            raise ClientRequestException(*e.args, response=e.response)
+
+    def _build_detached_request(self, query):
+        # type: (ClientQuery) -> RequestOptions
+        """
+        Builds a request of a query which is not a part of the queue (e.g. a page retrieved ahead),
+        handlers attached for the next request only (see before_execute) are left to the queued queries
+        """
+        self._current_query = query
+        client = self.pending_request()
+        request = client.build_request(query)
+        self._notify_detached(client.beforeExecute, request)
+        return request
+
+    @staticmethod
+    def _notify_detached(event, *args):
+        # type: (EventHandler, Any) -> None
+        for listener in list(event):
+            if not getattr(listener, "next_request_only", False):
+                listener(*args)
+
     def add_query(self, query):
         # type: (ClientQuery) ->Self
         self._queries.append(query)
@@ -180,7 +452,7 @@ class ClientRuntimeContext(object):
 
     def clear(self):
         self._current_query = None
-        self._queries = []
+        self._queries = deque()
         return self
 
     def get_metadata(self):
@@ -204,16 +476,36 @@ class ClientRuntimeContext(object):
         )
         return return_type
 
+    def _get_next_batch_query(self, max_items):
+        # type: (int) -> BatchQuery
+        """Dequeues pending queries, as long as they are independent of each other, into a batch query"""
+        from office365.runtime.queries.batch import BatchQuery
+
+        client = self.batch_request()
+        qry = BatchQuery(self)
+        footprints = []
+        while self.has_pending_request and len(qry.queries) < max_items:
+            next_qry = self._queries[0]
+            footprint = QueryFootprint(next_qry)
+            if not client.can_batch(next_qry, qry) or any(
+                footprint.conflicts_with(f) for f in footprints
+            ):
+                break
+            footprints.append(footprint)
+            qry.add(self._queries.popleft())
+        self._current_query = qry
+        return qry
+
     def _get_next_query(self, count=1):
         # type: (int) -> ClientQuery
         if count == 1:
-            qry = self._queries.pop(0)
+            qry = self._queries.popleft()
         else:
             from office365.runtime.queries.batch import BatchQuery
 
             qry = BatchQuery(self)
             while self.has_pending_request and count > 0:
-                qry.add(self._queries.pop(0))
+                qry.add(self._queries.popleft())
                 count = count - 1
         self._current_query = qry
         return qry
@@ -20,11 +20,11 @@ if is_py2:
     from urllib import quote
 
     import pytz as timezone
-    from urlparse import urljoin, urlparse
+    from urlparse import parse_qs, urljoin, urlparse
 elif is_py3:
     from datetime import timezone
     from email import message_from_bytes as message_from_bytes_or_string
-    from urllib.parse import quote, urljoin, urlparse
+    from urllib.parse import parse_qs, quote, urljoin, urlparse
 
 
 def message_as_bytes_or_string(message):
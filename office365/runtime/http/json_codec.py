@@ -0,0 +1,97 @@
+import json
+import threading
+from typing import Any, Optional, Union
+
+
+class JsonCodec(object):
+    """Encodes request and decodes response payloads via the standard json module"""
+
+    name = "json"
+
+    _default = None  # type: Optional[JsonCodec]
+    _default_lock = threading.Lock()
+
+    @classmethod
+    def default(cls):
+        # type: () -> JsonCodec
+        """
+        Returns the fastest codec available in the process: orjson or ujson (if installed),
+        otherwise the standard json module is used
+        """
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = cls._create_default()
+        return cls._default
+
+    @staticmethod
+    def _create_default():
+        # type: () -> JsonCodec
+        for codec_type in (OrjsonCodec, UjsonCodec):
+            try:
+                return codec_type()
+            except ImportError:
+                pass
+        return JsonCodec()
+
+    def loads(self, data):
+        # type: (Union[bytes, str]) -> Any
+        """Decodes a payload"""
+        return json.loads(data)
+
+    def dumps(self, value):
+        # type: (Any) -> bytes
+        """Encodes a payload into UTF-8 encoded bytes"""
+        return json.dumps(value, allow_nan=False).encode("utf-8")
+
+
+class OrjsonCodec(JsonCodec):
+    """Encodes and decodes payloads via orjson"""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson  # pylint: disable=import-error
+
+        # members of the compiled module are not visible to static analysis
+        self._loads = orjson.loads  # pylint: disable=no-member
+        self._dumps = orjson.dumps  # pylint: disable=no-member
+        self._decode_error = orjson.JSONDecodeError  # pylint: disable=no-member
+
+    def loads(self, data):
+        # type: (Union[bytes, str]) -> Any
+        try:
+            return self._loads(data)
+        except self._decode_error:
+            # payloads which are not UTF-8 encoded (e.g. with BOM) are handled by the standard module
+            return super(OrjsonCodec, self).loads(data)
+
+    def dumps(self, value):
+        # type: (Any) -> bytes
+        try:
+            return self._dumps(value)
+        except TypeError:
+            # e.g. non-string keys or integers which exceed 64 bits
+            return super(OrjsonCodec, self).dumps(value)
+
+
+class UjsonCodec(JsonCodec):
+    """Encodes and decodes payloads via ujson"""
+
+    name = "ujson"
+
+    def __init__(self):
+        import ujson  # pylint: disable=import-error
+
+        self._ujson = ujson
+
+    def loads(self, data):
+        # type: (Union[bytes, str]) -> Any
+        try:
+            return self._ujson.loads(data)
+        except ValueError:
+            return super(UjsonCodec, self).loads(data)
+
+    def dumps(self, value):
+        # type: (Any) -> bytes
+        return self._ujson.dumps(value, ensure_ascii=False).encode("utf-8")
@@ -0,0 +1,40 @@
+from typing import Any, Dict, Optional
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from office365.runtime.http.json_codec import JsonCodec
+
+
+class JsonResponse(Response):
+    """
+    Response which body has already been decoded, e.g. a sub-response of JSON batch.
+
+    The decoded body is mapped as is, the raw content is only encoded once requested
+    """
+
+    def __init__(self, status_code, headers, body, json_codec=None):
+        # type: (int, Optional[Dict[str, str]], Any, Optional[JsonCodec]) -> None
+        """
+        :param int status_code: HTTP status code
+        :param dict or None headers: HTTP headers
+        :param Any body: Decoded body
+        :param JsonCodec or None json_codec: Codec the content is encoded with
+        """
+        super(JsonResponse, self).__init__()
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.body = body
+        self._json_codec = json_codec or JsonCodec.default()
+
+    @property
+    def content(self):
+        # type: () -> bytes
+        if self._content is False:
+            self._content = self._json_codec.dumps(self.body)
+            self._content_consumed = True
+        return self._content
+
+    def json(self, **kwargs):
+        # type: (Any) -> Any
+        return self.body
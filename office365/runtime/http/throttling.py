@@ -0,0 +1,221 @@
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, FrozenSet, Optional
+
+import requests
+
+from office365.runtime.compat import urlparse
+from office365.runtime.http.http_method import HttpMethod
+
+THROTTLED_STATUS_CODES = (429, 503)
+
+IDEMPOTENT_METHODS = frozenset(
+    [HttpMethod.Get, HttpMethod.Put, HttpMethod.Delete, "HEAD", "OPTIONS"]
+)
+
+
+def parse_retry_after(response):
+    # type: (requests.Response) -> Optional[float]
+    """
+    Returns the number of seconds to wait as specified via Retry-After header,
+    the value is either a number of seconds or an HTTP date
+    """
+    value = response.headers.get("Retry-After", None)
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+def parse_rate_limit_reset(response):
+    # type: (requests.Response) -> Optional[float]
+    """
+    Returns the number of seconds until the rate limit resets once the quota is exhausted
+    as specified via RateLimit-Remaining and RateLimit-Reset headers
+    """
+    remaining = response.headers.get("RateLimit-Remaining", None)
+    reset = response.headers.get("RateLimit-Reset", None)
+    if remaining is None or reset is None:
+        return None
+    try:
+        if int(remaining) > 0:
+            return None
+        return max(float(reset), 0.0)
+    except ValueError:
+        return None
+
+
+class TokenBucket(object):
+    """Token bucket which limits the rate of requests submitted to a single host"""
+
+    def __init__(self, rate=None, capacity=None):
+        # type: (Optional[float], Optional[float]) -> None
+        """
+        :param float or None rate: Number of requests per second, the rate is not limited if omitted
+        :param float or None capacity: Maximum number of requests in a burst, defaults to the rate
+        """
+        self.rate = rate
+        self.capacity = capacity or rate or 1.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def pause(self, seconds):
+        # type: (float) -> None
+        """Suspends requests for the specified number of seconds"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def acquire(self):
+        # type: () -> float
+        """Blocks until a request is allowed, returns the number of seconds waited"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if self.rate is None:
+                        return waited
+                    self._tokens = min(
+                        self.capacity, self._tokens + (now - self._updated) * self.rate
+                    )
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return waited
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+
+class ThrottlingMetrics(object):
+    """Throttling statistics"""
+
+    def __init__(self):
+        self.throttled_responses = 0
+        """Number of responses with 429 or 503 status"""
+        self.retries = 0
+        """Number of requests resubmitted after being throttled"""
+        self.throttled_seconds = 0.0
+        """Time spent waiting before requests were allowed to be submitted"""
+        self._lock = threading.Lock()
+
+    def add(self, throttled_responses=0, retries=0, throttled_seconds=0.0):
+        # type: (int, int, float) -> None
+        with self._lock:
+            self.throttled_responses += throttled_responses
+            self.retries += retries
+            self.throttled_seconds += throttled_seconds
+
+    def to_json(self):
+        # type: () -> Dict[str, float]
+        with self._lock:
+            return {
+                "throttledResponses": self.throttled_responses,
+                "retries": self.retries,
+                "throttledSeconds": self.throttled_seconds,
+            }
+
+
+def _host_key(url):
+    # type: (str) -> str
+    return urlparse(url).netloc.lower()
+
+
+class ThrottlingPolicy(object):
+    """
+    Coordinates requests submitted to throttled services: honours Retry-After and RateLimit-* headers
+    and (optionally) limits the rate of requests per host. The state is shared by all transports
+    (and hence all contexts) which use the same policy.
+    """
+
+    _default = None  # type: Optional[ThrottlingPolicy]
+    _default_lock = threading.Lock()
+
+    def __init__(
+        self, max_retries=3, default_delay=5, rate=None, capacity=None, key_func=None
+    ):
+        # type: (int, float, Optional[float], Optional[float], Optional[Callable[[str], str]]) -> None
+        """
+        :param int max_retries: Number of times a throttled request is resubmitted, 0 disables resubmitting
+        :param float default_delay: Seconds to wait if the throttled response does not specify Retry-After
+        :param float or None rate: Number of requests per second allowed per host (tenant)
+        :param float or None capacity: Maximum number of requests in a burst per host (tenant)
+        :param (str) -> str key_func: Resolves the bucket (host or tenant) key from request url
+        """
+        self.max_retries = max_retries
+        self.default_delay = default_delay
+        self.rate = rate
+        self.capacity = capacity
+        self.metrics = ThrottlingMetrics()
+        self.retry_methods = IDEMPOTENT_METHODS  # type: FrozenSet[str]
+        """HTTP methods which are resubmitted once throttled, requests of other (non-idempotent) methods
+        are resubmitted only if the service specifies Retry-After"""
+        self._key_func = key_func or _host_key
+        self._buckets = {}  # type: Dict[str, TokenBucket]
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls):
+        # type: () -> ThrottlingPolicy
+        """Returns the policy shared by all contexts in the process which opt in (see with_throttling)"""
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = ThrottlingPolicy()
+        return cls._default
+
+    def get_bucket(self, url):
+        # type: (str) -> TokenBucket
+        key = self._key_func(url)
+        bucket = self._buckets.get(key, None)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.setdefault(
+                    key, TokenBucket(self.rate, self.capacity)
+                )
+        return bucket
+
+    def acquire(self, url):
+        # type: (str) -> None
+        """Blocks until a request to the url is allowed to be submitted"""
+        waited = self.get_bucket(url).acquire()
+        if waited > 0:
+            self.metrics.add(throttled_seconds=waited)
+
+    def process_response(self, url, response, attempt, method=HttpMethod.Get):
+        # type: (str, requests.Response, int, str) -> bool
+        """
+        Registers throttling information of the response,
+        returns True if the request is expected to be resubmitted
+
+        :param str method: HTTP method of the request
+        """
+        bucket = self.get_bucket(url)
+        if response.status_code not in THROTTLED_STATUS_CODES:
+            reset = parse_rate_limit_reset(response)
+            if reset:
+                bucket.pause(reset)
+            return False
+
+        self.metrics.add(throttled_responses=1)
+        retry_after = delay = parse_retry_after(response)
+        if delay is None:
+            delay = parse_rate_limit_reset(response)
+        bucket.pause(self.default_delay if delay is None else delay)
+        if attempt >= self.max_retries:
+            return False
+        if method not in self.retry_methods and retry_after is None:
+            return False
+        self.metrics.add(retries=1)
+        return True
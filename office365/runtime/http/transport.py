@@ -0,0 +1,162 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import DefaultCookiePolicy
+from typing import Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from office365.runtime.http.http_method import HttpMethod
+from office365.runtime.http.json_codec import JsonCodec
+from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.http.throttling import ThrottlingPolicy
+
+Timeout = Union[float, Tuple[float, float], None]
+
+
+class HttpTransport(object):
+    """Pooled HTTP transport which keeps connections alive between requests"""
+
+    def __init__(
+        self,
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=0,
+        timeout=None,
+        throttling=None,
+        json_codec=None,
+    ):
+        # type: (int, int, int, Timeout, Optional[ThrottlingPolicy], Optional[JsonCodec]) -> None
+        """
+        :param int pool_connections: The number of hosts to keep connection pools for
+        :param int pool_maxsize: The maximum number of connections to keep open per host
+        :param int max_retries: The maximum number of retries for failed connections
+        :param float or (float, float) or None timeout: Default socket timeout in seconds,
+            either a single value or a (connect, read) tuple. No timeout is applied if omitted
+        :param ThrottlingPolicy or None throttling: Throttling policy, if omitted throttled requests are not
+            resubmitted and their responses are returned as is
+        :param JsonCodec or None json_codec: Codec used to encode and decode JSON payloads,
+            defaults to the fastest one available
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.throttling = throttling
+        self.json_codec = json_codec or JsonCodec.default()
+        self._session = None  # type: Optional[requests.Session]
+        self._executor = None  # type: Optional[ThreadPoolExecutor]
+        self._lock = threading.Lock()
+
+    def __deepcopy__(self, memo):
+        """Transport is shared, not copied, between cloned contexts"""
+        return self
+
+    @property
+    def session(self):
+        # type: () -> requests.Session
+        """Lazily creates the underlying session"""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self):
+        # type: () -> requests.Session
+        session = requests.Session()
+        # authentication state is managed via explicit headers, never via the cookie jar
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self.max_retries,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def send(self, request):
+        # type: (RequestOptions) -> requests.Response
+        """
+        Submits the request over a pooled connection, if a throttling policy is configured, throttled requests
+        are resubmitted once the delay requested by the service has elapsed (see ThrottlingPolicy)
+        """
+        throttling = self.throttling
+        if throttling is None:
+            return self._send(request)
+        position = request.data.tell() if request.is_file else None
+        attempt = 0
+        while True:
+            throttling.acquire(request.url)
+            response = self._send(request)
+            if not throttling.process_response(
+                request.url, response, attempt, request.method
+            ):
+                return response
+            response.close()
+            if position is not None:
+                request.data.seek(position)
+            attempt += 1
+
+    def _send(self, request):
+        # type: (RequestOptions) -> requests.Response
+        kwargs = {
+            "headers": request.headers,
+            "auth": request.auth,
+            "verify": request.verify,
+            "proxies": request.proxies,
+            "timeout": request.timeout if request.timeout is not None else self.timeout,
+        }
+        method = request.method
+        if method == HttpMethod.Post:
+            if request.is_bytes or request.is_file:
+                kwargs["data"] = request.data
+            else:
+                kwargs["data"] = self._encode_json(request)
+        elif method == HttpMethod.Patch:
+            kwargs["data"] = self._encode_json(request)
+        elif method == HttpMethod.Put:
+            kwargs["data"] = request.data
+        elif method != HttpMethod.Delete:
+            method = HttpMethod.Get
+            kwargs["stream"] = request.stream
+        return self.session.request(method, request.url, **kwargs)
+
+    def _encode_json(self, request):
+        # type: (RequestOptions) -> Optional[bytes]
+        if request.data is None:
+            return None
+        if not any(k.lower() == "content-type" for k in request.headers):
+            request.headers["Content-Type"] = "application/json"
+        return self.json_codec.dumps(request.data)
+
+    async def send_async(self, request):
+        # type: (RequestOptions) -> requests.Response
+        """Submits the request without blocking the running event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.send, request)
+
+    @property
+    def executor(self):
+        # type: () -> ThreadPoolExecutor
+        """Workers which perform blocking socket I/O on behalf of the event loop, one per pooled connection"""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.pool_maxsize,
+                        thread_name_prefix="office365-http",
+                    )
+        return self._executor
+
+    def close(self):
+        """Releases pooled connections"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            if self._session is not None:
+                self._session.close()
+                self._session = None
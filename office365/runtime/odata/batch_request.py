@@ -0,0 +1,121 @@
+from abc import abstractmethod
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from requests import Response
+
+from office365.runtime.http.throttling import (
+    THROTTLED_STATUS_CODES,
+    parse_retry_after,
+)
+from office365.runtime.http.transport import HttpTransport
+from office365.runtime.odata.json_format import ODataJsonFormat
+from office365.runtime.odata.request import ODataRequest
+from office365.runtime.queries.batch import BatchQuery
+from office365.runtime.queries.client_query import ClientQuery
+
+
+class ODataBatchRequest(ODataRequest):
+    """Base batch request"""
+
+    def __init__(self, json_format, transport=None, max_retries=3):
+        # type: (ODataJsonFormat, Optional[HttpTransport], int) -> None
+        """
+        :param int max_retries: Number of times throttled sub-requests are resubmitted in a follow-up batch
+        """
+        super(ODataBatchRequest, self).__init__(json_format, transport)
+        self.max_retries = max_retries
+
+    @abstractmethod
+    def _extract_response(self, response, query):
+        # type: (Response, BatchQuery) -> Iterator[Tuple[ClientQuery, Response]]
+        """Splits a batch response into sub-responses"""
+        pass
+
+    def can_batch(self, query, batch):
+        # type: (ClientQuery, BatchQuery) -> bool
+        """Determines whether the query could be added into the batch"""
+        return True
+
+    def process_response(self, response, query):
+        # type: (Response, BatchQuery) -> None
+        """Parses an HTTP response."""
+        self.process_sub_responses(response, query, self._process_sub_response)
+
+    def process_sub_responses(self, response, query, action):
+        # type: (Response, BatchQuery, Callable[[ClientQuery, Response], None]) -> None
+        """
+        Processes sub-responses of a batch. Sub-requests which were throttled (see _should_retry)
+        are resubmitted in a follow-up batch once the delay specified via their Retry-After header has elapsed,
+        all the other sub-responses are processed via action.
+
+        If action or the follow-up batch fails, unprocessed queries stay pending the same way as if submitted
+        one by one.
+        """
+        attempt = 0
+        while True:
+            sub_responses = list(self._extract_response(response, query))
+            failed = []  # type: List[ClientQuery]
+            for index, (sub_qry, sub_resp) in enumerate(sub_responses):
+                if self._should_retry(
+                    query, sub_resp, attempt
+                ) or self._recover_sub_request(query, sub_qry, sub_resp, attempt):
+                    failed.append(sub_qry)
+                    continue
+                try:
+                    action(sub_qry, sub_resp)
+                except Exception:
+                    pending = failed + [q for q, _ in sub_responses[index + 1 :]]
+                    query.context._queries.extendleft(reversed(pending))
+                    raise
+            if not failed:
+                return
+            attempt += 1
+            query = query.subset(failed)
+            try:
+                response = self.execute_request_direct(self.build_request(query))
+            except Exception:
+                context = query.context
+                context._queries.extendleft(reversed(failed))
+                context._current_query = query
+                raise
+
+    def _process_sub_response(self, query, response):
+        # type: (ClientQuery, Response) -> None
+        response.raise_for_status()
+        super(ODataBatchRequest, self).process_response(response, query)
+
+    def _recover_sub_request(self, query, sub_query, response, attempt):
+        # type: (BatchQuery, ClientQuery, Response, int) -> bool
+        """
+        Determines whether the failure of the sub-request has been recovered (see ClientRequest.recoverFailure),
+        e.g. its expired form digest has been renewed, so that it could be resubmitted
+        """
+        if attempt >= self.max_retries or response.ok:
+            return False
+        request = query.build_sub_request(sub_query)
+        return any(handler(request, response) for handler in self.recoverFailure)
+
+    def _should_retry(self, query, response, attempt):
+        # type: (BatchQuery, Response, int) -> bool
+        """
+        Determines whether the sub-request is resubmitted, the service is suspended for the requested delay.
+
+        Only throttled (429, 503) sub-requests and server errors which specify Retry-After are resubmitted,
+        any other server error (e.g. an invalid field value) is surfaced right away. Sub-requests are resubmitted
+        only if a throttling policy is configured for the transport (see ClientRuntimeContext.with_throttling)
+        """
+        throttling = self.transport.throttling
+        if throttling is None or attempt >= min(
+            self.max_retries, throttling.max_retries
+        ):
+            return False
+        delay = parse_retry_after(response)
+        if response.status_code not in THROTTLED_STATUS_CODES and not (
+            response.status_code >= 500 and delay is not None
+        ):
+            return False
+        throttling.get_bucket(query.url).pause(
+            throttling.default_delay if delay is None else delay
+        )
+        throttling.metrics.add(throttled_responses=1, retries=1)
+        return True
@@ -0,0 +1,140 @@
+import codecs
+import json
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence
+
+
+class JsonStreamReader(object):
+    """
+    Incrementally parses a JSON document received in chunks, so that items of a (large) collection
+    could be processed one by one, without the whole document being loaded into memory
+    """
+
+    def __init__(self, chunks):
+        # type: (Iterable[bytes]) -> None
+        """
+        :param Iterable[bytes] chunks: UTF-8 encoded document, e.g. Response.iter_content()
+        """
+        self.document = {}  # type: Any
+        """Document without the items of the collection"""
+        self.collection_parent = None  # type: Optional[Dict[str, Any]]
+        """Object (within document) the collection is a member of, None if the collection was not found"""
+        self._chunks = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._json_decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def iter_items(self, collection_key, wrapper_keys=()):
+        # type: (str, Sequence[Optional[str]]) -> Iterator[Any]
+        """
+        Yields items of the array which is a member of the top level object (or of objects nested via wrapper keys)
+
+        :param str collection_key: Name of the member which holds the collection, e.g. value or results
+        :param list[str] wrapper_keys: Names of the members the collection is nested in, e.g. d
+        """
+        if self._peek() != "{":
+            self.document = self._read_value()
+            self._expect("")
+            return
+        self.document = {}
+        yield from self._iter_object(self.document, collection_key, wrapper_keys)
+        self._expect("")
+
+    def _iter_object(self, container, collection_key, wrapper_keys):
+        # type: (Dict[str, Any], str, Sequence[Optional[str]]) -> Iterator[Any]
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self._read_value()
+            self._expect(":")
+            found = self.collection_parent is not None
+            if not found and key == collection_key and self._peek() == "[":
+                self.collection_parent = container
+                yield from self._iter_array()
+            elif not found and key in wrapper_keys and self._peek() == "{":
+                container[key] = {}
+                yield from self._iter_object(
+                    container[key], collection_key, wrapper_keys
+                )
+            else:
+                container[key] = self._read_value()
+            if self._next_separator("}"):
+                return
+
+    def _iter_array(self):
+        # type: () -> Iterator[Any]
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._read_value()
+            if self._next_separator("]"):
+                return
+
+    def _next_separator(self, closing):
+        # type: (str) -> bool
+        """Consumes either a comma or the closing bracket, returns True once the container is closed"""
+        ch = self._peek()
+        if ch == closing:
+            self._pos += 1
+            return True
+        self._expect(",")
+        return False
+
+    def _expect(self, expected):
+        # type: (str) -> None
+        ch = self._peek()
+        if ch != expected:
+            message = "Expecting '{0}'".format(expected) if expected else "Extra data"
+            raise json.JSONDecodeError(message, self._buf, self._pos)
+        self._pos += len(ch)
+
+    def _peek(self):
+        # type: () -> str
+        """Skips whitespaces, returns the next character or an empty string at the end of document"""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def _read_value(self):
+        # type: () -> Any
+        self._peek()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # a number at the end of buffer might be continued in the next chunk
+            if (
+                end == len(self._buf)
+                and isinstance(value, (int, float))
+                and self._fill()
+            ):
+                continue
+            self._pos = end
+            return value
+
+    def _fill(self):
+        # type: () -> bool
+        """Reads the next chunk, the part of buffer which has already been parsed is released"""
+        if self._eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._eof = True
+            text = self._text_decoder.decode(b"", True)
+        else:
+            text = self._text_decoder.decode(chunk)
+        self._buf = self._buf[self._pos :] + text
+        self._pos = 0
+        return True
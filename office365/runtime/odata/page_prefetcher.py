@@ -0,0 +1,124 @@
+import copy
+import queue
+import threading
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from requests import HTTPError
+from typing_extensions import Self
+
+from office365.runtime.client_request_exception import ClientRequestException
+from office365.runtime.http.json_response import JsonResponse
+from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.queries.read_entity import ReadEntityQuery
+
+if TYPE_CHECKING:
+    from office365.runtime.client_object_collection import (  # noqa
+        ClientObjectCollection,
+    )
+
+
+class PagePrefetcher(object):
+    """
+    Retrieves the next pages of a collection on a background thread while the current page is being processed.
+
+    Requests are built (and authenticated) and pages are mapped into the collection on the calling thread,
+    the background thread only submits requests and decodes responses
+    """
+
+    _end = object()
+
+    def __init__(self, collection, depth=1):
+        # type: (ClientObjectCollection, int) -> None
+        """
+        :param ClientObjectCollection collection: Collection which is being retrieved in paged mode
+        :param int depth: Maximum number of pages retrieved ahead of the page which is being processed
+        """
+        self._collection = collection
+        self._client = collection.context.pending_request()
+        self._pages = queue.Queue(max(1, depth))  # type: queue.Queue[Any]
+        self._stopped = threading.Event()
+        self._template = None  # type: Optional[RequestOptions]
+
+    def start(self):
+        # type: () -> Self
+        """Starts retrieving pages which follow the current page of the collection"""
+        self._template = self._build_request()
+        worker = threading.Thread(
+            target=self._run, args=(self._collection._next_request_url,)
+        )
+        worker.daemon = True
+        worker.start()
+        return self
+
+    def stop(self):
+        """Stops the background thread, pages which have been retrieved but not processed are discarded"""
+        self._stopped.set()
+        while not self._pages.empty():
+            self._pages.get_nowait()
+
+    def iter_pages(self):
+        # type: () -> Iterator[None]
+        """Maps the next page into the collection once it has been received, yields once per page"""
+        collection = self._collection
+        while True:
+            collection._commit_checkpoint(collection.next_link_url)
+            page = self._pages.get()
+            if page is self._end:
+                return
+            elif isinstance(page, Exception):
+                raise page
+            response, payload = page
+            self._template = self._build_request()
+            self._client.process_response(
+                JsonResponse(
+                    response.status_code,
+                    response.headers,
+                    payload,
+                    self._client.transport.json_codec,
+                ),
+                ReadEntityQuery(collection),
+            )
+            collection.context._notify_detached(self._client.afterExecute, response)
+            collection._page_loaded.notify(collection)
+            yield
+
+    def _build_request(self):
+        # type: () -> RequestOptions
+        """
+        Builds a request for the next page, it serves as a template for requests of the following pages.
+        Handlers attached for the next request only are left to the queries queued by the caller
+        """
+        return self._collection.context._build_detached_request(
+            ReadEntityQuery(self._collection)
+        )
+
+    def _run(self, url):
+        # type: (Optional[str]) -> None
+        transport = self._client.transport
+        try:
+            while url and not self._stopped.is_set():
+                template = self._template
+                request = copy.copy(template)
+                request.url = url
+                request.headers = dict(template.headers)
+                response = transport.send(request)
+                response.raise_for_status()
+                payload = transport.json_codec.loads(response.content)
+                url = self._client.get_next_link_url(payload)
+                self._put((response, payload))
+            self._put(self._end)
+        except HTTPError as e:
+            self._put(ClientRequestException(*e.args, response=e.response))
+        # any error is raised on the calling thread, otherwise it would keep waiting for the next page
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self._put(e)
+
+    def _put(self, page):
+        # type: (Any) -> None
+        """Waits for a free slot unless iteration has been stopped"""
+        while not self._stopped.is_set():
+            try:
+                self._pages.put(page, timeout=0.1)
+                return
+            except queue.Full:
+                pass
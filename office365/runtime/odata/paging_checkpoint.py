@@ -0,0 +1,106 @@
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, Optional
+
+from office365.runtime.compat import parse_qs, urlparse
+
+
+def parse_skip_token(next_link_url):
+    # type: (Optional[str]) -> Optional[str]
+    """
+    Extracts the skip token from the url of the next page, e.g. Paged=TRUE&p_ID=100 (SharePoint paging info)
+    or an opaque token ($skiptoken / $skipToken) returned by Microsoft Graph
+    """
+    if not next_link_url:
+        return None
+    query = parse_qs(urlparse(next_link_url).query)
+    for name, values in query.items():
+        if name.lower() == "$skiptoken" and values:
+            return values[0]
+    return None
+
+
+class PagingCheckpoint(object):
+    """
+    Persistent continuation state of a paged collection, so that an interrupted enumeration could be resumed
+    from the page which follows the last processed one, e.g. by another process
+    """
+
+    def load(self):
+        # type: () -> Optional[Dict[str, Any]]
+        raise NotImplementedError
+
+    def save(self, state):
+        # type: (Dict[str, Any]) -> None
+        raise NotImplementedError
+
+    def clear(self):
+        """Discards the state once enumeration has been completed"""
+        raise NotImplementedError
+
+    def commit(self, next_link_url):
+        # type: (Optional[str]) -> None
+        """
+        Saves the url of the page to resume from, the state is discarded once there are no more pages
+
+        :param str or None next_link_url: Url of the next page (nextLink, __next)
+        """
+        if next_link_url is None:
+            self.clear()
+        else:
+            self.save(
+                {
+                    "nextLink": next_link_url,
+                    "skipToken": parse_skip_token(next_link_url),
+                    "committedAt": time.time(),
+                }
+            )
+
+    @property
+    def next_link_url(self):
+        # type: () -> Optional[str]
+        """Url of the page to resume from, None if there is nothing to resume"""
+        state = self.load()
+        return state.get("nextLink", None) if state else None
+
+
+class FilePagingCheckpoint(PagingCheckpoint):
+    """Stores the state in a JSON file, the file is replaced atomically so that a crash never leaves it partial"""
+
+    def __init__(self, path):
+        # type: (str) -> None
+        """
+        :param str path: Path to the checkpoint file
+        """
+        self.path = os.path.abspath(os.path.expanduser(path))
+
+    def load(self):
+        # type: () -> Optional[Dict[str, Any]]
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+        return state if isinstance(state, dict) else None
+
+    def save(self, state):
+        # type: (Dict[str, Any]) -> None
+        dir_name = os.path.dirname(self.path)
+        if not os.path.isdir(dir_name):
+            os.makedirs(dir_name, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=dir_name)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
@@ -1,15 +1,18 @@
-import copy
 from typing import Any, Iterator, Optional, Tuple
 
 import requests
 
 from office365.runtime.client_object import ClientObject
+from office365.runtime.client_object_collection import ClientObjectCollection
 from office365.runtime.client_request import ClientRequest
 from office365.runtime.client_result import ClientResult
 from office365.runtime.client_value import ClientValue
 from office365.runtime.http.http_method import HttpMethod
+from office365.runtime.http.json_response import JsonResponse
 from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.http.transport import HttpTransport
 from office365.runtime.odata.json_format import ODataJsonFormat
+from office365.runtime.odata.json_stream import JsonStreamReader
 from office365.runtime.odata.v3.json_light_format import JsonLightFormat
 from office365.runtime.queries.client_query import ClientQuery
 from office365.runtime.queries.create_entity import CreateEntityQuery
@@ -20,11 +23,13 @@ from office365.runtime.queries.update_entity import UpdateEntityQuery
 
 
 class ODataRequest(ClientRequest):
-    def __init__(self, json_format):
-        # type: (ODataJsonFormat) -> None
+    def __init__(self, json_format, transport=None):
+        # type: (ODataJsonFormat, Optional[HttpTransport]) -> None
         """Creates OData request"""
-        super(ODataRequest, self).__init__()
+        super(ODataRequest, self).__init__(transport)
         self._default_json_format = json_format
+        self.stream_chunk_size = 64 * 1024
+        """Number of bytes read at once while streamed responses are parsed"""
         self.beforeExecute += self._ensure_http_headers
 
     @property
@@ -44,11 +49,13 @@ class ODataRequest(ClientRequest):
             request.method = HttpMethod.Post
             if query.parameters_type is not None:
                 request.data = self._build_payload(query)
+        elif self._is_streamed(query):
+            request.stream = True
         return request
 
     def process_response(self, response, query):
         # type: (requests.Response, ClientQuery) -> None
-        json_format = copy.deepcopy(self.json_format)
+        json_format = self.json_format
         return_type = query.return_type
         if return_type is None:
             return
@@ -63,26 +70,95 @@ class ODataRequest(ClientRequest):
             if isinstance(return_type, ClientResult):
                 return_type.set_property("__value", response.content)
         else:
-            if isinstance(json_format, JsonLightFormat):
-                if isinstance(query, (ServiceOperationQuery, FunctionQuery)):
-                    json_format.function = query.name
+            function_name = None
+            if isinstance(query, (ServiceOperationQuery, FunctionQuery)):
+                function_name = query.name
+
+            if isinstance(response, JsonResponse):
+                self.map_json(response.body, return_type, json_format, function_name)
+            elif self._is_streamed(query) and response.raw is not None:
+                # responses of batch parts are not backed by a connection, their content is mapped as a whole
+                self._map_json_stream(response, return_type, json_format, function_name)
+            else:
+                self.map_json(
+                    self.transport.json_codec.loads(response.content),
+                    return_type,
+                    json_format,
+                    function_name,
+                )
+
+    @staticmethod
+    def _is_streamed(query):
+        # type: (ClientQuery) -> bool
+        return (
+            isinstance(query.return_type, ClientObjectCollection)
+            and query.return_type.streamed
+        )
+
+    def _map_json_stream(self, response, return_type, json_format, function_name=None):
+        # type: (requests.Response, ClientObjectCollection, ODataJsonFormat, Optional[str]) -> None
+        """
+        Maps collection items one by one while the response is being received,
+        so that neither the whole payload nor its parsed representation is kept in memory
+        """
+        reader = JsonStreamReader(response.iter_content(self.stream_chunk_size))
+        wrapper_keys = ()
+        if isinstance(json_format, JsonLightFormat):
+            wrapper_keys = (json_format.security, function_name)
+        try:
+            items = reader.iter_items(json_format.collection, wrapper_keys)
+            for index, item in enumerate(items):
+                if isinstance(item, dict):
+                    item = {
+                        k: v
+                        for k, v in self._next_property(
+                            item, json_format, function_name
+                        )
+                    }
+                return_type.set_property(index, item, False)
+        finally:
+            response.close()
 
-            self.map_json(response.json(), return_type, json_format)
+        if reader.collection_parent is None:
+            self.map_json(reader.document, return_type, json_format, function_name)
+        else:
+            next_link_url = reader.collection_parent.get(
+                json_format.collection_next, None
+            )
+            if next_link_url:
+                return_type.set_property("__nextLinkUrl", next_link_url, False)
+
+    def map_json(self, json, return_type, json_format=None, function_name=None):
+        # type: (Any, ClientValue | ClientResult | ClientObject, Optional[ODataJsonFormat], Optional[str]) -> None
+        """
+        Maps the JSON payload into return type
 
-    def map_json(self, json, return_type, json_format=None):
-        # type: (Any, ClientValue | ClientResult | ClientObject, Optional[ODataJsonFormat]) -> None
+        :param str or None function_name: Name of the invoked function (service operation), in JSON Light format
+            the result is wrapped into the member named after it
+        """
         if json_format is None:
             json_format = self.json_format
 
         if json and return_type is not None:
-            for k, v in self._next_property(json, json_format):
+            for k, v in self._next_property(json, json_format, function_name):
                 return_type.set_property(k, v, False)
 
-    def _next_property(self, json, json_format):
-        # type: (Any, ODataJsonFormat) -> Iterator[Tuple[str, Any]]
+    def get_next_link_url(self, json, json_format=None):
+        # type: (Any, Optional[ODataJsonFormat]) -> Optional[str]
+        """Returns the url of the next page of results for the collection payload, if any"""
+        if json_format is None:
+            json_format = self.json_format
+        if isinstance(json_format, JsonLightFormat) and isinstance(json, dict):
+            json = json.get(json_format.security, json)
+        if isinstance(json, dict):
+            return json.get(json_format.collection_next, None)
+        return None
+
+    def _next_property(self, json, json_format, function_name=None):
+        # type: (Any, ODataJsonFormat, Optional[str]) -> Iterator[Tuple[str, Any]]
         if isinstance(json_format, JsonLightFormat):
             json = json.get(json_format.security, json)
-            json = json.get(json_format.function, json)
+            json = json.get(function_name, json)
 
         if isinstance(json, dict):
             if isinstance(json.get(json_format.collection, None), list):
@@ -94,7 +170,12 @@ class ODataRequest(ClientRequest):
             if isinstance(json, list):
                 for index, item in enumerate(json):
                     if isinstance(item, dict):
-                        item = {k: v for k, v in self._next_property(item, json_format)}
+                        item = {
+                            k: v
+                            for k, v in self._next_property(
+                                item, json_format, function_name
+                            )
+                        }
                     yield index, item
             elif isinstance(json, dict):
                 for name, value in json.items():
@@ -108,7 +189,10 @@ class ODataRequest(ClientRequest):
                     if is_valid:
                         if isinstance(value, dict):
                             value = {
-                                k: v for k, v in self._next_property(value, json_format)
+                                k: v
+                                for k, v in self._next_property(
+                                    value, json_format, function_name
+                                )
                             }
                         yield name, value
                     elif name == "@odata.etag":
@@ -1,8 +1,23 @@
 import datetime
 import inspect
+import re
 import uuid
 from typing import Type
 
+_DATETIME_LITERAL = re.compile(
+    r"(\d{4})-(\d\d)-(\d\d)T(\d\d):(\d\d)(?::(\d\d)(?:\.(\d+))?)?(Z|[+-]\d\d:?\d\d)?$"
+)
+"""Edm.DateTime and Edm.DateTimeOffset literal, e.g. 2023-01-02T03:04:05.1234567+02:00"""
+
+_LEGACY_DATETIME_LITERAL = re.compile(r"/Date\((-?\d+)([+-]\d{4})?\)/$")
+"""Edm.DateTime literal of OData v2 (verbose) format, milliseconds since the epoch, e.g. /Date(1672628645000)/"""
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+_ZERO_OFFSET = datetime.timedelta(0)
+
+_utc_offsets = {}  # type: dict[str, datetime.timedelta]
+
 
 class ODataType(object):
     primitive_types = {
@@ -59,6 +74,9 @@ class ODataType(object):
         """
         Converts the specified string representation of an Edm.DateTime or Edm.DateTimeOffset to its datetime equivalent
 
+        Values are returned as naive datetimes in UTC, values with an explicit offset are converted to UTC,
+        values without offset are returned as is. Fractional seconds beyond microseconds (e.g. 7 digits) are truncated.
+
         :param str value: Represents date and time with values ranging from 12:00:00 midnight, January 1, 1753 A.D.
             through 11:59:59 P.M, December 9999 A.D.
         """
@@ -66,22 +84,52 @@ class ODataType(object):
             return None
         elif isinstance(value, datetime.datetime):
             return value
+        elif not isinstance(value, str):
+            return None
 
-        known_formats = [
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%dT%H:%M:%S.%fZ",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%dT%H:%M:%S.%f",
-        ]
-
-        result = None
-        for cur_format in known_formats:
-            try:
-                result = datetime.datetime.strptime(value, cur_format)
-                break
-            except ValueError:
-                pass
-        return result
+        match = _DATETIME_LITERAL.match(value)
+        if match is None:
+            return ODataType._try_parse_legacy_datetime(value)
+        year, month, day, hour, minute, second, fraction, offset = match.groups()
+        try:
+            return datetime.datetime(
+                int(year),
+                int(month),
+                int(day),
+                int(hour),
+                int(minute),
+                int(second) if second else 0,
+                int(fraction[:6].ljust(6, "0")) if fraction else 0,
+            ) - ODataType._parse_utc_offset(offset)
+        except (OverflowError, ValueError):
+            return None
+
+    @staticmethod
+    def _try_parse_legacy_datetime(value):
+        # type: (str) -> datetime.datetime | None
+        match = _LEGACY_DATETIME_LITERAL.match(value)
+        if match is None:
+            return None
+        milliseconds = match.group(1)
+        try:
+            # milliseconds are counted in UTC, the offset only denotes the original time zone
+            return _EPOCH + datetime.timedelta(milliseconds=int(milliseconds))
+        except OverflowError:
+            return None
+
+    @staticmethod
+    def _parse_utc_offset(value):
+        # type: (str | None) -> datetime.timedelta
+        """Parses offset from UTC, e.g. +02:00 or -0500, zero for UTC (Z suffix) or a missing offset"""
+        if not value or value == "Z":
+            return _ZERO_OFFSET
+        offset = _utc_offsets.get(value, None)
+        if offset is None:
+            minutes = int(value[1:3]) * 60 + int(value[-2:])
+            if value[0] == "-":
+                minutes = -minutes
+            offset = _utc_offsets[value] = datetime.timedelta(minutes=minutes)
+        return offset
 
     @staticmethod
     def resolve_type(client_type):
@@ -1,4 +1,3 @@
-import json
 import re
 from email.message import Message
 from typing import AnyStr, Iterator, List, Tuple
@@ -13,12 +12,14 @@ from office365.runtime.compat import (
 )
 from office365.runtime.http.http_method import HttpMethod
 from office365.runtime.http.request_options import RequestOptions
-from office365.runtime.odata.request import ODataRequest
-from office365.runtime.queries.batch import BatchQuery, create_boundary
+from office365.runtime.odata.batch_request import ODataBatchRequest
+from office365.runtime.queries.batch import BatchQuery, create_boundary, is_batchable
 from office365.runtime.queries.client_query import ClientQuery
+from office365.runtime.queries.function import FunctionQuery
+from office365.runtime.queries.read_entity import ReadEntityQuery
 
 
-class ODataBatchV3Request(ODataRequest):
+class ODataBatchV3Request(ODataBatchRequest):
     def build_request(self, query):
         # type: (BatchQuery) -> RequestOptions
         """Construct a OData v3 Batch request"""
@@ -32,12 +33,20 @@ class ODataBatchV3Request(ODataRequest):
         request.data = self._prepare_payload(query)
         return request
 
-    def process_response(self, response, query):
-        # type: (Response, BatchQuery) -> None
-        """Parses an HTTP response."""
-        for sub_qry, sub_resp in self._extract_response(response, query):
-            sub_resp.raise_for_status()
-            super(ODataBatchV3Request, self).process_response(sub_resp, sub_qry)
+    def can_batch(self, query, batch):
+        # type: (ClientQuery, BatchQuery) -> bool
+        """
+        Determines whether the query could be added into the batch.
+
+        Modifications are grouped into a single change set which is executed ahead of reads and could not contain
+        GET requests, hence a batch consists of either read or modification queries only.
+        """
+        if not is_batchable(query) or isinstance(query, FunctionQuery):
+            return False
+        if len(batch.queries) == 0:
+            return True
+        is_read = isinstance(query, ReadEntityQuery)
+        return is_read == isinstance(batch.queries[0], ReadEntityQuery)
 
     def _extract_response(self, response, query):
         # type: (Response, BatchQuery) -> Iterator[Tuple[ClientQuery, Response]]
@@ -68,13 +77,13 @@ class ODataBatchV3Request(ODataRequest):
             change_set_message.set_boundary(change_set_boundary)
 
             for qry in query.change_sets:
-                request = qry.build_request()
+                request = query.build_sub_request(qry)
                 message = self._serialize_request(request)
                 change_set_message.attach(message)
             main_message.attach(change_set_message)
 
         for qry in query.get_queries:
-            request = qry.build_request()
+            request = query.build_sub_request(qry)
             message = self._serialize_request(request)
             main_message.attach(message)
 
@@ -108,8 +117,7 @@ class ODataBatchV3Request(ODataRequest):
             resp.headers = self._normalize_headers(lines[1:-1])
         return resp
 
-    @staticmethod
-    def _serialize_request(request):
+    def _serialize_request(self, request):
         # type: (RequestOptions) -> Message
         """Serializes a part of a batch request to a string. A part can be either a GET request or
         a change set grouping several CUD (create, update, delete) requests.
@@ -123,7 +131,7 @@ class ODataBatchV3Request(ODataRequest):
         ]
         if request.data:
             lines.append(eol)
-            lines.append(json.dumps(request.data))
+            lines.append(self.transport.json_codec.dumps(request.data).decode("utf-8"))
         raw_content = eol + eol.join(lines) + eol
         payload = raw_content.encode("utf-8").lstrip()
 
@@ -7,7 +7,6 @@ class JsonLightFormat(ODataJsonFormat):
 
     def __init__(self, metadata_level=ODataV3MetadataLevel.Verbose):
         super(JsonLightFormat, self).__init__(metadata_level)
-        self.function = None
 
     @property
     def security(self):
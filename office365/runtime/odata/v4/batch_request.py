@@ -1,17 +1,16 @@
-import json
 from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from requests import Response
-from requests.structures import CaseInsensitiveDict
 
 from office365.runtime.http.http_method import HttpMethod
+from office365.runtime.http.json_response import JsonResponse
 from office365.runtime.http.request_options import RequestOptions
-from office365.runtime.odata.request import ODataRequest
-from office365.runtime.queries.batch import BatchQuery
+from office365.runtime.odata.batch_request import ODataBatchRequest
+from office365.runtime.queries.batch import BatchQuery, is_batchable
 from office365.runtime.queries.client_query import ClientQuery
 
 
-class ODataV4BatchRequest(ODataRequest):
+class ODataV4BatchRequest(ODataBatchRequest):
     """JSON batch request"""
 
     def build_request(self, query):
@@ -24,25 +23,28 @@ class ODataV4BatchRequest(ODataRequest):
         request.data = self._prepare_payload(query)
         return request
 
-    def process_response(self, response, query):
-        # type: (Response, BatchQuery) -> None
-        """Parses an HTTP response."""
-        for sub_qry, sub_resp in self._extract_response(response, query):
-            sub_resp.raise_for_status()
-            super(ODataV4BatchRequest, self).process_response(sub_resp, sub_qry)
+    def can_batch(self, query, batch):
+        # type: (ClientQuery, BatchQuery) -> bool
+        """Determines whether the query could be added into the batch"""
+        return is_batchable(query)
 
-    @staticmethod
-    def _extract_response(response, query):
+    def _extract_response(self, response, query):
         # type: (Response, BatchQuery) -> Iterator[Tuple[ClientQuery, Response]]
-        """ """
-        json_responses = response.json()
-        for json_resp in json_responses["responses"]:
-            resp = Response()
-            resp.status_code = int(json_resp["status"])
-            resp.headers = CaseInsensitiveDict(json_resp["headers"])
-            resp._content = json.dumps(json_resp["body"]).encode("utf-8")
+        """Splits the batch response, bodies of sub-responses are passed along decoded"""
+        json_codec = self.transport.json_codec
+        json_responses = json_codec.loads(response.content)
+        # responses are returned in any order, sub-requests are identified by their index
+        for json_resp in sorted(
+            json_responses["responses"], key=lambda r: int(r["id"])
+        ):
+            resp = JsonResponse(
+                int(json_resp["status"]),
+                json_resp.get("headers", None),
+                json_resp.get("body", None),
+                json_codec,
+            )
             qry_id = int(json_resp["id"])
-            qry = query.ordered_queries[qry_id]
+            qry = query.queries[qry_id]
             yield qry, resp
 
     def _prepare_payload(self, query):
@@ -51,15 +53,15 @@ class ODataV4BatchRequest(ODataRequest):
         requests_json = []
         for qry in query.queries:
             qry_id = str(len(requests_json))
-            requests_json.append(self._normalize_request(qry, qry_id))
+            requests_json.append(self._normalize_request(query, qry, qry_id))
 
         return {"requests": requests_json}
 
     @staticmethod
-    def _normalize_request(query, query_id, depends_on=None):
-        # type: (ClientQuery, str, Optional[List[str]]) -> Dict[str, Any]
+    def _normalize_request(batch, query, query_id, depends_on=None):
+        # type: (BatchQuery, ClientQuery, str, Optional[List[str]]) -> Dict[str, Any]
         """ """
-        request = query.build_request()
+        request = batch.build_sub_request(query)
 
         request_json = {
             "id": query_id,
@@ -1,6 +1,6 @@
 import os
 import typing
-from typing import Callable
+from typing import Callable, Optional
 
 import requests
 from typing_extensions import Self
@@ -8,13 +8,14 @@ from typing_extensions import Self
 from office365.runtime.client_request import ClientRequest
 from office365.runtime.http.http_method import HttpMethod
 from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.http.transport import HttpTransport
 from office365.runtime.queries.upload_session import UploadSessionQuery
 
 
 class UploadSessionRequest(ClientRequest):
-    def __init__(self, file_object, chunk_size, chunk_uploaded=None):
-        # type: (typing.IO, int, Callable[[int], None]) -> None
-        super(UploadSessionRequest, self).__init__()
+    def __init__(self, file_object, chunk_size, chunk_uploaded=None, transport=None):
+        # type: (typing.IO, int, Callable[[int], None], Optional[HttpTransport]) -> None
+        super(UploadSessionRequest, self).__init__(transport)
         self._file_object = file_object
         self._chunk_size = chunk_size
         self._chunk_uploaded = chunk_uploaded
@@ -1,4 +1,4 @@
-from typing import Iterator
+from typing import Iterator, Optional, Tuple
 
 
 class ResourcePath(object):
@@ -8,12 +8,18 @@ class ResourcePath(object):
         # type: (int|str, "ResourcePath") -> None
         self._key = key
         self._parent = parent
+        self._url_cache = None  # type: Optional[Tuple[Optional[str], str]]
 
     def patch(self, key):
         if self._key is None:
             self._key = key
+            self.invalidate()
         return self
 
+    def invalidate(self):
+        """Discards the url built for the path, it has to be called once the path has been modified"""
+        self._url_cache = None
+
     def __iter__(self):
         # type: () -> Iterator["ResourcePath"]
         current = self
@@ -28,17 +34,31 @@ class ResourcePath(object):
         return self.to_url()
 
     def __eq__(self, other):
+        if not isinstance(other, ResourcePath):
+            return NotImplemented
         return self.to_url() == other.to_url()
 
+    def __hash__(self):
+        return hash(self.to_url())
+
     def to_url(self):
         # type: () -> str
-        """Builds url"""
-        segments = []
-        for path in self:
-            segments.insert(0, path.segment)
-            if path.delimiter:
-                segments.insert(0, path.delimiter)
-        return "".join(segments)
+        """
+        Builds url, the url is cached along with the url of parent it has been built from,
+        so that it is only rebuilt once the path (or any of its parents) has been modified
+        """
+        parent = self.parent
+        parent_url = parent.to_url() if parent is not None else None
+        cache = self._url_cache
+        if cache is not None and cache[0] is parent_url:
+            return cache[1]
+        url = (parent_url or "") + (self.delimiter or "") + self.segment
+        self._url_cache = (parent_url, url)
+        return url
+
+    @property
+    def key(self):
+        return self._key
 
     @property
     def parent(self):
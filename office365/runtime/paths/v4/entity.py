@@ -32,4 +32,5 @@ class EntityPath(ResourcePath):
         self._key = key
         self._parent = self.collection
         self.__class__ = EntityPath
+        self.invalidate()
         return self
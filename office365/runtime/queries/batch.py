@@ -1,7 +1,8 @@
 import uuid
-from typing import List
+from typing import Dict, List
 
 from office365.runtime.client_runtime_context import ClientRuntimeContext
+from office365.runtime.http.request_options import RequestOptions
 from office365.runtime.queries.client_query import ClientQuery
 from office365.runtime.queries.read_entity import ReadEntityQuery
 
@@ -18,6 +19,31 @@ def create_boundary(prefix, compact=False):
         return prefix + str(uuid.uuid4())
 
 
+def is_batchable(query):
+    # type: (ClientQuery) -> bool
+    """
+    Determines whether a query could be submitted as a part of batch request.
+    Queries which upload or download binary content, or read a collection in streaming mode,
+    are submitted individually.
+    """
+    from office365.runtime.client_object_collection import ClientObjectCollection
+    from office365.runtime.queries.function import FunctionQuery
+    from office365.runtime.queries.service_operation import ServiceOperationQuery
+
+    if isinstance(query, BatchQuery):
+        return False
+    return_type = query.return_type
+    if isinstance(return_type, ClientObjectCollection) and return_type.streamed:
+        return False
+    payload = query.parameters_type
+    if isinstance(payload, (bytes, bytearray)) or hasattr(payload, "read"):
+        return False
+    if isinstance(query, (FunctionQuery, ServiceOperationQuery)):
+        name = query.name or ""
+        return not (name == "$value" or name.startswith("content"))
+    return True
+
+
 class BatchQuery(ClientQuery):
     """Client query collection"""
 
@@ -28,11 +54,31 @@ class BatchQuery(ClientQuery):
         if queries is None:
             queries = []
         self._queries = queries
+        self._sub_requests = {}  # type: Dict[int, RequestOptions]
 
     def add(self, query):
         # type: (ClientQuery) -> None
         self._queries.append(query)
 
+    def build_sub_request(self, query):
+        # type: (ClientQuery) -> RequestOptions
+        """Builds a request for a query within the batch, the request is built once and reused if resubmitted"""
+        request = self._sub_requests.get(query.id, None)
+        if request is None:
+            request = self._sub_requests[query.id] = query.build_request()
+        return request
+
+    def subset(self, queries):
+        # type: (List[ClientQuery]) -> "BatchQuery"
+        """Creates a batch query for the specified queries (of this batch) to be resubmitted"""
+        qry = BatchQuery(self.context, list(queries))
+        qry._sub_requests = {
+            q.id: self._sub_requests[q.id]
+            for q in queries
+            if q.id in self._sub_requests
+        }
+        return qry
+
     @property
     def ordered_queries(self):
         return self.change_sets + self.get_queries
@@ -0,0 +1,103 @@
+from collections import deque
+from typing import Any, Deque, Set, Tuple
+
+from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.queries.client_query import ClientQuery
+from office365.runtime.queries.read_entity import ReadEntityQuery
+
+
+class QueryFootprint(object):
+    """Client objects and resource paths a query reads from or writes to"""
+
+    def __init__(self, query):
+        # type: (ClientQuery) -> None
+        from office365.runtime.client_object import ClientObject
+
+        self.query = query
+        self.is_read = isinstance(query, ReadEntityQuery)
+        self.is_resolved = True
+        self.objects = set()  # type: Set[int]
+        self.targets = set()  # type: Set[int]
+        self.chain = set()  # type: Set[int]
+        for obj in (query.binding_type, query.return_type):
+            if obj is None:
+                continue
+            self.objects.add(id(obj))
+            if isinstance(obj, ClientObject) and obj.resource_path is not None:
+                self.targets.add(id(obj.resource_path))
+                for path in obj.resource_path:
+                    self.chain.add(id(path))
+                    # the address of a resource is only known once its path (up to the root) is resolved
+                    if path.key is None and obj is query.binding_type:
+                        self.is_resolved = False
+
+    def depends_on(self, other):
+        # type: ("QueryFootprint") -> bool
+        """
+        Determines whether the query has to wait for the other (earlier) query to complete.
+
+        Only reads of resolved, unrelated resources are considered independent, any modification,
+        service operation or a read of the same (or a parent) resource is treated as a dependency.
+        """
+        if not (self.is_read and other.is_read):
+            return True
+        return self.conflicts_with(other)
+
+    def conflicts_with(self, other):
+        # type: ("QueryFootprint") -> bool
+        """
+        Determines whether both queries address the same (or a parent) resource, or whether the address of any of them
+        is not resolved yet, regardless of whether the queries read or modify resources
+        """
+        if not (self.is_resolved and other.is_resolved):
+            return True
+        if self.objects & other.objects:
+            return True
+        return bool(self.targets & other.chain or other.targets & self.chain)
+
+
+class QueryScheduler(object):
+    """Tracks queries in flight and decides which pending query could be submitted next"""
+
+    def __init__(self, max_in_flight):
+        # type: (int) -> None
+        """
+        :param int max_in_flight: Maximum number of queries submitted but not yet processed
+        """
+        self.max_in_flight = max_in_flight
+        self._in_flight = (
+            deque()
+        )  # type: Deque[Tuple[QueryFootprint, Any, RequestOptions]]
+
+    def __len__(self):
+        return len(self._in_flight)
+
+    def can_dispatch(self, query):
+        # type: (ClientQuery) -> bool
+        """
+        Queries are dispatched in queue order, so the next one is only submitted once it does not
+        depend on any query which is still in flight
+        """
+        if len(self._in_flight) == 0:
+            return True
+        if len(self._in_flight) >= self.max_in_flight:
+            return False
+        footprint = QueryFootprint(query)
+        return not any(footprint.depends_on(f) for f, _, _ in self._in_flight)
+
+    def add(self, query, future, request):
+        # type: (ClientQuery, Any, RequestOptions) -> None
+        """Registers a submitted query along with its request and the future of its response"""
+        self._in_flight.append((QueryFootprint(query), future, request))
+
+    def pop(self):
+        # type: () -> Tuple[ClientQuery, Any, RequestOptions]
+        """Returns the earliest submitted query, responses are processed in the order of submission"""
+        footprint, future, request = self._in_flight.popleft()
+        return footprint.query, future, request
+
+    def cancel(self):
+        """Cancels queries which are still in flight"""
+        while self._in_flight:
+            _, future, _ = self._in_flight.popleft()
+            future.cancel()
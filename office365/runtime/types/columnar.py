@@ -0,0 +1,253 @@
+import array
+import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+from office365.runtime.odata.type import ODataType
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+class Column(object):
+    """
+    Column of values backed by a typed array, so that it could be exported via the buffer protocol (or to Arrow)
+    without per value objects being kept in memory.
+
+    Integers are stored as int64, floats as float64, booleans as uint8, datetimes as int64 microseconds
+    since the epoch (UTC), strings as int32 codes into a dictionary of distinct values,
+    values of any other type (or columns of mixed types) are kept in a list
+    """
+
+    BOOLEAN = "bool"
+    INT64 = "int64"
+    FLOAT64 = "float64"
+    DATETIME = "datetime"
+    STRING = "string"
+    OBJECT = "object"
+
+    def __init__(self, name):
+        # type: (str) -> None
+        self.name = name
+        self.kind = None  # type: Optional[str]
+        """Kind of values, resolved once the first non-null value is appended"""
+        self.values = None  # type: Optional[Union[array.array, List[Any]]]
+        """Values (dictionary codes for strings), slots of null values are zeroed"""
+        self.validity = bytearray()
+        """Determines whether the value at the position is not null (1) or null (0)"""
+        self.dictionary = []  # type: List[str]
+        """Distinct values of a string column"""
+        self.null_count = 0
+        self._codes = {}  # type: Dict[str, int]
+
+    def __len__(self):
+        # type: () -> int
+        return len(self.validity)
+
+    def __iter__(self):
+        # type: () -> Iterator[Any]
+        for index in range(len(self.validity)):
+            yield self[index]
+
+    def __getitem__(self, index):
+        # type: (int) -> Any
+        if not self.validity[index]:
+            return None
+        value = self.values[index]
+        if self.kind == self.BOOLEAN:
+            return bool(value)
+        elif self.kind == self.DATETIME:
+            return _EPOCH + value * _MICROSECOND
+        elif self.kind == self.STRING:
+            return self.dictionary[value]
+        return value
+
+    def append(self, value):
+        # type: (Any) -> None
+        if value is None:
+            self.null_count += 1
+            if self.kind is not None:
+                self._append_default()
+            self.validity.append(0)
+            return
+        if self.kind is None:
+            self._init_kind(value)
+        if not self._append_value(value):
+            self._widen(value)
+            self._append_value(value)
+        self.validity.append(1)
+
+    def to_pylist(self):
+        # type: () -> List[Any]
+        return list(self)
+
+    def to_arrow(self):
+        """
+        Converts the column into pyarrow.Array, values are copied so that the column could still be appended to
+        """
+        import pyarrow as pa  # pylint: disable=import-error
+
+        length = len(self.validity)
+        if self.kind is None:
+            return pa.nulls(length)
+        elif self.kind == self.OBJECT:
+            try:
+                return pa.array(self.values)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # values of mixed types are exported as their string representation
+                return pa.array(
+                    [None if v is None else str(v) for v in self.values], pa.string()
+                )
+
+        # the buffer of array.array (if exported without copying) would block any further append
+        buffers = [self._validity_bitmap(), pa.py_buffer(self.values.tobytes())]
+        if self.kind == self.STRING:
+            indices = pa.Array.from_buffers(
+                pa.int32(), length, buffers, null_count=self.null_count
+            )
+            return pa.DictionaryArray.from_arrays(
+                indices, pa.array(self.dictionary, pa.string())
+            )
+        elif self.kind == self.BOOLEAN:
+            return pa.Array.from_buffers(
+                pa.uint8(), length, buffers, null_count=self.null_count
+            ).cast(pa.bool_())
+        arrow_types = {
+            self.INT64: pa.int64(),
+            self.FLOAT64: pa.float64(),
+            self.DATETIME: pa.timestamp("us", tz="UTC"),
+        }
+        return pa.Array.from_buffers(
+            arrow_types[self.kind], length, buffers, null_count=self.null_count
+        )
+
+    def _validity_bitmap(self):
+        # type: () -> Optional[bytes]
+        """Packs validity into a bitmap (least significant bit first), None if there are no nulls"""
+        if self.null_count == 0:
+            return None
+        import pyarrow as pa  # pylint: disable=import-error
+
+        bitmap = bytearray(b"\xff" * ((len(self.validity) + 7) // 8))
+        index = self.validity.find(0)
+        while index != -1:
+            bitmap[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+            index = self.validity.find(0, index + 1)
+        return pa.py_buffer(bytes(bitmap))
+
+    def _init_kind(self, value):
+        # type: (Any) -> None
+        if isinstance(value, bool):
+            self.kind, self.values = self.BOOLEAN, array.array("B")
+        elif isinstance(value, int):
+            self.kind, self.values = self.INT64, array.array("q")
+        elif isinstance(value, float):
+            self.kind, self.values = self.FLOAT64, array.array("d")
+        elif isinstance(value, datetime.datetime) or (
+            isinstance(value, str) and ODataType.try_parse_datetime(value) is not None
+        ):
+            self.kind, self.values = self.DATETIME, array.array("q")
+        elif isinstance(value, str):
+            self.kind, self.values = self.STRING, array.array("i")
+        else:
+            self.kind, self.values = self.OBJECT, []
+        for _ in range(len(self.validity)):
+            self._append_default()
+
+    def _append_default(self):
+        self.values.append(None if self.kind == self.OBJECT else 0)
+
+    def _append_value(self, value):
+        # type: (Any) -> bool
+        """Appends the value, returns False if it could not be stored in the column of the current kind"""
+        if self.kind == self.OBJECT:
+            self.values.append(value)
+            return True
+        if self.kind == self.DATETIME and isinstance(value, str):
+            value = ODataType.try_parse_datetime(value)
+        if not self._accepts(value):
+            return False
+        if self.kind == self.INT64:
+            try:
+                self.values.append(value)
+            except OverflowError:
+                return False
+        elif self.kind == self.FLOAT64:
+            self.values.append(float(value))
+        elif self.kind == self.DATETIME:
+            if value.tzinfo is not None:
+                value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+            self.values.append((value - _EPOCH) // _MICROSECOND)
+        elif self.kind == self.STRING:
+            code = self._codes.get(value, None)
+            if code is None:
+                code = self._codes[value] = len(self.dictionary)
+                self.dictionary.append(value)
+            self.values.append(code)
+        else:
+            self.values.append(value)
+        return True
+
+    def _accepts(self, value):
+        # type: (Any) -> bool
+        """Determines whether the value could be stored in the column of the current (typed) kind"""
+        if self.kind == self.BOOLEAN:
+            return isinstance(value, bool)
+        elif isinstance(value, bool):
+            return False
+        elif self.kind == self.INT64:
+            return isinstance(value, int)
+        elif self.kind == self.FLOAT64:
+            return isinstance(value, (int, float))
+        elif self.kind == self.DATETIME:
+            return isinstance(value, datetime.datetime)
+        return isinstance(value, str)
+
+    def _widen(self, value):
+        # type: (Any) -> None
+        """Converts the column so that the value (of another type) could be stored"""
+        if self.kind == self.INT64 and isinstance(value, float):
+            self.kind, self.values = self.FLOAT64, array.array("d", self.values)
+        else:
+            self.values = self.to_pylist()
+            self.kind = self.OBJECT
+            self.dictionary = []
+            self._codes = {}
+
+
+class ColumnarTable(object):
+    """Accumulates rows into column-oriented buffers, see Column"""
+
+    def __init__(self, names):
+        # type: (Sequence[str]) -> None
+        self.names = list(names)
+        self.columns = [Column(name) for name in self.names]
+
+    def __len__(self):
+        # type: () -> int
+        return len(self.columns[0]) if self.columns else 0
+
+    def __getitem__(self, name):
+        # type: (str) -> Column
+        return self.columns[self.names.index(name)]
+
+    def append(self, values):
+        # type: (Sequence[Any]) -> None
+        """Appends a row, values are specified in the order of columns"""
+        for column, value in zip(self.columns, values):
+            column.append(value)
+
+    def to_pydict(self):
+        # type: () -> Dict[str, List[Any]]
+        return {column.name: column.to_pylist() for column in self.columns}
+
+    def to_arrow(self):
+        """Converts the table into pyarrow.Table (requires pyarrow package)"""
+        import pyarrow as pa  # pylint: disable=import-error
+
+        return pa.Table.from_arrays(
+            [column.to_arrow() for column in self.columns], names=self.names
+        )
+
+    def to_pandas(self):
+        """Converts the table into pandas.DataFrame (requires pyarrow and pandas packages)"""
+        return self.to_arrow().to_pandas()
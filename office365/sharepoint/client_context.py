@@ -1,12 +1,13 @@
 import copy
 from typing import Callable, List, Optional
 
-from requests import RequestException
+import requests
 from typing_extensions import Self
 
 from office365.runtime.auth.authentication_context import AuthenticationContext
 from office365.runtime.auth.client_credential import ClientCredential
 from office365.runtime.auth.token_response import TokenResponse
+from office365.runtime.auth.token_store import TokenStore
 from office365.runtime.auth.user_credential import UserCredential
 from office365.runtime.client_object import ClientObject
 from office365.runtime.client_result import ClientResult
@@ -21,6 +22,10 @@ from office365.runtime.paths.resource_path import ResourcePath
 from office365.runtime.queries.delete_entity import DeleteEntityQuery
 from office365.runtime.queries.update_entity import UpdateEntityQuery
 from office365.runtime.types.event_handler import EventHandler
+from office365.sharepoint.internal.form_digest_manager import (
+    FORM_DIGEST_EXPIRED_ERRORS,
+    FormDigestManager,
+)
 from office365.sharepoint.portal.groups.site_info import GroupSiteInfo
 from office365.sharepoint.portal.sites.creation_response import SPSiteCreationResponse
 from office365.sharepoint.portal.sites.status import SiteStatus
@@ -56,7 +61,10 @@ class ClientContext(ClientRuntimeContext):
         self._web = None
         self._site = None
         self._ctx_web_info = None
+        self._form_digest_manager = None  # type: Optional[FormDigestManager]
+        self._json_format = JsonLightFormat()
         self._pending_request = None
+        self._batch_request = None
 
     @staticmethod
     def from_url(full_url):
@@ -197,6 +205,17 @@ class ClientContext(ClientRuntimeContext):
         )
         return self
 
+    def with_token_store(self, store):
+        # type: (TokenStore) -> Self
+        """
+        Persists tokens (or authentication cookies) in a store shared between processes,
+        valid ones are reused instead of being acquired by every process
+
+        :param TokenStore store: Token store, e.g. FileTokenStore
+        """
+        self.authentication_context.with_token_store(store)
+        return self
+
     def execute_batch(self, items_per_batch=100, success_callback=None):
         # type: (int, Callable[[List[ClientObject|ClientResult]], None]) -> Self
         """
@@ -204,9 +223,7 @@ class ClientContext(ClientRuntimeContext):
         :param int items_per_batch: Maximum to be selected for bulk operation
         :param (List[ClientObject|ClientResult])-> None success_callback: A success callback
         """
-        batch_request = ODataBatchV3Request(JsonLightFormat())
-        batch_request.beforeExecute += self._authenticate_request
-        batch_request.beforeExecute += self._ensure_form_digest
+        batch_request = self.batch_request()
         while self.has_pending_request:
             qry = self._get_next_query(items_per_batch)
             batch_request.execute_query(qry)
@@ -214,23 +231,70 @@ class ClientContext(ClientRuntimeContext):
                 success_callback(qry.return_type)
         return self
 
+    def with_auto_batch(self, items_per_batch=100):
+        # type: (int) -> Self
+        """
+        Enables transparent batching mode: execute_query coalesces independent pending queries into
+        batch requests
+
+        :param int items_per_batch: Maximum number of queries per batch request, 0 disables batching
+        """
+        return super(ClientContext, self).with_auto_batch(items_per_batch)
+
+    def batch_request(self):
+        """Provides access to underlying batch request instance"""
+        if self._batch_request is None:
+            self._batch_request = ODataBatchV3Request(JsonLightFormat(), self.transport)
+            self._batch_request.beforeExecute += self._authenticate_request
+            self._batch_request.beforeExecute += self._ensure_form_digest
+            self._batch_request.recoverFailure += self._recover_form_digest
+        return self._batch_request
+
     def pending_request(self):
         """Provides access to underlying request instance"""
         if self._pending_request is None:
-            self._pending_request = ODataRequest(JsonLightFormat())
+            self._pending_request = ODataRequest(self._json_format, self.transport)
             self._pending_request.beforeExecute += self._authenticate_request
             self._pending_request.beforeExecute += self._build_modification_query
+            self._pending_request.recoverFailure += self._recover_form_digest
         return self._pending_request
 
+    @property
+    def form_digest_manager(self):
+        # type: () -> FormDigestManager
+        """Form digests are shared by all contexts in the process which address the same site"""
+        if self._form_digest_manager is None:
+            self._form_digest_manager = FormDigestManager.default()
+        return self._form_digest_manager
+
+    @property
+    def _form_digest_key(self):
+        return FormDigestManager.build_key(
+            self.base_url, self.authentication_context.identity
+        )
+
     def _ensure_form_digest(self, request):
         # type: (RequestOptions) -> None
-        if not self.context_info.is_valid:
-            self._ctx_web_info = self._get_context_web_information()
+        self._ctx_web_info = self.form_digest_manager.get(
+            self._form_digest_key, self._get_context_web_information
+        )
         request.set_header("X-RequestDigest", self._ctx_web_info.FormDigestValue)
 
+    def _recover_form_digest(self, request, response):
+        # type: (RequestOptions, requests.Response) -> bool
+        """Renews the digest once it has been rejected as expired, so that the request could be resubmitted"""
+        digest_value = request.headers.get("X-RequestDigest", None)
+        if response.status_code != 403 or digest_value is None:
+            return False
+        if not any(e in response.text for e in FORM_DIGEST_EXPIRED_ERRORS):
+            return False
+        self.form_digest_manager.invalidate(self._form_digest_key, digest_value)
+        self._ensure_form_digest(request)
+        return True
+
     def _get_context_web_information(self):
         """Returns an ContextWebInformation object that specifies metadata about the site"""
-        client = ODataRequest(JsonLightFormat())
+        client = ODataRequest(JsonLightFormat(), self.transport)
         client.beforeExecute += self._authenticate_request
         for e in self.pending_request().beforeExecute:
             if not EventHandler.is_system(e):
@@ -238,32 +302,22 @@ class ClientContext(ClientRuntimeContext):
         request = RequestOptions("{0}/contextInfo".format(self.service_root_url()))
         request.method = HttpMethod.Post
         response = client.execute_request_direct(request)
-        json_format = JsonLightFormat()
-        json_format.function = "GetContextWebInformation"
         return_value = ContextWebInformation()
-        client.map_json(response.json(), return_value, json_format)
+        client.map_json(
+            client.transport.json_codec.loads(response.content),
+            return_value,
+            function_name="GetContextWebInformation",
+        )
         return return_value
 
     def execute_query_with_incremental_retry(self, max_retry=5):
-        """Handles throttling requests."""
-        settings = {"timeout": 0}
-
-        def _try_process_if_failed(retry, ex):
-            # type: (int, RequestException) -> None
-            """
-            check if request was throttled - http status code 429
-            or check is request failed due to server unavailable - http status code 503
-            """
-            if ex.response.status_code == 429 or ex.response.status_code == 503:
-                retry_after = ex.response.headers.get("Retry-After", None)
-                if retry_after is not None:
-                    settings["timeout"] = int(retry_after)
-
-        self.execute_query_retry(
-            timeout_secs=settings.get("timeout"),
-            max_retry=max_retry,
-            failure_callback=_try_process_if_failed,
-        )
+        """
+        Handles throttling requests.
+
+        Requests which were throttled (http status code 429) or failed due to server unavailable
+        (http status code 503) are resubmitted once the delay specified via Retry-After header has elapsed
+        """
+        self.execute_query_retry(timeout_secs=0, max_retry=max_retry)
 
     def clone(self, url, clear_queries=True):
         """
@@ -271,11 +325,32 @@ class ClientContext(ClientRuntimeContext):
         :param bool clear_queries:
         :param str url: Site Url
         """
+        if clear_queries:
+            return self._fork(url)
         ctx = copy.deepcopy(self)
         ctx._auth_context.url = url
+        # form digest of the site (if any) is shared via form digest manager
         ctx._ctx_web_info = None
-        if clear_queries:
-            ctx.clear()
+        return ctx
+
+    def _fork(self, url):
+        # type: (str) -> Self
+        """
+        Creates a context for another site which shares credentials (and tokens), HTTP transport
+        (connection pool and throttling state), form digests and JSON format with this one,
+        pending queries and cached objects are not copied
+        """
+        auth_context = copy.copy(self.authentication_context)
+        auth_context.url = url
+        ctx = self.__class__(url, auth_context)
+        ctx._transport = self.transport
+        ctx._form_digest_manager = self._form_digest_manager
+        ctx._json_format = self._json_format
+        ctx._auto_batch_size = self._auto_batch_size
+        if self._pending_request is not None:
+            for e in self._pending_request.beforeExecute:
+                if not EventHandler.is_system(e):
+                    ctx.pending_request().beforeExecute += e
         return ctx
 
     def _authenticate_request(self, request):
@@ -100,6 +100,37 @@ class Folder(Entity):
         self.ensure_properties(["Files", "Folders"], _get_files, parent=self)
         return return_type
 
+    def iter_folders(self, batch_size=20, max_workers=None):
+        """
+        Enumerates the folder and all of its descendant folders breadth-first, sub folders of sibling folders are
+        retrieved via batch requests which are submitted concurrently.
+        Queries are submitted immediately, there is no need to call execute_query.
+
+        :param int batch_size: Maximum number of folders expanded per batch request, 1 disables batching
+        :param int or None max_workers: Maximum number of requests in flight
+        """
+        from office365.sharepoint.folders.traversal import FolderTraversal
+
+        return FolderTraversal(self, batch_size, max_workers).iter_folders()
+
+    def iter_files(self, batch_size=20, max_workers=None, library=None):
+        """
+        Enumerates files of the folder and all of its descendant folders, files are yielded as soon as
+        the folder they belong to has been retrieved (see iter_folders).
+        Queries are submitted immediately, there is no need to call execute_query.
+
+        :param int batch_size: Maximum number of folders expanded per batch request, 1 disables batching
+        :param int or None max_workers: Maximum number of requests in flight
+        :param office365.sharepoint.lists.list.List library: Document library the folder belongs to, if specified
+            files are retrieved page by page via RenderListDataAsStream (recursive scope) instead
+        """
+        from office365.sharepoint.folders.traversal import FolderTraversal
+
+        traversal = FolderTraversal(self, batch_size, max_workers)
+        if library is not None:
+            return traversal.iter_library_files(library)
+        return traversal.iter_files()
+
     def get_sharing_information(self):
         """Gets the sharing information for a folder."""
         return self.list_item_all_fields.get_sharing_information()
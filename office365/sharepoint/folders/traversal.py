@@ -0,0 +1,187 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from requests import Response
+
+from office365.runtime.client_result import ClientResult
+from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.queries.batch import BatchQuery
+from office365.runtime.queries.client_query import ClientQuery
+from office365.runtime.queries.read_entity import ReadEntityQuery
+from office365.runtime.queries.service_operation import ServiceOperationQuery
+from office365.sharepoint.files.file import File
+from office365.sharepoint.lists.render_data_parameters import (
+    RenderListDataOptions,
+    RenderListDataParameters,
+)
+from office365.sharepoint.views.scope import ViewScope
+
+if TYPE_CHECKING:
+    from office365.sharepoint.folders.folder import Folder  # noqa
+    from office365.sharepoint.lists.list import List as SPList  # noqa
+
+
+class FolderTraversal(object):
+    """
+    Walks a folder tree breadth-first.
+
+    Files and sub folders of sibling folders are requested together (a batch request per group of folders),
+    batches are submitted concurrently on the transport worker pool. Requests are built and responses are
+    mapped on the calling thread, folders are yielded as soon as their content has been received
+    """
+
+    def __init__(self, root, batch_size=20, max_workers=None):
+        # type: (Folder, int, Optional[int]) -> None
+        """
+        :param Folder root: Folder to start from
+        :param int batch_size: Maximum number of folders expanded per batch request, 1 disables batching
+        :param int or None max_workers: Maximum number of requests in flight,
+            defaults to the connection pool size of the transport
+        """
+        self._root = root
+        self._context = root.context
+        self._batch_size = max(1, batch_size)
+        self._max_workers = max_workers
+
+    def iter_folders(self):
+        # type: () -> Iterator[Folder]
+        """Yields the root and all of its descendant folders, each one with its files and sub folders loaded"""
+        transport = self._context.pending_request().transport
+        max_workers = self._max_workers or transport.pool_maxsize
+        pending = deque([self._root])  # type: Deque[Folder]
+        in_flight = (
+            {}
+        )  # type: Dict[Any, Tuple[ClientQuery, RequestOptions, List[Folder]]]
+        try:
+            while pending or in_flight:
+                while pending and len(in_flight) < max_workers:
+                    folders = [
+                        pending.popleft()
+                        for _ in range(min(self._batch_size, len(pending)))
+                    ]
+                    qry, request = self._dispatch(folders)
+                    future = transport.executor.submit(transport.send, request)
+                    in_flight[future] = (qry, request, folders)
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                for future in done:
+                    qry, request, folders = in_flight.pop(future)
+                    self._complete(qry, future.result(), request)
+                    for folder in folders:
+                        pending.extend(folder.folders)
+                        yield folder
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+    def iter_files(self):
+        # type: () -> Iterator[File]
+        """Yields files of the root and all of its descendant folders as they are discovered"""
+        for folder in self.iter_folders():
+            yield from folder.files
+
+    def iter_library_files(self, library, page_size=5000):
+        # type: (SPList, int) -> Iterator[File]
+        """
+        Yields files of the root and all of its descendant folders via RenderListDataAsStream with
+        the recursive scope, so that the tree is retrieved in pages of items instead of folder by folder.
+
+        Files are initialized from the rendered rows (name, url, unique id, size and modification time)
+
+        :param SPList library: Document library the root folder belongs to
+        :param int page_size: Number of rows per page
+        """
+        if not self._root.is_property_available("ServerRelativeUrl"):
+            self._execute(ReadEntityQuery(self._root, ["ServerRelativeUrl"]))
+        view_xml = (
+            '<View Scope="{0}"><ViewFields>{1}</ViewFields>'
+            '<RowLimit Paged="TRUE">{2}</RowLimit></View>'
+        ).format(
+            ViewScope.RecursiveAll,
+            "".join(
+                '<FieldRef Name="{0}"/>'.format(name)
+                for name in (
+                    "FileLeafRef",
+                    "FileRef",
+                    "FSObjType",
+                    "UniqueId",
+                    "File_x0020_Size",
+                    "Modified",
+                )
+            ),
+            page_size,
+        )
+        paging = None
+        while True:
+            result = ClientResult(self._context, {})
+            payload = {
+                "parameters": RenderListDataParameters(
+                    view_xml=view_xml,
+                    render_options=RenderListDataOptions.ListData,
+                    folder_server_relative_url=self._root.serverRelativeUrl,
+                    paging=paging,
+                )
+            }
+            self._execute(
+                ServiceOperationQuery(
+                    library, "RenderListDataAsStream", None, payload, None, result
+                )
+            )
+            data = result.value or {}
+            for row in data.get("Row", []):
+                if str(row.get("FSObjType")) == "0":
+                    yield self._create_file(row)
+            next_href = data.get("NextHref", None)
+            if not next_href:
+                return
+            paging = next_href.lstrip("?")
+
+    def _dispatch(self, folders):
+        # type: (List[Folder]) -> Tuple[ClientQuery, RequestOptions]
+        """Builds a request which retrieves files and sub folders of the folders"""
+        queries = [
+            ReadEntityQuery(folder, ["Files", "Folders", "ServerRelativeUrl"])
+            for folder in folders
+        ]
+        if len(queries) == 1:
+            return queries[0], self._context._build_detached_request(queries[0])
+        qry = BatchQuery(self._context, queries)
+        return qry, self._context._dispatch_batch_query(qry, detached=True)
+
+    def _execute(self, query):
+        # type: (ClientQuery) -> None
+        """Submits the query on its own, queries pending in the context are left untouched"""
+        transport = self._context.pending_request().transport
+        request = self._context._build_detached_request(query)
+        self._complete(query, transport.send(request), request)
+
+    def _complete(self, query, response, request):
+        # type: (ClientQuery, Response, RequestOptions) -> None
+        if not isinstance(query, BatchQuery):
+            self._context._complete_query(query, response, request, detached=True)
+            return
+        try:
+            self._context._complete_batch_query(query, response, request, detached=True)
+        except Exception:
+            # queries of the traversal are not left pending in the context
+            pending = self._context._queries
+            for sub_qry in query.queries:
+                if sub_qry in pending:
+                    pending.remove(sub_qry)
+            raise
+
+    def _create_file(self, row):
+        # type: (Dict[str, Any]) -> File
+        """Creates a file from the rendered row, the file is addressed by its unique id"""
+        return_type = File(self._context)
+        return_type.set_property("ServerRelativeUrl", row["FileRef"], False)
+        return_type.set_property("Name", row.get("FileLeafRef", None), False)
+        if row.get("UniqueId", None):
+            return_type.set_property("UniqueId", row["UniqueId"].strip("{}"), False)
+        if row.get("File_x0020_Size", None):
+            return_type.set_property("Length", int(row["File_x0020_Size"]), False)
+        # Modified. holds the raw (ISO 8601) value whereas Modified is formatted for display
+        modified = row.get("Modified.", None)
+        if modified:
+            return_type.set_property("TimeLastModified", modified, False)
+        return return_type
@@ -0,0 +1,117 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+from office365.runtime.auth.token_cache import TokenCache
+from office365.sharepoint.webs.context_web_information import ContextWebInformation
+
+DigestKey = Tuple[str, Any]
+
+FORM_DIGEST_EXPIRED_ERRORS = (
+    "-2130575251",
+    "The security validation for this page is invalid",
+)
+"""Markers of the error returned (along with 403 status) once the digest has expired"""
+
+
+class FormDigestManager(object):
+    """
+    Shares form digests between contexts which address the same site on behalf of the same credentials,
+    digests are renewed ahead of their expiry (FormDigestTimeoutSeconds)
+
+    Expired digests are discarded once a digest for another site is requested, the least recently used
+    digests are discarded once max_size sites are tracked
+    """
+
+    _default = None  # type: Optional[FormDigestManager]
+    _default_lock = threading.Lock()
+
+    def __init__(self, refresh_margin=60, max_size=100):
+        # type: (float, int) -> None
+        """
+        :param float refresh_margin: Seconds before expiry when the digest gets renewed
+        :param int max_size: Maximum number of digests kept
+        """
+        self.refresh_margin = refresh_margin
+        self.max_size = max_size
+        self._caches = (
+            OrderedDict()
+        )  # type: OrderedDict[DigestKey, TokenCache[ContextWebInformation]]
+        self._lock = threading.Lock()
+
+    def __deepcopy__(self, memo):
+        """Manager is shared, not copied, between cloned contexts"""
+        return self
+
+    @classmethod
+    def default(cls):
+        # type: () -> FormDigestManager
+        """Returns the manager shared by all contexts in the process"""
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = FormDigestManager()
+        return cls._default
+
+    @staticmethod
+    def build_key(site_url, identity):
+        # type: (str, Any) -> DigestKey
+        return site_url.rstrip("/").lower(), identity
+
+    def get(self, key, acquire_func):
+        # type: (DigestKey, Callable[[], ContextWebInformation]) -> ContextWebInformation
+        """
+        Returns a valid digest for the site
+
+        :param DigestKey key: Site url along with identity of credentials
+        :param () -> ContextWebInformation acquire_func: Requests a new digest
+        """
+        return self._get_cache(key).get(acquire_func)
+
+    def invalidate(self, key, digest_value=None):
+        # type: (DigestKey, Optional[str]) -> None
+        """
+        Discards the digest for the site, e.g. once it has been rejected as expired.
+
+        :param DigestKey key: Site url along with identity of credentials
+        :param str or None digest_value: Only discards the digest if it is still the specified one,
+            so that a concurrently renewed digest is kept
+        """
+        cache = self._caches.get(key, None)
+        if cache is None or cache.value is None:
+            return
+        if digest_value is None or cache.value.FormDigestValue == digest_value:
+            cache.invalidate()
+
+    def __len__(self):
+        return len(self._caches)
+
+    def _get_cache(self, key):
+        # type: (DigestKey) -> TokenCache[ContextWebInformation]
+        with self._lock:
+            cache = self._caches.get(key, None)
+            if cache is not None:
+                self._caches.move_to_end(key)
+                return cache
+            self._discard_expired()
+            cache = self._caches[key] = TokenCache(
+                None,
+                refresh_margin=self.refresh_margin,
+                expires_in_func=lambda info: info.FormDigestTimeoutSeconds,
+            )
+            while len(self._caches) > max(1, self.max_size):
+                self._caches.popitem(last=False)
+        return cache
+
+    def _discard_expired(self):
+        # type: () -> None
+        """Discards expired digests, digests which are being acquired for the first time are kept"""
+        now = time.time()
+        expired = [
+            key
+            for key, cache in self._caches.items()
+            if cache.value is not None and cache.expires_at <= now
+        ]
+        for key in expired:
+            del self._caches[key]
@@ -45,6 +45,9 @@ class ListItem(SecurableObject):
     """An individual entry within a SharePoint list. Each list item has a schema that maps to fields in the list
     that contains the item, depending on the content type of the item."""
 
+    cache_property_kinds = False
+    """Lookup id (e.g. AuthorId) properties resolve depending on whether the lookup value is loaded"""
+
     def __init__(self, context, resource_path=None, parent_list=None):
         """
 
@@ -1,6 +1,6 @@
 import os
 from datetime import datetime
-from typing import IO, TYPE_CHECKING, AnyStr, Callable, Dict, Optional
+from typing import IO, TYPE_CHECKING, AnyStr, Callable, Dict, Iterator, Optional
 
 from typing_extensions import Self
 
@@ -43,6 +43,7 @@ from office365.sharepoint.listitems.listitem import ListItem
 from office365.sharepoint.lists.bloom_filter import ListBloomFilter
 from office365.sharepoint.lists.creatables_info import CreatablesInfo
 from office365.sharepoint.lists.data_source import ListDataSource
+from office365.sharepoint.lists.partitioned_reader import ListItemPartitionReader
 from office365.sharepoint.lists.render_data_parameters import RenderListDataParameters
 from office365.sharepoint.lists.rule import SPListRule
 from office365.sharepoint.lists.version_policy_manager import VersionPolicyManager
@@ -563,6 +564,27 @@ class List(SecurableObject):
         self.context.add_query(qry)
         return return_type
 
+    def iter_items_partitioned(
+        self, partition_size=5000, max_workers=None, ordered=True, properties=None
+    ):
+        # type: (int, Optional[int], bool, Optional[list[str]]) -> Iterator[ListItem]
+        """
+        Enumerates items of a list which exceeds the list view threshold.
+
+        The range of item identifiers is split into windows (ID ge/le filter on the indexed ID field) which
+        are retrieved concurrently, the items of all windows are yielded as a single stream.
+        Queries are submitted immediately, there is no need to call execute_query.
+
+        :param int partition_size: Number of identifiers per window, up to the list view threshold (5000)
+        :param int or None max_workers: Maximum number of windows retrieved concurrently,
+            defaults to the connection pool size of the transport
+        :param bool ordered: Yields items in the order of identifiers, otherwise windows are yielded
+            in the order of completion
+        :param list[str] or None properties: Names of item properties to retrieve, all by default
+        """
+        reader = ListItemPartitionReader(self, partition_size, max_workers, properties)
+        return reader.iter_items(ordered)
+
     def add_item(self, creation_information):
         # type: (ListItemCreationInformation|dict) -> ListItem
         """The recommended way to add a list item is to send a POST request to the ListItemCollection resource endpoint,
@@ -720,13 +742,20 @@ class List(SecurableObject):
         return return_type
 
     def render_list_data_as_stream(
-        self, view_xml=None, render_options=None, expand_groups=None
+        self,
+        view_xml=None,
+        render_options=None,
+        expand_groups=None,
+        folder_server_relative_url=None,
+        paging=None,
     ):
         """Returns the data for the specified query view.
 
         :param str view_xml: Specifies the CAML view XML.
         :param int render_options: Specifies the type of output to return.
         :param bool expand_groups: Specifies whether to expand the grouping or not.
+        :param str folder_server_relative_url: Specifies the server relative url of the folder to render
+        :param str paging: Specifies the paging information of the page to render (NextHref of the previous page)
         """
         return_type = ClientResult(self.context, dict())
         if view_xml is None:
@@ -736,6 +765,8 @@ class List(SecurableObject):
                 view_xml=view_xml,
                 render_options=render_options,
                 expand_groups=expand_groups,
+                folder_server_relative_url=folder_server_relative_url,
+                paging=paging,
             ),
         }
         qry = ServiceOperationQuery(
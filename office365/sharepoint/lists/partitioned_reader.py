@@ -0,0 +1,154 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import TYPE_CHECKING, Any, Deque, Iterator, List, Optional, Tuple
+
+from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.paths.resource_path import ResourcePath
+from office365.runtime.queries.read_entity import ReadEntityQuery
+from office365.sharepoint.listitems.collection import ListItemCollection
+from office365.sharepoint.listitems.listitem import ListItem
+
+if TYPE_CHECKING:
+    from office365.sharepoint.lists.list import List as SPList  # noqa
+
+
+class ListItemPartitionReader(object):
+    """
+    Enumerates items of a (large) list by ranges of item identifiers.
+
+    The range of identifiers is split into windows which are queried via the (always indexed) ID field,
+    so that no query exceeds the list view threshold. Windows are retrieved concurrently on the transport
+    worker pool, requests are built and responses are mapped on the calling thread
+    """
+
+    MAX_PARTITION_SIZE = 5000
+    """List view threshold, the maximum number of items a query could scan"""
+
+    def __init__(
+        self, source_list, partition_size=5000, max_workers=None, properties=None
+    ):
+        # type: (SPList, int, Optional[int], Optional[List[str]]) -> None
+        """
+        :param SPList source_list: List to read items from
+        :param int partition_size: Number of identifiers per window (up to the list view threshold)
+        :param int or None max_workers: Maximum number of windows retrieved concurrently,
+            defaults to the connection pool size of the transport
+        :param list[str] or None properties: Names of item properties to retrieve, all by default
+        """
+        self._list = source_list
+        self._context = source_list.context
+        self._partition_size = max(1, min(partition_size, self.MAX_PARTITION_SIZE))
+        self._max_workers = max_workers
+        self._properties = properties
+
+    def get_id_range(self):
+        # type: () -> Optional[Tuple[int, int]]
+        """Returns the lowest and highest item identifiers, None if the list is empty"""
+        first = self._create_collection().select(["Id"]).order_by("Id asc").top(1)
+        last = self._create_collection().select(["Id"]).order_by("Id desc").top(1)
+        in_flight = [self._submit(first), self._submit(last)]
+        try:
+            for qry, future, request in in_flight:
+                self._context._complete_query(qry, future.result(), request)
+        finally:
+            for _, future, _ in in_flight:
+                future.cancel()
+        if len(first) == 0 or len(last) == 0:
+            return None
+        return first[0].id, last[0].id
+
+    def partitions(self, min_id, max_id):
+        # type: (int, int) -> Iterator[Tuple[int, int]]
+        """Splits the range of identifiers (bounds included) into windows"""
+        for lower in range(min_id, max_id + 1, self._partition_size):
+            yield lower, min(lower + self._partition_size - 1, max_id)
+
+    def iter_items(self, ordered=True):
+        # type: (bool) -> Iterator[ListItem]
+        """
+        Yields items of all windows
+
+        :param bool ordered: Yields items in the order of identifiers, otherwise windows are yielded
+            in the order of completion
+        """
+        id_range = self.get_id_range()
+        if id_range is None:
+            return
+        windows = self.partitions(*id_range)
+        max_workers = self._max_workers or self._transport.pool_maxsize
+        in_flight = deque()  # type: Deque[Tuple[ReadEntityQuery, Any, RequestOptions]]
+        try:
+            while True:
+                while len(in_flight) < max_workers:
+                    window = next(windows, None)
+                    if window is None:
+                        break
+                    in_flight.append(self._submit(self._create_window(*window)))
+                if not in_flight:
+                    return
+                qry, future, request = self._pop_completed(in_flight, ordered)
+                self._context._complete_query(qry, future.result(), request)
+                items = qry.return_type
+                # should the server cap the page size, the rest of window is requested ahead of the next windows
+                if items.has_next:
+                    next_page = self._submit(items, items.next_link_url)
+                    if ordered:
+                        in_flight.appendleft(next_page)
+                    else:
+                        in_flight.append(next_page)
+                yield from items
+        finally:
+            while in_flight:
+                _, future, _ = in_flight.popleft()
+                future.cancel()
+
+    @property
+    def _transport(self):
+        return self._context.pending_request().transport
+
+    def _submit(self, items, url=None):
+        # type: (ListItemCollection, Optional[str]) -> Tuple[ReadEntityQuery, Any, RequestOptions]
+        """
+        Builds a request which retrieves (a page of) the collection and submits it onto the transport worker pool
+
+        :param str or None url: Url of the next page
+        """
+        qry = ReadEntityQuery(items)
+        request = self._context.build_request(qry)
+        if url is not None:
+            request.url = url
+        return (
+            qry,
+            self._transport.executor.submit(self._transport.send, request),
+            request,
+        )
+
+    @staticmethod
+    def _pop_completed(in_flight, ordered):
+        # type: (Deque[Tuple[ReadEntityQuery, Any, RequestOptions]], bool) -> Tuple[ReadEntityQuery, Any, RequestOptions]
+        """Returns the earliest submitted window, or any completed one if the order does not matter"""
+        if not ordered:
+            wait([entry[1] for entry in in_flight], return_when=FIRST_COMPLETED)
+            for entry in in_flight:
+                if entry[1].done():
+                    in_flight.remove(entry)
+                    return entry
+        return in_flight.popleft()
+
+    def _create_window(self, lower, upper):
+        # type: (int, int) -> ListItemCollection
+        items = (
+            self._create_collection()
+            .filter("Id ge {0} and Id le {1}".format(lower, upper))
+            .order_by("Id asc")
+            .top(self._partition_size)
+        )
+        if self._properties:
+            items.select(self._properties)
+        return items
+
+    def _create_collection(self):
+        # type: () -> ListItemCollection
+        return ListItemCollection(
+            self._context, ResourcePath("items", self._list.resource_path)
+        )
@@ -39,6 +39,8 @@ class RenderListDataParameters(ClientValue):
         require_folder_coloring_fields=None,
         show_stub_file=None,
         view_xml=None,
+        folder_server_relative_url=None,
+        paging=None,
     ):
         """
         :param bool add_all_fields:
@@ -56,6 +58,10 @@ class RenderListDataParameters(ClientValue):
         :param bool require_folder_coloring_fields:
         :param bool show_stub_file:
         :param str view_xml: Specifies the CAML view XML.
+        :param str folder_server_relative_url: Specifies the server relative url of the folder to render
+            the data of, the root folder of the list by default
+        :param str paging: Specifies the paging information of the page to render, e.g. Paged=TRUE&p_ID=100
+            (NextHref of the previous page without leading question mark)
         """
         self.AddAllFields = add_all_fields
         self.AddAllViewFields = add_all_view_fields
@@ -75,6 +81,8 @@ class RenderListDataParameters(ClientValue):
         self.RequireFolderColoringFields = require_folder_coloring_fields
         self.ShowStubFile = show_stub_file
         self.ViewXml = view_xml
+        self.FolderServerRelativeUrl = folder_server_relative_url
+        self.Paging = paging
 
     @property
     def entity_type_name(self):
@@ -13,7 +13,8 @@ class TaxonomyService(ClientRuntimeContext):
         :type  context: office365.sharepoint.client_context.ClientContext
         """
         super(TaxonomyService, self).__init__()
-        self._pending_request = ODataRequest(V4JsonFormat())
+        self._transport = context.transport
+        self._pending_request = ODataRequest(V4JsonFormat(), self.transport)
         self._pending_request.beforeExecute += (
             context.authentication_context.authenticate_request
         )
@@ -22,6 +23,10 @@ class TaxonomyService(ClientRuntimeContext):
     def pending_request(self):
         return self._pending_request
 
+    def batch_request(self):
+        """Batch requests are not supported by the taxonomy (v2.1) endpoint"""
+        raise NotImplementedError("Batch requests are not supported by TaxonomyService")
+
     def service_root_url(self):
         return self._service_root_url
 
@@ -24,7 +24,7 @@ setup(
         "pytz",
         "typing_extensions>=4.0.0",
     ],
-    extras_require={"NtlmProvider": ["requests_ntlm"]},
+    extras_require={"NtlmProvider": ["requests_ntlm"], "FastJson": ["orjson"]},
     tests_require=["pytest", "adal"],
     test_suite="tests",
     license="MIT",
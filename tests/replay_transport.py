@@ -0,0 +1,102 @@
+import io
+import json
+import re
+import threading
+
+import requests
+
+from office365.runtime.auth.token_response import TokenResponse
+from office365.runtime.http.transport import HttpTransport
+from office365.sharepoint.client_context import ClientContext
+
+site_url = "https://contoso.sharepoint.com/sites/team"
+
+_context_info = {
+    "d": {
+        "GetContextWebInformation": {
+            "FormDigestValue": "digest",
+            "FormDigestTimeoutSeconds": 1800,
+            "WebFullUrl": site_url,
+            "SiteFullUrl": site_url,
+        }
+    }
+}
+
+
+def create_response(payload=None, status_code=200, headers=None, stream=False):
+    """
+    Creates a response, the payload (if any) is serialized as JSON
+
+    :param bool stream: Backs the response by a (fake) connection, so that its content could be read incrementally
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers["Content-Type"] = "application/json;odata=verbose"
+    response.headers.update(headers or {})
+    content = b"" if payload is None else json.dumps(payload).encode("utf-8")
+    if stream:
+        response.raw = io.BytesIO(content)
+    else:
+        response._content = content
+        response._content_consumed = True
+    return response
+
+
+def parse_batch_request(request):
+    """Returns (method, url) of every part of a SharePoint batch request"""
+    data = (
+        request.data.decode("utf-8")
+        if isinstance(request.data, bytes)
+        else request.data
+    )
+    return re.findall(
+        r"^(GET|POST|PATCH|MERGE|PUT|DELETE) (\S+) HTTP/1.1", data, re.MULTILINE
+    )
+
+
+def create_batch_response(parts):
+    """Creates a SharePoint batch (multipart/mixed) response from the (status code, payload) of every part"""
+    boundary = "batchresponse_replay"
+    body = "".join(
+        "--{0}\r\nContent-Type: application/http\r\nContent-Transfer-Encoding: binary\r\n\r\n"
+        "HTTP/1.1 {1} Status\r\nContent-Type: application/json;odata=verbose\r\n\r\n{2}\r\n".format(
+            boundary, status_code, json.dumps(payload)
+        )
+        for status_code, payload in parts
+    ) + "--{0}--\r\n".format(boundary)
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "multipart/mixed; boundary={0}".format(boundary)
+    response._content = body.encode("utf-8")
+    return response
+
+
+class ReplayTransport(HttpTransport):
+    """Serves requests via handler instead of submitting them, requests for form digest are served implicitly"""
+
+    def __init__(self, handler):
+        super(ReplayTransport, self).__init__()
+        self.handler = handler
+        self.requests = []
+        self._requests_lock = threading.Lock()
+
+    def send(self, request):
+        with self._requests_lock:
+            self.requests.append(request)
+        if request.url.endswith("/contextInfo"):
+            return create_response(_context_info)
+        return self.handler(request)
+
+    @property
+    def urls(self):
+        return [r.url for r in self.requests if not r.url.endswith("/contextInfo")]
+
+
+def create_context(handler):
+    # type: (...) -> ClientContext
+    """Creates SharePoint context which serves requests via handler"""
+    return (
+        ClientContext(site_url)
+        .with_access_token(lambda: TokenResponse("token", "Bearer"))
+        .with_transport(ReplayTransport(handler))
+    )
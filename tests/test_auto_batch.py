@@ -0,0 +1,147 @@
+import re
+from unittest import TestCase
+
+from office365.graph_client import GraphClient
+from office365.runtime.client_request_exception import ClientRequestException
+from office365.runtime.http.http_method import HttpMethod
+from office365.runtime.http.throttling import ThrottlingPolicy
+from tests.replay_transport import (
+    create_batch_response,
+    create_context,
+    create_response,
+    parse_batch_request,
+)
+
+
+def _get_title(url):
+    match = re.search(r"GetByTitle\('([^']+)'\)", url)
+    return match.group(1) if match else None
+
+
+def _handle(request):
+    if request.url.endswith("/$batch"):
+        return create_batch_response(
+            [
+                (
+                    (200, {"d": {"Title": _get_title(url)}})
+                    if method == "GET"
+                    else (204, {})
+                )
+                for method, url in parse_batch_request(request)
+            ]
+        )
+    if request.method == HttpMethod.Post:
+        return create_response(status_code=204)
+    return create_response({"d": {"Title": _get_title(request.url)}})
+
+
+class TestAutoBatch(TestCase):
+    """Offline tests of coalescing pending queries into batch requests and processing of their sub-responses"""
+
+    def _summarize(self, context):
+        """Returns (method, list title) of every (sub) request submitted via context"""
+        result = []
+        for request in context.transport.requests:
+            if request.url.endswith("/$batch"):
+                result.append(
+                    [(m, _get_title(u)) for m, u in parse_batch_request(request)]
+                )
+            elif not request.url.endswith("/contextInfo"):
+                result.append((request.method, _get_title(request.url)))
+        return result
+
+    def test1_group_reads_and_modifications(self):
+        context = create_context(_handle).with_auto_batch()
+        lists = [context.web.lists.get_by_title("L{0}".format(i)) for i in range(4)]
+        context.load(lists[0]).load(lists[1])
+        lists[2].set_property("Title", "New").update()
+        lists[3].set_property("Title", "New").update()
+        context.load(lists[2]).execute_query()
+        self.assertEqual(
+            [
+                [("GET", "L0"), ("GET", "L1")],
+                [("MERGE", "L2"), ("MERGE", "L3")],
+                (HttpMethod.Get, "L2"),
+            ],
+            self._summarize(context),
+        )
+        self.assertEqual(["L0", "L1", "L2", "New"], [lst.title for lst in lists])
+
+    def test2_split_conflicting_queries(self):
+        context = create_context(_handle).with_auto_batch(10)
+        lists = [context.web.lists.get_by_title("L{0}".format(i)) for i in range(2)]
+        context.load(lists[0]).load(lists[0].root_folder).load(lists[1])
+        context.execute_query()
+        self.assertEqual(
+            [(HttpMethod.Get, "L0"), [("GET", "L0"), ("GET", "L1")]],
+            self._summarize(context),
+        )
+
+    def test3_limit_graph_batch_size(self):
+        client = GraphClient(
+            lambda: {"access_token": "token", "token_type": "Bearer"}
+        ).with_auto_batch(50)
+        for i in range(25):
+            client.load(client.users["user{0}".format(i)])
+        self.assertEqual(
+            20, len(client._get_next_batch_query(client._auto_batch_size).queries)
+        )
+        self.assertEqual(5, len(client._queries))
+
+    def _fail_first_batch(self, status_code):
+        """Handles requests, the second sub-request of the first batch fails with the status code"""
+        batches = []
+
+        def _handle_batch(request):
+            if not request.url.endswith("/$batch"):
+                return _handle(request)
+            parts = parse_batch_request(request)
+            batches.append([_get_title(url) for _, url in parts])
+            return create_batch_response(
+                [
+                    (
+                        (status_code, {})
+                        if len(batches) == 1 and index == 1
+                        else (200, {"d": {"Title": _get_title(url)}})
+                    )
+                    for index, (_, url) in enumerate(parts)
+                ]
+            )
+
+        return _handle_batch, batches
+
+    def test4_resubmit_throttled_sub_requests(self):
+        handler, batches = self._fail_first_batch(429)
+        policy = ThrottlingPolicy(default_delay=0)
+        context = create_context(handler).with_auto_batch().with_throttling(policy)
+        lists = [context.web.lists.get_by_title("L{0}".format(i)) for i in range(3)]
+        for lst in lists:
+            context.load(lst)
+        context.execute_query()
+        self.assertEqual([["L0", "L1", "L2"], ["L1"]], batches)
+        self.assertEqual(["L0", "L1", "L2"], [lst.title for lst in lists])
+        self.assertEqual(1, policy.metrics.retries)
+
+    def test5_not_resubmit_failed_sub_requests(self):
+        handler, batches = self._fail_first_batch(400)
+        context = (
+            create_context(handler)
+            .with_auto_batch()
+            .with_throttling(ThrottlingPolicy(default_delay=0))
+        )
+        lists = [context.web.lists.get_by_title("L{0}".format(i)) for i in range(3)]
+        for lst in lists:
+            context.load(lst)
+        with self.assertRaises(ClientRequestException):
+            context.execute_query()
+        self.assertEqual([["L0", "L1", "L2"]], batches)
+        self.assertEqual("L0", lists[0].title)
+
+    def test6_not_resubmit_without_throttling_policy(self):
+        handler, batches = self._fail_first_batch(429)
+        context = create_context(handler).with_auto_batch()
+        for i in range(3):
+            context.load(context.web.lists.get_by_title("L{0}".format(i)))
+        with self.assertRaises(ClientRequestException):
+            context.execute_query()
+        self.assertEqual(1, len(batches))
@@ -0,0 +1,95 @@
+import datetime
+from unittest import TestCase
+
+from office365.runtime.client_object import (
+    DATETIME_PROPERTY,
+    PLAIN_PROPERTY,
+    TYPED_PROPERTY,
+    ClientObject,
+)
+from office365.runtime.client_value import ClientValue
+from office365.runtime.client_value_collection import ClientValueCollection
+from office365.sharepoint.client_context import ClientContext
+from office365.sharepoint.fields.lookup_value import FieldLookupValue
+from office365.sharepoint.fields.multi_lookup_value import FieldMultiLookupValue
+from office365.sharepoint.listitems.listitem import ListItem
+
+
+class _Summary(ClientValue):
+    def __init__(self, count=None):
+        self.Count = count
+
+
+class _Item(ClientObject):
+    getter_calls = 0
+
+    def get_property(self, name, default_value=None):
+        _Item.getter_calls += 1
+        if default_value is None:
+            property_mapping = {
+                "Created": datetime.datetime.min,
+                "Summary": _Summary(),
+            }
+            default_value = property_mapping.get(name, None)
+        return super(_Item, self).get_property(name, default_value)
+
+
+class TestClientObject(TestCase):
+    """Offline tests of mapping values into client object properties"""
+
+    context = ClientContext("https://contoso.sharepoint.com")
+
+    def _map(self, properties):
+        item = _Item(self.context)
+        for name, value in properties.items():
+            item.set_property(name, value, False)
+        return item
+
+    def test1_resolve_property_kinds(self):
+        item = _Item(self.context)
+        self.assertEqual(TYPED_PROPERTY, item.get_property_kind("Summary"))
+        self.assertEqual(DATETIME_PROPERTY, item.get_property_kind("Created"))
+        self.assertEqual(PLAIN_PROPERTY, item.get_property_kind("Title"))
+
+    def test2_map_properties(self):
+        item = self._map(
+            {
+                "Created": "2023-01-02T03:04:05Z",
+                "Summary": {"Count": 3},
+                "Title": "Report",
+            }
+        )
+        self.assertEqual(
+            datetime.datetime(2023, 1, 2, 3, 4, 5), item.properties["Created"]
+        )
+        self.assertIsInstance(item.properties["Summary"], _Summary)
+        self.assertEqual(3, item.properties["Summary"].Count)
+        self.assertEqual("Report", item.properties["Title"])
+
+    def test3_resolve_property_kinds_once_per_type(self):
+        properties = {"Created": "2023-01-02T03:04:05Z", "Title": "Report"}
+        self._map(properties)
+        _Item.getter_calls = 0
+        for _ in range(10):
+            self._map(properties)
+        self.assertEqual(0, _Item.getter_calls)
+
+    def test4_merge_into_property_already_set(self):
+        item = self._map({"Summary": {"Count": 3}})
+        summary = item.properties["Summary"]
+        item.set_property("Summary", {"Count": 4}, False)
+        self.assertIs(summary, item.properties["Summary"])
+        self.assertEqual(4, summary.Count)
+
+    def test5_map_properties_depending_on_state(self):
+        # ListItem resolves lookup id properties depending on whether the lookup value is loaded
+        first = ListItem(self.context)
+        first.set_property("ReviewersId", [3], False)
+        second = ListItem(self.context)
+        reviewers = FieldMultiLookupValue()
+        reviewers.add(FieldLookupValue(1))
+        reviewers.add(FieldLookupValue(2))
+        second.set_property("Reviewers", reviewers, False)
+        second.set_property("ReviewersId", [1, 2], False)
+        self.assertEqual([3], first.properties["ReviewersId"])
+        self.assertIsInstance(second.properties["ReviewersId"], ClientValueCollection)
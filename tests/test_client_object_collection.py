@@ -0,0 +1,28 @@
+from unittest import TestCase
+
+from office365.sharepoint.changes.collection import ChangeCollection
+from office365.sharepoint.changes.item import ChangeItem
+from office365.sharepoint.changes.web import ChangeWeb
+from office365.sharepoint.client_context import ClientContext
+
+
+class TestClientObjectCollection(TestCase):
+    """Offline tests of collection materialization modes"""
+
+    context = ClientContext("https://contoso.sharepoint.com")
+
+    def _load_changes(self, changes):
+        # type: (ChangeCollection) -> ChangeCollection
+        changes.set_property(0, {"ItemId": 1, "ListId": "list", "WebId": "web"})
+        changes.set_property(1, {"WebId": "web"})
+        return changes
+
+    def test1_materialize_eagerly(self):
+        changes = self._load_changes(ChangeCollection(self.context))
+        self.assertEqual([ChangeItem, ChangeWeb], [type(c) for c in changes])
+
+    def test2_materialize_lazily(self):
+        changes = self._load_changes(ChangeCollection(self.context).lazy())
+        self.assertEqual([ChangeItem, ChangeWeb], [type(c) for c in changes])
+        self.assertIs(changes[0], changes[0])
+        self.assertEqual(1, changes[0].properties["ItemId"])
@@ -0,0 +1,88 @@
+import datetime
+import unittest
+from unittest import TestCase
+
+from office365.runtime.types.columnar import Column, ColumnarTable
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+class TestColumnarTable(TestCase):
+    """Offline tests of accumulating values into column-oriented buffers"""
+
+    def _create_table(self):
+        table = ColumnarTable(["Id", "Score", "Flag", "Title", "Modified", "Data"])
+        table.append([1, 1.5, True, "a", "2024-01-02T03:04:05Z", {"x": 1}])
+        table.append([None, None, None, None, None, None])
+        table.append([3, 2, False, "a", "2024-01-02T03:04:05+02:00", 5])
+        return table
+
+    def test1_resolve_column_kinds(self):
+        table = self._create_table()
+        self.assertEqual(3, len(table))
+        self.assertEqual(
+            [
+                Column.INT64,
+                Column.FLOAT64,
+                Column.BOOLEAN,
+                Column.STRING,
+                Column.DATETIME,
+                Column.OBJECT,
+            ],
+            [column.kind for column in table.columns],
+        )
+        self.assertEqual(["a"], table["Title"].dictionary)
+        self.assertEqual(1, table["Id"].null_count)
+
+    def test2_convert_to_dict(self):
+        self.assertEqual(
+            {
+                "Id": [1, None, 3],
+                "Score": [1.5, None, 2.0],
+                "Flag": [True, None, False],
+                "Title": ["a", None, "a"],
+                "Modified": [
+                    datetime.datetime(2024, 1, 2, 3, 4, 5),
+                    None,
+                    datetime.datetime(2024, 1, 2, 1, 4, 5),
+                ],
+                "Data": [{"x": 1}, None, 5],
+            },
+            self._create_table().to_pydict(),
+        )
+
+    def test3_widen_column(self):
+        column = Column("Value")
+        column.append(None)
+        column.append(1)
+        column.append(2.5)
+        self.assertEqual(Column.FLOAT64, column.kind)
+        column.append("text")
+        self.assertEqual(Column.OBJECT, column.kind)
+        self.assertEqual([None, 1.0, 2.5, "text"], column.to_pylist())
+
+    def test4_widen_int_column_on_overflow(self):
+        column = Column("Value")
+        column.append(1)
+        column.append(2**70)
+        self.assertEqual([1, 2**70], column.to_pylist())
+
+    @unittest.skipIf(pyarrow is None, "pyarrow package is not installed")
+    def test5_export_to_arrow(self):
+        table = self._create_table().to_arrow()
+        self.assertEqual([1, None, 3], table.column("Id").to_pylist())
+        self.assertEqual([True, None, False], table.column("Flag").to_pylist())
+        self.assertEqual(["a", None, "a"], table.column("Title").to_pylist())
+        self.assertEqual(["{'x': 1}", None, "5"], table.column("Data").to_pylist())
+
+    @unittest.skipIf(pyarrow is None, "pyarrow package is not installed")
+    def test6_append_after_export(self):
+        column = Column("Id")
+        column.append(1)
+        exported = column.to_arrow()
+        column.append(2)
+        self.assertEqual([1], exported.to_pylist())
+        self.assertEqual([1, 2], column.to_arrow().to_pylist())
@@ -0,0 +1,112 @@
+import re
+from unittest import TestCase
+
+from tests.replay_transport import (
+    create_batch_response,
+    create_context,
+    create_response,
+    parse_batch_request,
+    site_url,
+)
+
+_tree = {
+    "r": ("/sites/team/Docs", ["r-0", "r-1"]),
+    "r-0": ("/sites/team/Docs/a", []),
+    "r-1": ("/sites/team/Docs/b", []),
+}
+
+_rows = [
+    {"FileRef": "/sites/team/Docs/f1.txt", "FileLeafRef": "f1.txt", "FSObjType": "0"},
+    {"FileRef": "/sites/team/Docs/a", "FileLeafRef": "a", "FSObjType": "1"},
+    {"FileRef": "/sites/team/Docs/a/f2.txt", "FileLeafRef": "f2.txt", "FSObjType": "0"},
+]
+
+
+def _folder_json(uid, expand=True):
+    url, children = _tree[uid]
+    payload = {
+        "__metadata": {"type": "SP.Folder"},
+        "UniqueId": uid,
+        "ServerRelativeUrl": url,
+    }
+    if expand:
+        payload["Files"] = {
+            "results": [
+                {
+                    "__metadata": {"type": "SP.File"},
+                    "UniqueId": uid + ".f",
+                    "ServerRelativeUrl": url + "/f.txt",
+                }
+            ]
+        }
+        payload["Folders"] = {
+            "results": [_folder_json(child, False) for child in children]
+        }
+    return payload
+
+
+def _resolve_folder(url):
+    match = re.search(r"GetFolderById\('([^']+)'\)", url, re.IGNORECASE)
+    return match.group(1) if match else "r"
+
+
+def _handle(request):
+    if request.url.endswith("/$batch"):
+        return create_batch_response(
+            [
+                (200, {"d": _folder_json(_resolve_folder(url))})
+                for _, url in parse_batch_request(request)
+            ]
+        )
+    if request.url.endswith("/RenderListDataAsStream"):
+        paging = request.data["parameters"].get("Paging", None)
+        if paging is None:
+            return create_response({"Row": _rows[:2], "NextHref": "?p_ID=2"})
+        return create_response({"Row": _rows[2:]})
+    return create_response({"d": _folder_json(_resolve_folder(request.url))})
+
+
+class TestFolderTraversal(TestCase):
+    """Offline tests of walking a folder tree"""
+
+    def _queue_query(self, context):
+        """Queues a query along with a handler attached for the next request only"""
+        requests = []
+        context.load(context.web)
+        context.before_execute(lambda request: requests.append(request.url))
+        return requests
+
+    def test1_iter_folders(self):
+        context = create_context(_handle)
+        root = context.web.get_folder_by_server_relative_url("Docs")
+        folders = list(root.iter_folders())
+        self.assertEqual(
+            ["/sites/team/Docs", "/sites/team/Docs/a", "/sites/team/Docs/b"],
+            [folder.serverRelativeUrl for folder in folders],
+        )
+        self.assertEqual(2, len(context.transport.urls))
+        self.assertTrue(context.transport.urls[1].endswith("/$batch"))
+
+    def test2_iter_folders_keep_pending_queries(self):
+        context = create_context(_handle)
+        requests = self._queue_query(context)
+        root = context.web.get_folder_by_server_relative_url("Docs")
+        self.assertEqual(3, len(list(root.iter_files())))
+        self.assertEqual(1, len(context._queries))
+        self.assertEqual([], requests)
+        context.execute_query()
+        self.assertEqual([site_url + "/_api/Web"], requests)
+
+    def test3_iter_library_files_keep_pending_queries(self):
+        context = create_context(_handle)
+        requests = self._queue_query(context)
+        library = context.web.lists.get_by_title("Docs")
+        root = context.web.get_folder_by_server_relative_url("Docs")
+        files = list(root.iter_files(library=library))
+        self.assertEqual(
+            ["/sites/team/Docs/f1.txt", "/sites/team/Docs/a/f2.txt"],
+            [f.serverRelativeUrl for f in files],
+        )
+        self.assertEqual(3, len(context.transport.urls))
+        self.assertEqual(1, len(context._queries))
+        self.assertEqual([], requests)
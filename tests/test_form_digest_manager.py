@@ -0,0 +1,42 @@
+import time
+from unittest import TestCase
+
+from office365.sharepoint.internal.form_digest_manager import FormDigestManager
+from office365.sharepoint.webs.context_web_information import ContextWebInformation
+
+
+def _build_key(index):
+    return FormDigestManager.build_key(
+        "https://contoso.sharepoint.com/sites/site{0}".format(index), "client"
+    )
+
+
+class TestFormDigestManager(TestCase):
+    """Offline tests of sharing form digests between contexts"""
+
+    def test1_share_digest(self):
+        manager = FormDigestManager()
+        manager.get(_build_key(1), lambda: ContextWebInformation("digest1", 1800))
+        info = manager.get(
+            _build_key(1), lambda: ContextWebInformation("digest2", 1800)
+        )
+        self.assertEqual("digest1", info.FormDigestValue)
+
+    def test2_discard_least_recently_used_digests(self):
+        manager = FormDigestManager(max_size=2)
+        for index in (1, 2, 1, 3):
+            manager.get(
+                _build_key(index),
+                lambda: ContextWebInformation("digest{0}".format(index), 1800),
+            )
+        self.assertEqual(2, len(manager))
+        info = manager.get(_build_key(2), lambda: ContextWebInformation("new", 1800))
+        self.assertEqual("new", info.FormDigestValue)
+
+    def test3_discard_expired_digests(self):
+        manager = FormDigestManager(refresh_margin=0)
+        manager.get(_build_key(1), lambda: ContextWebInformation("digest1", 0.01))
+        manager.get(_build_key(2), lambda: ContextWebInformation("digest2", 1800))
+        time.sleep(0.02)
+        manager.get(_build_key(3), lambda: ContextWebInformation("digest3", 1800))
+        self.assertEqual(2, len(manager))
@@ -0,0 +1,112 @@
+import json
+from unittest import TestCase
+
+from office365.runtime.odata.json_stream import JsonStreamReader
+from tests.replay_transport import (
+    create_batch_response,
+    create_context,
+    create_response,
+    parse_batch_request,
+)
+
+_DOCUMENT = json.dumps(
+    {
+        "d": {
+            "results": [
+                {"Id": 12345, "Title": "Café ☃", "Score": -1.5e3},
+                {"Id": 2, "Flag": True, "Empty": None, "Tags": ["a", "b"]},
+            ],
+            "__next": "https://contoso.sharepoint.com/_api/web/lists?$skiptoken=2",
+        },
+        "Count": 100,
+    },
+    ensure_ascii=False,
+).encode("utf-8")
+
+
+def _split(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestJsonStreamReader(TestCase):
+    """Offline tests of incremental parsing of collection payloads"""
+
+    def _read(self, chunks, collection_key="results", wrapper_keys=("d",)):
+        reader = JsonStreamReader(chunks)
+        items = list(reader.iter_items(collection_key, wrapper_keys))
+        return reader, items
+
+    def test1_read_whole_document(self):
+        reader, items = self._read([_DOCUMENT])
+        expected = json.loads(_DOCUMENT)
+        self.assertEqual(expected["d"]["results"], items)
+        self.assertEqual(expected["d"]["__next"], reader.collection_parent["__next"])
+        self.assertEqual(100, reader.document["Count"])
+
+    def test2_read_chunks_split_mid_token(self):
+        expected = json.loads(_DOCUMENT)["d"]["results"]
+        for size in (1, 2, 3, 7):
+            reader, items = self._read(_split(_DOCUMENT, size))
+            self.assertEqual(expected, items, "chunk size {0}".format(size))
+            self.assertEqual(100, reader.document["Count"])
+
+    def test3_read_number_split_at_chunk_boundary(self):
+        _, items = self._read([b'{"value":[123', b"45,6", b"7]}"], "value", ())
+        self.assertEqual([12345, 67], items)
+
+    def test4_read_document_without_collection(self):
+        reader, items = self._read([b'{"d":{"Id":', b"1}}"], "results", ("d",))
+        self.assertEqual([], items)
+        self.assertIsNone(reader.collection_parent)
+        self.assertEqual({"d": {"Id": 1}}, reader.document)
+
+    def test5_read_empty_collection(self):
+        reader, items = self._read([b'{"value":[]}'], "value", ())
+        self.assertEqual([], items)
+        self.assertEqual({}, reader.collection_parent)
+
+    def test6_read_malformed_document(self):
+        with self.assertRaises(json.JSONDecodeError):
+            self._read([b'{"value":[1,', b"2"], "value", ())
+
+
+class TestStreamedCollection(TestCase):
+    """Offline tests of collections read in streaming mode"""
+
+    @staticmethod
+    def _handle(request):
+        items = [{"__metadata": {"type": "SP.Data.DocsItem"}, "Id": i} for i in (1, 2)]
+        if request.url.endswith("$batch"):
+            return create_batch_response(
+                [(200, {"d": {"results": items}}) for _ in parse_batch_request(request)]
+            )
+        return create_response({"d": {"results": items}}, stream=True)
+
+    def _create_collections(self, context):
+        lists = context.web.lists
+        return [
+            lists.get_by_title(name).items.get().stream() for name in ("Docs", "Tasks")
+        ]
+
+    def test1_stream_collection(self):
+        context = create_context(self._handle)
+        first, second = self._create_collections(context)
+        context.execute_query()
+        self.assertEqual([1, 2], [item.id for item in first])
+        self.assertEqual([1, 2], [item.id for item in second])
+
+    def test2_stream_collections_with_auto_batch(self):
+        context = create_context(self._handle).with_auto_batch()
+        first, second = self._create_collections(context)
+        context.execute_query()
+        self.assertEqual([1, 2], [item.id for item in first])
+        self.assertEqual([1, 2], [item.id for item in second])
+        self.assertFalse(any(u.endswith("$batch") for u in context.transport.urls))
+
+    def test3_stream_collections_in_batch(self):
+        context = create_context(self._handle)
+        first, second = self._create_collections(context)
+        context.execute_batch()
+        self.assertEqual([1, 2], [item.id for item in first])
+        self.assertEqual([1, 2], [item.id for item in second])
+        self.assertEqual(1, len(context.transport.urls))
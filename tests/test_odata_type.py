@@ -0,0 +1,67 @@
+import datetime
+from unittest import TestCase
+
+from office365.runtime.odata.type import ODataType
+
+
+class TestODataType(TestCase):
+    """Offline tests of parsing Edm.DateTime and Edm.DateTimeOffset literals"""
+
+    def test1_parse_utc_datetime(self):
+        self.assertEqual(
+            datetime.datetime(2023, 1, 2, 3, 4, 5),
+            ODataType.try_parse_datetime("2023-01-02T03:04:05Z"),
+        )
+
+    def test2_parse_datetime_without_offset(self):
+        self.assertEqual(
+            datetime.datetime(2023, 1, 2, 3, 4, 5, 120000),
+            ODataType.try_parse_datetime("2023-01-02T03:04:05.12"),
+        )
+        self.assertEqual(
+            datetime.datetime(2023, 1, 2, 3, 4),
+            ODataType.try_parse_datetime("2023-01-02T03:04"),
+        )
+
+    def test3_parse_seven_digit_fraction(self):
+        self.assertEqual(
+            datetime.datetime(2023, 1, 2, 3, 4, 5, 123456),
+            ODataType.try_parse_datetime("2023-01-02T03:04:05.1234567Z"),
+        )
+
+    def test4_parse_datetime_with_offset(self):
+        expected = datetime.datetime(2023, 1, 2, 1, 4, 5)
+        self.assertEqual(
+            expected, ODataType.try_parse_datetime("2023-01-02T03:04:05+02:00")
+        )
+        self.assertEqual(
+            expected, ODataType.try_parse_datetime("2023-01-01T20:04:05-0500")
+        )
+        self.assertEqual(
+            ODataType.try_parse_datetime("2023-01-02T01:04:05Z"),
+            ODataType.try_parse_datetime("2023-01-02T01:04:05+00:00"),
+        )
+
+    def test5_parse_legacy_datetime(self):
+        expected = datetime.datetime(2023, 1, 2, 3, 4, 5)
+        self.assertEqual(
+            expected, ODataType.try_parse_datetime("/Date(1672628645000)/")
+        )
+        self.assertEqual(
+            expected, ODataType.try_parse_datetime("/Date(1672628645000+0200)/")
+        )
+        self.assertEqual(
+            datetime.datetime(1969, 12, 31, 23, 59, 59),
+            ODataType.try_parse_datetime("/Date(-1000)/"),
+        )
+
+    def test6_parse_invalid_datetime(self):
+        for value in (
+            None,
+            42,
+            "",
+            "Report",
+            "2023-13-02T03:04:05Z",
+            "0001-01-01T00:00:00+01:00",
+        ):
+            self.assertIsNone(ODataType.try_parse_datetime(value), value)
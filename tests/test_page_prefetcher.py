@@ -0,0 +1,68 @@
+import re
+import threading
+import time
+from unittest import TestCase
+
+from tests.replay_transport import create_context, create_response, site_url
+
+_items_url = site_url + "/_api/Web/lists/GetByTitle('Docs')/items"
+
+
+def _handle(request):
+    if not request.url.startswith(_items_url):
+        return create_response({"d": {"Title": "Team"}})
+    match = re.search(r"[?&]p=(\d+)", request.url)
+    page = int(match.group(1)) if match else 1
+    payload = {
+        "results": [
+            {"__metadata": {"type": "SP.Data.DocsItem"}, "Id": (page - 1) * 3 + i}
+            for i in (1, 2, 3)
+        ]
+    }
+    if page < 5:
+        payload["__next"] = "{0}?p={1}".format(_items_url, page + 1)
+    return create_response({"d": payload})
+
+
+class TestPagePrefetcher(TestCase):
+    """Offline tests of retrieving pages in the background while iterating"""
+
+    def _load_items(self, context):
+        items = context.web.lists.get_by_title("Docs").items.paged(3).prefetch(2)
+        context.load(items).execute_query()
+        return items
+
+    def _wait_for_threads(self, count):
+        deadline = time.monotonic() + 2
+        while threading.active_count() > count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return threading.active_count()
+
+    def test1_iterate_pages_in_order(self):
+        context = create_context(_handle)
+        items = self._load_items(context)
+        self.assertEqual(list(range(1, 16)), [item.id for item in items])
+        self.assertEqual(5, len(context.transport.urls))
+
+    def test2_stop_on_early_break(self):
+        context = create_context(_handle)
+        items = self._load_items(context)
+        threads_count = threading.active_count()
+        iterator = iter(items)
+        ids = [next(iterator).id for _ in range(4)]
+        iterator.close()
+        self.assertEqual([1, 2, 3, 4], ids)
+        self.assertEqual(threads_count, self._wait_for_threads(threads_count))
+
+    def test3_keep_handlers_of_queued_queries(self):
+        context = create_context(_handle)
+        items = self._load_items(context)
+        requests, responses = [], []
+        context.before_execute(lambda request: requests.append(request.url))
+        context.after_execute(lambda response: responses.append(response))
+        self.assertEqual(15, len([item.id for item in items]))
+        self.assertEqual([], requests)
+        self.assertEqual([], responses)
+        context.web.get().execute_query()
+        self.assertEqual([site_url + "/_api/Web"], requests)
+        self.assertEqual(1, len(responses))
@@ -0,0 +1,125 @@
+import asyncio
+import re
+import threading
+import time
+from unittest import TestCase
+
+from office365.runtime.auth.token_response import TokenResponse
+from office365.runtime.http.http_method import HttpMethod
+from office365.runtime.queries.read_entity import ReadEntityQuery
+from office365.runtime.queries.scheduler import QueryFootprint
+from office365.sharepoint.client_context import ClientContext
+from tests.replay_transport import ReplayTransport, create_response, site_url
+
+
+class _Handler(object):
+    """Serves lists by title, optionally after a delay, and records when requests start and end"""
+
+    def __init__(self, delays=None):
+        self.delays = delays or {}
+        self.events = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        match = re.search(r"GetByTitle\('([^']+)'\)", request.url)
+        title = match.group(1) if match else "Team"
+        key = (request.method, title)
+        self._record("start", key)
+        time.sleep(self.delays.get(key, 0))
+        self._record("end", key)
+        if request.method == HttpMethod.Post:
+            return create_response(status_code=204)
+        return create_response({"d": {"Title": title}})
+
+    def _record(self, event, key):
+        with self._lock:
+            self.events.append((event,) + key)
+
+
+class TestQueryExecution(TestCase):
+    """Offline tests of submitting pending queries concurrently"""
+
+    def setUp(self):
+        self.token_threads = []
+        self.handler = _Handler()
+
+        def _acquire_token():
+            self.token_threads.append(threading.current_thread())
+            return TokenResponse("token", "Bearer")
+
+        self.context = (
+            ClientContext(site_url)
+            .with_access_token(_acquire_token)
+            .with_transport(ReplayTransport(self.handler))
+        )
+
+    def _load_lists(self, count=3):
+        lists = [
+            self.context.web.lists.get_by_title("L{0}".format(i)) for i in range(count)
+        ]
+        for lst in lists:
+            self.context.load(lst)
+        return lists
+
+    def test1_execute_query_async(self):
+        lists = self._load_lists()
+        asyncio.run(self.context.execute_query_async())
+        self.assertEqual(["L0", "L1", "L2"], [lst.title for lst in lists])
+        self.assertEqual(3, len(self.context.transport.urls))
+        self.assertFalse(self.context.has_pending_request)
+
+    def test2_acquire_credentials_off_event_loop(self):
+        self._load_lists()
+        asyncio.run(self.context.execute_query_async())
+        self.assertGreater(len(self.token_threads), 0)
+        self.assertNotIn(threading.main_thread(), self.token_threads)
+
+    def test3_execute_query_async_auto_batch(self):
+        self._load_lists()
+        self.context.with_auto_batch(10)
+        with self.assertRaises(NotImplementedError):
+            asyncio.run(self.context.execute_query_async())
+        self.assertEqual([], self.context.transport.urls)
+
+    def test4_footprint_depends_on(self):
+        lists = self._load_lists(2)
+        reads = [QueryFootprint(qry) for qry in self.context._queries]
+        items_read = QueryFootprint(ReadEntityQuery(lists[0].items))
+        self.assertFalse(reads[1].depends_on(reads[0]))
+        self.assertTrue(items_read.depends_on(reads[0]))
+        self.assertTrue(reads[0].depends_on(items_read))
+        lists[1].set_property("Title", "New").update()
+        update = QueryFootprint(self.context._queries[-1])
+        self.assertTrue(update.depends_on(reads[0]))
+        self.assertFalse(update.conflicts_with(reads[0]))
+        self.assertTrue(update.conflicts_with(reads[1]))
+
+    def test5_read_after_write(self):
+        self.handler.delays[(HttpMethod.Post, "L0")] = 0.05
+        lst = self.context.web.lists.get_by_title("L0")
+        lst.set_property("Title", "New").update()
+        self.context.load(lst)
+        self.context.execute_query_parallel()
+        events = self.handler.events
+        self.assertLess(
+            events.index(("end", HttpMethod.Post, "L0")),
+            events.index(("start", HttpMethod.Get, "L0")),
+        )
+        self.assertEqual("L0", lst.title)
+
+    def test6_execute_query_parallel_handlers_order(self):
+        loaded = []
+        for i in range(4):
+            self.handler.delays[(HttpMethod.Get, "L{0}".format(i))] = 0.08 - i * 0.02
+            self.context.load(self.context.web.lists.get_by_title("L{0}".format(i)))
+            self.context.after_query_execute(
+                lambda lst: loaded.append((lst.title, threading.current_thread()))
+            )
+        self.context.execute_query_parallel()
+        self.assertEqual(
+            [("L{0}".format(i), threading.main_thread()) for i in range(4)], loaded
+        )
+        self.assertEqual(
+            ["L3", "L2", "L1", "L0"],
+            [title for event, _, title in self.handler.events if event == "end"],
+        )
@@ -0,0 +1,49 @@
+from unittest import TestCase
+
+from office365.runtime.paths.resource_path import ResourcePath
+from office365.runtime.paths.service_operation import ServiceOperationPath
+from office365.runtime.paths.v4.entity import EntityPath
+
+
+class TestResourcePath(TestCase):
+    """Offline tests of building (cached) urls of resource paths"""
+
+    def test1_build_url(self):
+        path = ResourcePath("items", ResourcePath("root", ResourcePath("drive")))
+        self.assertEqual("/drive/root/items", path.to_url())
+        self.assertIs(path.to_url(), path.to_url())
+
+    def test2_build_service_operation_url(self):
+        path = ServiceOperationPath(
+            "getByPath", {"path": "Shared Documents"}, ResourcePath("web")
+        )
+        self.assertEqual(str(path), str(path))
+        self.assertTrue(str(path).startswith("/web/getByPath("))
+
+    def test3_invalidate_url_on_patch(self):
+        parent = ResourcePath(None, ResourcePath("users"))
+        path = ResourcePath("drive", parent)
+        self.assertEqual("/users/None/drive", path.to_url())
+        parent.patch("john@contoso.com")
+        self.assertEqual("/users/john@contoso.com/drive", path.to_url())
+
+    def test4_invalidate_url_on_entity_patch(self):
+        collection = ResourcePath("items", ResourcePath("drive"))
+        path = EntityPath(None, collection)
+        child = ResourcePath("children", path)
+        self.assertEqual("/drive/items/<key>/children", child.to_url())
+        path.patch("01ABC")
+        self.assertEqual("/drive/items/01ABC/children", child.to_url())
+
+    def test5_hash_path(self):
+        first = ResourcePath("lists", ResourcePath("web"))
+        second = ResourcePath("lists", ResourcePath("web"))
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertEqual({first: "lists"}[second], "lists")
+        self.assertNotEqual(first, ResourcePath("fields", ResourcePath("web")))
+
+    def test6_compare_with_other_types(self):
+        path = ResourcePath("web")
+        self.assertNotEqual(path, "/web")
+        self.assertNotEqual(path, None)
@@ -0,0 +1,129 @@
+import time
+from email.utils import formatdate
+from unittest import TestCase
+
+import requests
+
+from office365.runtime.http.http_method import HttpMethod
+from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.http.throttling import (
+    ThrottlingPolicy,
+    TokenBucket,
+    parse_rate_limit_reset,
+    parse_retry_after,
+)
+from office365.runtime.http.transport import HttpTransport
+
+_URL = "https://contoso.sharepoint.com/_api/web"
+
+
+def _create_response(status_code, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = b""
+    response._content_consumed = True
+    return response
+
+
+class _ReplayTransport(HttpTransport):
+    """Returns prepared responses instead of submitting requests"""
+
+    def __init__(self, responses, throttling):
+        super(_ReplayTransport, self).__init__(throttling=throttling)
+        self.responses = list(responses)
+        self.requests = []
+
+    def _send(self, request):
+        self.requests.append(request)
+        return self.responses.pop(0)
+
+
+class TestThrottling(TestCase):
+    """Offline tests of handling throttled requests"""
+
+    def test1_parse_retry_after(self):
+        self.assertEqual(
+            5.0, parse_retry_after(_create_response(429, {"Retry-After": "5"}))
+        )
+        self.assertEqual(
+            0.0, parse_retry_after(_create_response(429, {"Retry-After": "-1"}))
+        )
+        retry_at = formatdate(time.time() + 60, usegmt=True)
+        self.assertAlmostEqual(
+            60,
+            parse_retry_after(_create_response(503, {"Retry-After": retry_at})),
+            delta=2,
+        )
+        self.assertIsNone(
+            parse_retry_after(_create_response(429, {"Retry-After": "soon"}))
+        )
+        self.assertIsNone(parse_retry_after(_create_response(429)))
+
+    def test2_parse_rate_limit_reset(self):
+        exhausted = {"RateLimit-Remaining": "0", "RateLimit-Reset": "7"}
+        self.assertEqual(7.0, parse_rate_limit_reset(_create_response(200, exhausted)))
+        remaining = {"RateLimit-Remaining": "10", "RateLimit-Reset": "7"}
+        self.assertIsNone(parse_rate_limit_reset(_create_response(200, remaining)))
+
+    def test3_limit_rate(self):
+        bucket = TokenBucket(rate=20, capacity=2)
+        self.assertEqual(0, bucket.acquire())
+        self.assertEqual(0, bucket.acquire())
+        self.assertGreater(bucket.acquire(), 0)
+
+    def test4_pause_bucket(self):
+        bucket = TokenBucket()
+        bucket.pause(0.05)
+        started = time.monotonic()
+        bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - started, 0.04)
+
+    def test5_resubmit_idempotent_requests(self):
+        policy = ThrottlingPolicy(default_delay=0)
+        throttled = _create_response(429)
+        self.assertTrue(policy.process_response(_URL, throttled, 0, HttpMethod.Get))
+        self.assertTrue(policy.process_response(_URL, throttled, 0, HttpMethod.Delete))
+        self.assertFalse(policy.process_response(_URL, throttled, 3, HttpMethod.Get))
+        self.assertFalse(
+            policy.process_response(_URL, _create_response(500), 0, HttpMethod.Get)
+        )
+
+    def test6_resubmit_non_idempotent_requests_with_retry_after(self):
+        policy = ThrottlingPolicy(default_delay=0)
+        self.assertFalse(
+            policy.process_response(_URL, _create_response(429), 0, HttpMethod.Post)
+        )
+        retry_after = _create_response(503, {"Retry-After": "0"})
+        self.assertTrue(policy.process_response(_URL, retry_after, 0, HttpMethod.Post))
+        policy.retry_methods = frozenset([HttpMethod.Post])
+        self.assertTrue(
+            policy.process_response(_URL, _create_response(429), 0, HttpMethod.Post)
+        )
+
+    def test7_send_throttled_request(self):
+        policy = ThrottlingPolicy(default_delay=0)
+        transport = _ReplayTransport(
+            [_create_response(429), _create_response(429), _create_response(200)],
+            policy,
+        )
+        response = transport.send(RequestOptions(_URL))
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(3, len(transport.requests))
+        self.assertEqual(2, policy.metrics.retries)
+
+    def test8_disable_resubmitting(self):
+        transport = _ReplayTransport(
+            [_create_response(429, {"Retry-After": "0"})],
+            ThrottlingPolicy(max_retries=0),
+        )
+        self.assertEqual(429, transport.send(RequestOptions(_URL)).status_code)
+        self.assertEqual(1, len(transport.requests))
+
+    def test9_not_resubmit_by_default(self):
+        transport = _ReplayTransport(
+            [_create_response(429, {"Retry-After": "0"}), _create_response(200)], None
+        )
+        self.assertIsNone(transport.throttling)
+        self.assertEqual(429, transport.send(RequestOptions(_URL)).status_code)
+        self.assertEqual(1, len(transport.requests))
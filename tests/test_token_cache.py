@@ -0,0 +1,96 @@
+import shutil
+import tempfile
+import threading
+import time
+from unittest import TestCase
+
+from office365.runtime.auth.token_cache import TokenCache, resolve_expires_in
+from office365.runtime.auth.token_store import FileTokenStore
+
+
+class _Acquirer(object):
+    """Issues numbered tokens, optionally waiting to be released"""
+
+    def __init__(self, expires_in=3600, delay=0.0):
+        self.expires_in = expires_in
+        self.delay = delay
+        self.calls = 0
+        self.released = threading.Event()
+        self.released.set()
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        self.released.wait(5)
+        time.sleep(self.delay)
+        with self._lock:
+            self.calls += 1
+            return {"access_token": str(self.calls), "expires_in": self.expires_in}
+
+
+class TestTokenCache(TestCase):
+    """Offline tests of the expiry-aware token cache"""
+
+    def test1_resolve_expires_in(self):
+        self.assertEqual(60, resolve_expires_in({"expires_in": "60"}))
+        self.assertAlmostEqual(
+            60, resolve_expires_in({"expires_on": time.time() + 60}), delta=1
+        )
+        self.assertIsNone(resolve_expires_in({"expires_in": "never"}))
+        self.assertIsNone(resolve_expires_in(None))
+
+    def test2_reuse_valid_token(self):
+        acquire = _Acquirer()
+        cache = TokenCache(acquire)
+        self.assertEqual("1", cache.get()["access_token"])
+        self.assertEqual("1", cache.get()["access_token"])
+        self.assertEqual(1, acquire.calls)
+        self.assertAlmostEqual(time.time() + 3600, cache.expires_at, delta=1)
+
+    def test3_refresh_expired_token_once(self):
+        acquire = _Acquirer(delay=0.1)
+        cache = TokenCache(acquire)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get()))
+            for _ in range(8)
+        ]
+        [t.start() for t in threads]
+        [t.join() for t in threads]
+        self.assertEqual(1, acquire.calls)
+        self.assertEqual(["1"] * 8, [r["access_token"] for r in results])
+
+    def test4_refresh_ahead_of_expiry(self):
+        acquire = _Acquirer()
+        cache = TokenCache(acquire, refresh_margin=300)
+        cache.set({"access_token": "0"}, expires_in=200)
+        acquire.released.clear()
+        refreshing = threading.Thread(target=cache.get)
+        refreshing.start()
+        while not cache._lock.locked():
+            time.sleep(0.01)
+        # the token being refreshed by another thread is still valid, hence returned without waiting
+        self.assertEqual("0", cache.get()["access_token"])
+        acquire.released.set()
+        refreshing.join()
+        self.assertEqual("1", cache.get()["access_token"])
+        self.assertEqual(1, acquire.calls)
+
+    def test5_invalidate_token(self):
+        acquire = _Acquirer()
+        cache = TokenCache(acquire)
+        cache.get()
+        cache.invalidate()
+        self.assertIsNone(cache.value)
+        self.assertEqual("2", cache.get()["access_token"])
+
+    def test6_share_token_via_store(self):
+        cache_dir = tempfile.mkdtemp()
+        try:
+            store = FileTokenStore(cache_dir + "/tokens.json")
+            first_acquire, second_acquire = _Acquirer(), _Acquirer()
+            first = TokenCache(first_acquire, key="tenant|resource").with_store(store)
+            second = TokenCache(second_acquire, key="tenant|resource").with_store(store)
+            self.assertEqual(first.get(), second.get())
+            self.assertEqual((1, 0), (first_acquire.calls, second_acquire.calls))
+        finally:
+            shutil.rmtree(cache_dir)
@@ -0,0 +1,81 @@
+import os
+import shutil
+import stat
+import tempfile
+import time
+import unittest
+from unittest import TestCase
+
+from office365.runtime.auth.token_store import FileTokenStore, build_cache_key
+
+try:
+    import cryptography
+except ImportError:
+    cryptography = None
+
+
+class TestFileTokenStore(TestCase):
+    """Offline tests of the file based token store"""
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.cache_dir, "cache", "tokens.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def _entry(self, value, expires_in=3600):
+        return {"value": value, "expiresAt": time.time() + expires_in}
+
+    def test1_build_cache_key(self):
+        self.assertEqual(
+            "token|contoso||client", build_cache_key("token", "contoso", None, "client")
+        )
+
+    def test2_save_and_load_entry(self):
+        store = FileTokenStore(self.path)
+        entry = self._entry("token")
+        with store.lock():
+            store.save("key", entry)
+        other_store = FileTokenStore(self.path)
+        with other_store.lock():
+            self.assertEqual(entry, other_store.load("key"))
+        if os.name == "posix":
+            self.assertEqual(0o600, stat.S_IMODE(os.stat(self.path).st_mode))
+
+    def test3_remove_entry(self):
+        store = FileTokenStore(self.path)
+        with store.lock():
+            store.save("key", self._entry("token"))
+            store.remove("key")
+            store.remove("missing")
+            self.assertIsNone(store.load("key"))
+
+    def test4_discard_expired_entries_on_save(self):
+        store = FileTokenStore(self.path)
+        with store.lock():
+            store.save("expired", self._entry("old", expires_in=-1))
+            store.save("key", self._entry("token"))
+            self.assertIsNone(store.load("expired"))
+            self.assertIsNotNone(store.load("key"))
+
+    def test5_load_corrupted_file(self):
+        store = FileTokenStore(self.path)
+        with store.lock():
+            with open(self.path, "wb") as f:
+                f.write(b"\x00{not json")
+            self.assertIsNone(store.load("key"))
+            store.save("key", self._entry("token"))
+            self.assertEqual("token", store.load("key")["value"])
+
+    @unittest.skipIf(cryptography is None, "cryptography package is not installed")
+    def test6_encrypt_entries(self):
+        store = FileTokenStore(self.path, FileTokenStore.generate_key())
+        with store.lock():
+            store.save("key", self._entry("secret-token"))
+            self.assertEqual("secret-token", store.load("key")["value"])
+        with open(self.path, "rb") as f:
+            self.assertNotIn(b"secret-token", f.read())
+        other_store = FileTokenStore(self.path, FileTokenStore.generate_key())
+        with other_store.lock():
+            self.assertIsNone(other_store.load("key"))